@@ -0,0 +1,120 @@
+import sys
+import os
+import glob
+import json
+import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+
+# Agrega el directorio principal al path de Python
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from models.Table import Table
+from helpers.import_excel import IMPORTERS, import_data
+from helpers.dataset_cache import clear_cache
+
+def find_files(patterns):
+  """
+  Obtener los archivos a analizar a partir de directorios o patrones glob.
+
+  Parámetros:
+  patterns (list[str]): Directorios (se toman sus archivos con extensión soportada) o patrones glob.
+
+  Retorna:
+  list[str]: Rutas de los archivos, sin repetir y en orden alfabético.
+  """
+  files = set()
+  for pattern in patterns:
+    if os.path.isdir(pattern):
+      candidates = [os.path.join(pattern, name) for name in os.listdir(pattern)]
+    else:
+      candidates = glob.glob(pattern, recursive=True)
+    files.update(path for path in candidates if os.path.isfile(path) and os.path.splitext(path)[1].lower() in IMPORTERS)
+  return sorted(files)
+
+def analyze_file(file_path, class_name, use_cache=True):
+  """
+  Importar un archivo y calcular la entropía, las ganancias y el nodo raíz.
+  Se ejecuta en los procesos del pool, así que los errores se regresan en el
+  resultado en lugar de lanzarse.
+
+  Parámetros:
+  file_path (str): Ruta del archivo.
+  class_name (str): Nombre de la columna de clase.
+  use_cache (bool, opcional): Indica si se usa la caché de datos importados.
+
+  Retorna:
+  dict: Resultado con las llaves file, rows, entropy, gains y root, o file y error si falla.
+  """
+  try:
+    # import_data imprime sus errores; se mandan a stderr para no mezclarlos con el JSON Lines
+    with contextlib.redirect_stdout(sys.stderr):
+      columns = import_data(file_path, use_cache=use_cache)
+    if columns is None:
+      raise ValueError("Los datos del archivo no son correctos o no se pudo importar.")
+    table = Table(columns)
+    class_index = next((i for i, col in enumerate(columns) if col.name == class_name), None)
+    if class_index is None:
+      raise ValueError(f"No existe la columna de clase {class_name}.")
+    table.set_clase(class_index, total_amount_instances=table.total_instances())
+
+    calculations = table.calculate_all_gains()
+    names = [columns[i].name for i in calculations["indices"]]
+    gains = {name: float(gain) for name, gain in zip(names, calculations["gains"])}
+    return {
+      "file": file_path,
+      "rows": table.total_instances(),
+      "entropy": float(calculations["entropy"]),
+      "gains": gains,
+      "root": names[int(calculations["gains"].argmax())] if names else None,
+    }
+  except Exception as e:
+    return {"file": file_path, "error": str(e)}
+
+def main(argv=None):
+  """
+  Punto de entrada de la línea de comandos.
+
+  Parámetros:
+  argv (list[str], opcional): Argumentos; por defecto los de sys.argv.
+
+  Retorna:
+  int: Código de salida (0 si todos los archivos se analizaron, 1 si alguno falló).
+  """
+  parser = argparse.ArgumentParser(description="Calcular la entropía, las ganancias y el nodo raíz de muchos archivos sin interfaz gráfica.")
+  parser.add_argument("inputs", nargs="+", help="Directorios o patrones glob de archivos .xlsx, .csv, .parquet o .arrow")
+  parser.add_argument("-c", "--clase", required=True, help="Nombre de la columna de clase (binaria)")
+  parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1, help="Cantidad de procesos (por defecto, uno por núcleo)")
+  parser.add_argument("-o", "--output", default="-", help="Archivo JSON Lines de salida (por defecto, la salida estándar)")
+  parser.add_argument("--no-cache", action="store_true", help="No usar la caché de datos importados")
+  parser.add_argument("--clear-cache", action="store_true", help="Borrar la caché de datos importados antes de analizar")
+  args = parser.parse_args(argv)
+
+  if args.workers < 1:
+    parser.error("La cantidad de procesos debe ser al menos 1.")
+  if args.clear_cache:
+    print(f"{clear_cache()} archivos borrados de la caché.", file=sys.stderr)
+  files = find_files(args.inputs)
+  if not files:
+    parser.error("No se encontraron archivos para analizar.")
+
+  output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+  failures = 0
+  try:
+    with ProcessPoolExecutor(max_workers=min(args.workers, len(files))) as executor:
+      # map conserva el orden de los archivos y escribe cada resultado en cuanto está listo
+      results = executor.map(analyze_file, files, [args.clase] * len(files), [not args.no_cache] * len(files))
+      for result in results:
+        failures += "error" in result
+        output.write(json.dumps(result, ensure_ascii=False) + "\n")
+        output.flush()
+  finally:
+    if output is not sys.stdout:
+      output.close()
+
+  if failures:
+    print(f"{failures} de {len(files)} archivos no se pudieron analizar.", file=sys.stderr)
+  return 1 if failures else 0
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,126 @@
+import sys
+import os
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+# Agrega el directorio principal al path de Python
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+from benchmarks.benchmark_table import get_environment
+
+BASELINE_VERSION = 1  # Se debe incrementar si cambia el formato del archivo de resultados
+HEAVY_MODULES = ["numpy", "pandas", "openpyxl", "pyarrow"]  # Módulos que no deberían cargarse al iniciar
+PAINT_TIMEOUT = 30  # Segundos máximos de espera por el primer dibujado
+
+# Programa que se ejecuta en un proceso nuevo por medición: importa main, crea
+# la ventana principal y termina en cuanto Qt la dibuja por primera vez
+CHILD_PROGRAM = """
+import sys, time, json
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QObject, QEvent, QTimer
+app = QApplication(sys.argv[:1])
+window = main.MainApp()
+result = {}
+class PaintWatcher(QObject):
+  def eventFilter(self, watched, event):
+    if event.type() == QEvent.Paint and not result:
+      result.update(import_main=imported - start, paint_wall=time.time(),
+                    modules=[name for name in %r if name in sys.modules])
+      QTimer.singleShot(0, app.quit)
+    return False
+watcher = PaintWatcher()
+window.installEventFilter(watcher)
+window.show()
+QTimer.singleShot(%d * 1000, app.quit)
+app.exec_()
+print(json.dumps(result))
+"""
+
+def measure_startup():
+  """
+  Medir un inicio de la aplicación en un proceso nuevo.
+
+  Retorna:
+  dict: Tiempo de importación de main, tiempo hasta el primer dibujado desde que
+  se lanzó el proceso (en segundos) y módulos pesados cargados en ese momento.
+
+  Excepciones:
+  RuntimeError: Si la ventana no se dibujó o el proceso falló.
+  """
+  environment = dict(os.environ)
+  if not environment.get("DISPLAY") and not environment.get("WAYLAND_DISPLAY") and sys.platform.startswith("linux"):
+    environment.setdefault("QT_QPA_PLATFORM", "offscreen")
+  launched = time.time()
+  process = subprocess.run([sys.executable, "-c", CHILD_PROGRAM % (HEAVY_MODULES, PAINT_TIMEOUT)], cwd=ROOT,
+                           env=environment, capture_output=True, text=True)
+  lines = process.stdout.strip().splitlines()
+  result = json.loads(lines[-1]) if process.returncode == 0 and lines else {}
+  if not result:
+    raise RuntimeError(f"La ventana principal no se dibujó: {process.stderr.strip()}")
+  return {"import_main": result["import_main"], "first_paint": result["paint_wall"] - launched, "modules": result["modules"]}
+
+def main(argv=None):
+  """
+  Punto de entrada del benchmark de inicio.
+
+  Parámetros:
+  argv (list[str], opcional): Argumentos; por defecto los de sys.argv.
+
+  Retorna:
+  int: Código de salida (1 si hubo regresiones al comparar con una línea base).
+  """
+  parser = argparse.ArgumentParser(description="Medir el tiempo de importación y el tiempo hasta el primer dibujado de la ventana principal.")
+  parser.add_argument("--repeat", type=int, default=5, help="Cantidad de inicios a medir; se reporta la mediana")
+  parser.add_argument("--output", help="Archivo JSON donde guardar los resultados como línea base (por defecto no se guardan)")
+  parser.add_argument("--compare", help="Archivo JSON de una línea base para comparar")
+  parser.add_argument("--tolerance", type=float, default=1.25, help="Proporción máxima antes de marcar una regresión")
+  args = parser.parse_args(argv)
+
+  samples = [measure_startup() for _ in range(args.repeat)]
+  environment = get_environment()
+  results = {
+    "version": BASELINE_VERSION,
+    "environment": environment,
+    "config": {"repeat": args.repeat},
+    "results": {
+      "import_main": statistics.median(sample["import_main"] for sample in samples),
+      "first_paint": statistics.median(sample["first_paint"] for sample in samples),
+      "heavy_modules": sorted(set().union(*(sample["modules"] for sample in samples))),
+    },
+  }
+  print(f"Importación de main: {results['results']['import_main']:.4f}s")
+  print(f"Primer dibujado: {results['results']['first_paint']:.4f}s")
+  print(f"Módulos pesados al iniciar: {', '.join(results['results']['heavy_modules']) or 'ninguno'}")
+
+  if args.output:
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as file:
+      json.dump(results, file, indent=2, ensure_ascii=False)
+    print(f"Resultados guardados en {args.output}")
+
+  if not args.compare:
+    return 0
+  with open(args.compare, encoding="utf-8") as file:
+    baseline = json.load(file)
+  if baseline.get("version") != BASELINE_VERSION:
+    print("La línea base tiene otro formato y no se puede comparar.", file=sys.stderr)
+    return 1
+  regressions = 0
+  for metric in ("import_main", "first_paint"):
+    ratio = results["results"][metric] / baseline["results"][metric]
+    regressions += ratio > args.tolerance
+    print(f"{metric}: {baseline['results'][metric]:.4f}s -> {results['results'][metric]:.4f}s ({ratio:.2f}){'  REGRESIÓN' if ratio > args.tolerance else ''}")
+  added = set(results["results"]["heavy_modules"]) - set(baseline["results"]["heavy_modules"])
+  if added:
+    regressions += 1
+    print(f"Módulos pesados nuevos al iniciar: {', '.join(sorted(added))}  REGRESIÓN")
+  return 1 if regressions else 0
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,193 @@
+import sys
+import os
+import json
+import time
+import platform
+import argparse
+import tempfile
+import subprocess
+import numpy as np
+
+# Agrega el directorio principal al path de Python
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.Column import ColumnType
+from models.Table import Table
+from helpers.import_excel import import_data, infer_column_type
+from benchmarks.generate_dataset import generate_columns, column_values, write_csv
+
+BASELINE_VERSION = 1  # Se debe incrementar si cambia el formato del archivo de resultados
+DEFAULT_SIZES = [10 ** power for power in range(2, 8)]  # De 10² a 10⁷ filas
+MIN_SAMPLE_SECONDS = 0.05  # Duración mínima de cada muestra
+STAGES = ["import", "inference", "get_partitions", "calculate_entropy", "get_all_calculations"]
+
+def measure(function, repeat):
+  """
+  Medir el tiempo de una función. Las funciones rápidas se ejecutan varias
+  veces seguidas por muestra, hasta durar al menos MIN_SAMPLE_SECONDS, para que
+  el ruido del reloj no domine la medición.
+
+  Parámetros:
+  function (callable): Función sin parámetros a medir.
+  repeat (int): Cantidad de muestras.
+
+  Retorna:
+  float: Menor tiempo por ejecución en segundos.
+  """
+  number = 1
+  while True:
+    start = time.perf_counter()
+    for _ in range(number):
+      function()
+    elapsed = time.perf_counter() - start
+    if elapsed >= MIN_SAMPLE_SECONDS:
+      break
+    number *= 10
+  best = elapsed / number
+  for _ in range(repeat - 1):
+    start = time.perf_counter()
+    for _ in range(number):
+      function()
+    best = min(best, (time.perf_counter() - start) / number)
+  return best
+
+def benchmark_size(rows, args):
+  """
+  Medir todas las etapas para una cantidad de filas.
+
+  Parámetros:
+  rows (int): Cantidad de filas del conjunto sintético.
+  args (argparse.Namespace): Configuración del benchmark.
+
+  Retorna:
+  dict: Tiempo en segundos de cada etapa, o None si la etapa se omitió por tamaño.
+  """
+  cardinality = {ColumnType.NOMINAL: args.nominal_levels, ColumnType.NUMERIC: args.numeric_levels}
+  columns = generate_columns(rows, args.attributes, cardinality, args.class_balance, args.seed)
+  repeat = args.repeat if rows <= 10 ** 5 else 1
+  timings = dict.fromkeys(STAGES)
+
+  if rows <= args.max_import_rows:
+    with tempfile.TemporaryDirectory() as directory:
+      path = os.path.join(directory, "dataset.csv")
+      write_csv(columns, path)
+      timings["import"] = measure(lambda: import_data(path, use_cache=False), repeat)
+
+  if rows <= args.max_inference_rows:
+    values = [column_values(column).tolist() for column in columns]
+    timings["inference"] = measure(lambda: [infer_column_type(column) for column in values], repeat)
+
+  table = Table(columns)
+  table.set_clase(len(columns) - 1, total_amount_instances=rows)
+  attributes = list(range(len(columns) - 1))
+  timings["get_partitions"] = measure(lambda: [table.get_partitions(i) for i in attributes], repeat)
+
+  partitions = [partition for i in attributes for partition in table.get_partitions(i)]
+  timings["calculate_entropy"] = measure(lambda: [table.calculate_entropy(partition) for partition in partitions], repeat)
+
+  def cold_calculations():
+    table.live_state = None  # Sin conteos vigentes, para medir el recorrido completo
+    table.get_all_calculations()
+  timings["get_all_calculations"] = measure(cold_calculations, repeat)
+  return timings
+
+def get_environment():
+  """
+  Describir el entorno en el que se ejecutó el benchmark.
+
+  Retorna:
+  dict: Versiones de Python y NumPy, plataforma, procesadores y commit actual.
+  """
+  try:
+    commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+  except (OSError, subprocess.CalledProcessError):
+    commit = None
+  return {
+    "python": platform.python_version(),
+    "numpy": np.__version__,
+    "platform": platform.platform(),
+    "cpus": os.cpu_count(),
+    "commit": commit,
+    "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+  }
+
+def compare(results, baseline, tolerance):
+  """
+  Comparar los resultados con una línea base y mostrar la proporción de cada tiempo.
+
+  Parámetros:
+  results (dict): Resultados actuales.
+  baseline (dict): Resultados de la línea base.
+  tolerance (float): Proporción máxima permitida antes de marcar una regresión.
+
+  Retorna:
+  int: Cantidad de regresiones encontradas.
+  """
+  regressions = 0
+  print(f"{'Etapa':<22}{'Filas':>10}{'Base (s)':>12}{'Actual (s)':>12}{'Proporción':>12}")
+  for stage in STAGES:
+    for rows, current in results["results"][stage].items():
+      previous = baseline["results"].get(stage, {}).get(rows)
+      if current is None or previous is None:
+        continue
+      ratio = current / previous if previous > 0 else float("inf")
+      mark = "  REGRESIÓN" if ratio > tolerance else ""
+      regressions += ratio > tolerance
+      print(f"{stage:<22}{rows:>10}{previous:>12.6f}{current:>12.6f}{ratio:>12.2f}{mark}")
+  return regressions
+
+def main(argv=None):
+  """
+  Punto de entrada del benchmark.
+
+  Parámetros:
+  argv (list[str], opcional): Argumentos; por defecto los de sys.argv.
+
+  Retorna:
+  int: Código de salida (1 si hubo regresiones al comparar con una línea base).
+  """
+  parser = argparse.ArgumentParser(description="Medir el tiempo de la importación y del cálculo de ganancias según la cantidad de filas.")
+  parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Cantidades de filas a medir")
+  parser.add_argument("--attributes", type=int, default=6, help="Cantidad de atributos, sin contar la clase")
+  parser.add_argument("--nominal-levels", type=int, default=3, help="Valores distintos de los atributos nominales")
+  parser.add_argument("--numeric-levels", type=int, default=100, help="Mediciones distintas de los atributos numéricos")
+  parser.add_argument("--class-balance", type=float, default=0.5, help="Proporción de filas con clase 1")
+  parser.add_argument("--seed", type=int, default=0, help="Semilla del generador")
+  parser.add_argument("--repeat", type=int, default=5, help="Ejecuciones por medición (1 por encima de 10⁵ filas)")
+  parser.add_argument("--max-import-rows", type=int, default=10 ** 6, help="Filas máximas para medir la importación")
+  parser.add_argument("--max-inference-rows", type=int, default=10 ** 6, help="Filas máximas para medir la inferencia de tipos")
+  parser.add_argument("--output", help="Archivo JSON donde guardar los resultados como línea base (por defecto no se guardan)")
+  parser.add_argument("--compare", help="Archivo JSON de una línea base para comparar")
+  parser.add_argument("--tolerance", type=float, default=1.25, help="Proporción máxima antes de marcar una regresión")
+  args = parser.parse_args(argv)
+
+  environment = get_environment()
+  results = {
+    "version": BASELINE_VERSION,
+    "environment": environment,
+    "config": {key: value for key, value in vars(args).items() if key not in ("output", "compare", "tolerance")},
+    "results": {stage: {} for stage in STAGES},
+  }
+  for rows in sorted(args.sizes):
+    timings = benchmark_size(rows, args)
+    for stage, seconds in timings.items():
+      results["results"][stage][str(rows)] = seconds
+    print(f"{rows:>10} filas: " + ", ".join(f"{stage} {seconds:.6f}s" for stage, seconds in timings.items() if seconds is not None), flush=True)
+
+  if args.output:
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as file:
+      json.dump(results, file, indent=2, ensure_ascii=False)
+    print(f"Resultados guardados en {args.output}")
+
+  if args.compare:
+    with open(args.compare, encoding="utf-8") as file:
+      baseline = json.load(file)
+    if baseline.get("version") != BASELINE_VERSION:
+      print("La línea base tiene otro formato y no se puede comparar.", file=sys.stderr)
+      return 1
+    return 1 if compare(results, baseline, args.tolerance) else 0
+  return 0
+
+if __name__ == "__main__":
+  sys.exit(main())
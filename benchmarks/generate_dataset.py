@@ -0,0 +1,87 @@
+import sys
+import os
+import numpy as np
+
+# Agrega el directorio principal al path de Python
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.Column import Column, ColumnType, code_dtype, initial_thresholds
+
+TYPE_ORDER = [ColumnType.BINARY, ColumnType.NOMINAL, ColumnType.NUMERIC]  # Tipos de los atributos, en rotación
+DEFAULT_CARDINALITY = {ColumnType.NOMINAL: 3, ColumnType.NUMERIC: 100}  # Valores distintos por tipo
+
+def generate_columns(rows, attributes=3, cardinality=None, class_balance=0.5, seed=0):
+  """
+  Generar columnas sintéticas ya codificadas, sin pasar por listas de Python.
+  Los tipos de los atributos rotan entre binario, nominal y numérico; los
+  numéricos son mediciones sin agrupar y la clase va al final.
+
+  Parámetros:
+  rows (int): Cantidad de filas.
+  attributes (int, opcional): Cantidad de atributos, sin contar la clase.
+  cardinality (dict, opcional): Valores distintos de cada ColumnType nominal o numérico.
+  class_balance (float, opcional): Proporción de filas con clase 1.
+  seed (int, opcional): Semilla del generador.
+
+  Retorna:
+  list: Lista de objetos Column; la última es la clase.
+
+  Excepciones:
+  ValueError: Si algún parámetro no es válido.
+  """
+  if rows < 1 or attributes < 1:
+    raise ValueError("Se necesita al menos una fila y un atributo.")
+  if not 0 < class_balance < 1:
+    raise ValueError("La proporción de la clase debe estar entre 0 y 1.")
+  cardinality = {**DEFAULT_CARDINALITY, **(cardinality or {})}
+  rng = np.random.default_rng(seed)
+
+  columns = []
+  for i in range(attributes):
+    column_type = TYPE_ORDER[i % len(TYPE_ORDER)]
+    name = f"{column_type.name.lower()}_{i}"
+    if column_type == ColumnType.BINARY:
+      columns.append(Column.from_codes(name, rng.integers(0, 2, rows, dtype=np.uint8), [0, 1], column_type))
+    elif column_type == ColumnType.NOMINAL:
+      levels = cardinality[ColumnType.NOMINAL]
+      codes = rng.integers(0, levels, rows).astype(code_dtype(levels))
+      columns.append(Column.from_codes(name, codes, list(range(1, levels + 1)), column_type))
+    else:
+      values = rng.integers(0, cardinality[ColumnType.NUMERIC], rows) * 0.5 + 10.0
+      column = Column.from_codes(name, np.zeros(rows, dtype=np.uint8), [], column_type, values=values)
+      column.set_thresholds(*initial_thresholds(values))
+      columns.append(column)
+
+  class_codes = (rng.random(rows) < class_balance).astype(np.uint8)
+  columns.append(Column.from_codes("clase", class_codes, [0, 1], ColumnType.BINARY))
+  return columns
+
+def column_values(column):
+  """
+  Obtener los valores originales de una columna sintética como arreglo.
+
+  Parámetros:
+  column (Column): Columna generada con generate_columns.
+
+  Retorna:
+  np.ndarray: Mediciones de las columnas numéricas o valores de las demás.
+  """
+  if column.values is not None:
+    return np.asarray(column.values)
+  return np.asarray(column.categories)[column.codes]
+
+def write_csv(columns, path):
+  """
+  Escribir columnas sintéticas en un archivo CSV, para medir la importación.
+
+  Parámetros:
+  columns (list): Lista de objetos Column.
+  path (str): Ruta del archivo CSV.
+  """
+  import pandas as pd
+
+  pd.DataFrame({column.name: column_values(column) for column in columns}).to_csv(path, index=False)
+
+# Ejemplo de uso
+if __name__ == "__main__":
+  for column in generate_columns(10, attributes=3, seed=1):
+    print(column.name, column.type.name, column.instances)
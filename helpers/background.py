@@ -0,0 +1,109 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt5.QtWidgets import QProgressDialog
+from helpers.progress import ProgressReporter, TaskCancelled
+
+class TaskSignals(QObject):
+  """
+  Señales de una tarea en segundo plano. Se emiten desde el hilo de la tarea y
+  Qt las entrega en el hilo de la interfaz.
+  """
+  progress = pyqtSignal(int, int)  # Avance (hechos, total); total 0 si no se conoce
+  finished = pyqtSignal(object)  # Resultado de la tarea
+  failed = pyqtSignal(str)  # Mensaje de error
+  cancelled = pyqtSignal()
+
+class BackgroundTask(QRunnable):
+  """
+  Tarea que ejecuta una función fuera del hilo de la interfaz. La función
+  recibe un ProgressReporter como parámetro progress, que reporta el avance
+  por señales y la detiene cuando se cancela.
+  """
+
+  def __init__(self, function, *args, **kwargs):
+    """
+    Constructor de la clase BackgroundTask.
+
+    Parámetros:
+    function (callable): Función a ejecutar; debe aceptar el parámetro progress.
+    *args: Argumentos posicionales de la función.
+    **kwargs: Argumentos con nombre de la función.
+    """
+    super().__init__()
+    self.setAutoDelete(False)
+    self.function = function
+    self.args = args
+    self.kwargs = kwargs
+    self.signals = TaskSignals()
+    self.reporter = ProgressReporter(self.signals.progress.emit)
+
+  def run(self):
+    """
+    Ejecutar la función y emitir la señal correspondiente al resultado.
+    """
+    try:
+      result = self.function(*self.args, progress=self.reporter, **self.kwargs)
+    except TaskCancelled:
+      self.signals.cancelled.emit()
+    except Exception as e:
+      self.signals.failed.emit(str(e))
+    else:
+      self.signals.finished.emit(result)
+
+  def cancel(self):
+    """
+    Pedir que la tarea se detenga en su siguiente reporte de avance.
+    """
+    self.reporter.cancel()
+
+def run_in_background(parent, label, function, *args, on_finished=None, on_failed=None, **kwargs):
+  """
+  Ejecutar una función en el QThreadPool global mostrando un diálogo de
+  progreso con botón para cancelar.
+
+  Parámetros:
+  parent (QWidget): Widget padre del diálogo de progreso.
+  label (str): Texto del diálogo de progreso.
+  function (callable): Función a ejecutar; debe aceptar el parámetro progress.
+  *args: Argumentos posicionales de la función.
+  on_finished (callable, opcional): Función que recibe el resultado en el hilo de la interfaz.
+  on_failed (callable, opcional): Función que recibe el mensaje de error en el hilo de la interfaz.
+  **kwargs: Argumentos con nombre de la función.
+
+  Retorna:
+  BackgroundTask: Tarea iniciada.
+  """
+  task = BackgroundTask(function, *args, **kwargs)
+
+  dialog = QProgressDialog(label, "Cancelar", 0, 0, parent)
+  dialog.setWindowTitle("Procesando")
+  dialog.setWindowModality(Qt.WindowModal)
+  dialog.setMinimumDuration(300)
+  dialog.setAutoReset(False)
+  dialog.setAutoClose(False)
+
+  def update_progress(done, total):
+    # Con total 0 el diálogo muestra una barra de actividad sin porcentaje
+    dialog.setMaximum(total)
+    dialog.setValue(min(done, total) if total else 0)
+
+  def finish():
+    dialog.close()
+    dialog.deleteLater()
+    parent.background_tasks.discard(task)
+
+  task.signals.progress.connect(update_progress)
+  task.signals.finished.connect(finish)
+  task.signals.failed.connect(finish)
+  task.signals.cancelled.connect(finish)
+  if on_finished is not None:
+    task.signals.finished.connect(on_finished)
+  if on_failed is not None:
+    task.signals.failed.connect(on_failed)
+  dialog.canceled.connect(task.cancel)
+
+  # Se guarda una referencia para que la tarea no se libere mientras se ejecuta
+  if not hasattr(parent, "background_tasks"):
+    parent.background_tasks = set()
+  parent.background_tasks.add(task)
+  QThreadPool.globalInstance().start(task)
+  return task
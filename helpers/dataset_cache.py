@@ -0,0 +1,287 @@
+import os
+import json
+import zlib
+import struct
+import hashlib
+import tempfile
+import numpy as np
+from models.Column import Column, ColumnType
+
+IMPORTER_VERSION = 4  # Se debe incrementar cuando cambie el resultado de la importación o el formato
+MAGIC = b"MTSRDATA"  # Identificador del formato de caché
+ALIGNMENT = 64  # Alineación en bytes de cada arreglo de códigos
+PREFIX = struct.Struct("<QI")  # Longitud y CRC32 del encabezado
+DEFAULT_MAX_BYTES = 2 << 30  # Tamaño máximo de la caché si no se indica METSURO_CACHE_MAX_BYTES
+
+def get_cache_dir():
+  """
+  Obtener el directorio de la caché de datos importados.
+  Se puede cambiar con la variable de entorno METSURO_CACHE_DIR.
+
+  Retorna:
+  str: Ruta del directorio de la caché.
+  """
+  return os.environ.get("METSURO_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "metsuro")
+
+def get_max_bytes():
+  """
+  Obtener el tamaño máximo de la caché de datos importados.
+  Se puede cambiar con la variable de entorno METSURO_CACHE_MAX_BYTES; con 0 no
+  se guardan archivos nuevos.
+
+  Retorna:
+  int: Tamaño máximo en bytes.
+  """
+  try:
+    return max(0, int(os.environ.get("METSURO_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)))
+  except ValueError:
+    return DEFAULT_MAX_BYTES
+
+def list_cache_files(directory=None):
+  """
+  Listar los archivos de la caché, del usado hace más tiempo al más reciente.
+
+  Parámetros:
+  directory (str, opcional): Directorio de la caché. Por defecto, el de get_cache_dir.
+
+  Retorna:
+  list: Lista de tuplas (ruta, tamaño en bytes).
+  """
+  directory = directory or get_cache_dir()
+  try:
+    entries = [entry for entry in os.scandir(directory) if entry.is_file() and entry.name.endswith(".bin")]
+  except OSError:
+    return []
+  entries.sort(key=lambda entry: entry.stat().st_mtime)
+  return [(entry.path, entry.stat().st_size) for entry in entries]
+
+def prune_cache(max_bytes=None, directory=None):
+  """
+  Borrar los archivos usados hace más tiempo hasta que la caché no pase del tamaño máximo.
+
+  Parámetros:
+  max_bytes (int, opcional): Tamaño máximo en bytes. Por defecto, el de get_max_bytes.
+  directory (str, opcional): Directorio de la caché. Por defecto, el de get_cache_dir.
+
+  Retorna:
+  int: Cantidad de archivos borrados.
+  """
+  max_bytes = get_max_bytes() if max_bytes is None else max_bytes
+  files = list_cache_files(directory)
+  total = sum(size for _, size in files)
+  removed = 0
+  for path, size in files:
+    if total <= max_bytes:
+      break
+    try:
+      os.remove(path)
+    except OSError:
+      continue
+    total -= size
+    removed += 1
+  return removed
+
+def clear_cache(directory=None):
+  """
+  Borrar todos los archivos de la caché de datos importados.
+
+  Parámetros:
+  directory (str, opcional): Directorio de la caché. Por defecto, el de get_cache_dir.
+
+  Retorna:
+  int: Cantidad de archivos borrados.
+  """
+  return prune_cache(0, directory)
+
+def get_cache_key(file_path):
+  """
+  Calcular la llave de caché de un archivo a partir de su contenido.
+
+  Parámetros:
+  file_path (str): Ruta del archivo.
+
+  Retorna:
+  str: Hash SHA-256 del contenido junto con la versión del importador.
+  """
+  digest = hashlib.sha256()
+  with open(file_path, "rb") as file:
+    for block in iter(lambda: file.read(1 << 20), b""):
+      digest.update(block)
+  return f"{digest.hexdigest()}-v{IMPORTER_VERSION}"
+
+def align(offset):
+  """
+  Redondear una posición hacia arriba al múltiplo de ALIGNMENT.
+
+  Parámetros:
+  offset (int): Posición en bytes.
+
+  Retorna:
+  int: Posición alineada.
+  """
+  return -(-offset // ALIGNMENT) * ALIGNMENT
+
+def save_columns(path, columns):
+  """
+  Guardar columnas codificadas en un archivo binario de caché.
+  El archivo tiene el identificador MAGIC, la longitud y el CRC32 del
+  encabezado, un encabezado JSON con nombres, tipos, umbrales, categorías,
+  posiciones, CRC32 de cada arreglo y tamaño de los datos, y después los
+  arreglos de códigos (y las mediciones de las columnas numéricas sin agrupar)
+  alineados para poder mapearlos en memoria. Las posiciones son relativas al
+  inicio de los datos, justo después del encabezado alineado.
+
+  Parámetros:
+  path (str): Ruta del archivo de caché.
+  columns (list): Lista de objetos Column.
+  """
+  rows = len(columns[0].codes) if columns else 0
+  entries = []
+  offset = 0
+  for column in columns:
+    values = None if column.values is None else np.ascontiguousarray(column.values, dtype=np.float64)
+    entries.append({
+      "name": column.name,
+      "type": column.type.name,
+      "x1": column.x1,
+      "x2": column.x2,
+      "categories": column.categories,
+      "dtype": column.codes.dtype.str,
+      "offset": offset,
+      "crc32": zlib.crc32(np.ascontiguousarray(column.codes)),
+      "values_offset": None,
+      "values_crc32": None,
+    })
+    offset = offset + column.codes.nbytes
+    if values is not None:
+      entries[-1]["values_offset"] = offset = align(offset)
+      entries[-1]["values_crc32"] = zlib.crc32(values)
+      offset = offset + values.nbytes
+    if column is not columns[-1]:
+      offset = align(offset)
+  header = json.dumps({"version": IMPORTER_VERSION, "rows": rows, "data_size": offset, "columns": entries}).encode("utf-8")
+  data_start = align(len(MAGIC) + PREFIX.size + len(header))
+
+  directory = os.path.dirname(path) or "."
+  os.makedirs(directory, exist_ok=True)
+  handle, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+  try:
+    with os.fdopen(handle, "wb") as file:
+      file.write(MAGIC)
+      file.write(PREFIX.pack(len(header), zlib.crc32(header)))
+      file.write(header)
+      for entry, column in zip(entries, columns):
+        file.write(b"\0" * (data_start + entry["offset"] - file.tell()))
+        file.write(np.ascontiguousarray(column.codes).tobytes())
+        if column.values is not None:
+          file.write(b"\0" * (data_start + entry["values_offset"] - file.tell()))
+          file.write(np.ascontiguousarray(column.values, dtype=np.float64).tobytes())
+    os.replace(temp_path, path)
+  except BaseException:
+    os.remove(temp_path)
+    raise
+
+def map_array(path, dtype, offset, rows):
+  """
+  Mapear en memoria un arreglo del archivo de caché, en modo copia al escribir.
+
+  Parámetros:
+  path (str): Ruta del archivo de caché.
+  dtype (np.dtype): Tipo de los elementos.
+  offset (int): Posición del arreglo en bytes.
+  rows (int): Cantidad de elementos.
+
+  Retorna:
+  np.ndarray: Arreglo mapeado (o vacío si no hay filas).
+  """
+  if rows == 0:
+    return np.empty(0, dtype=dtype)
+  return np.memmap(path, dtype=dtype, mode="c", offset=offset, shape=(rows,))
+
+def load_columns(path, verify=True):
+  """
+  Cargar columnas desde un archivo binario de caché.
+  Los códigos se mapean en memoria en modo copia al escribir, así que se
+  pueden editar sin modificar el archivo.
+
+  Parámetros:
+  path (str): Ruta del archivo de caché.
+  verify (bool, opcional): Indica si se revisa el CRC32 de cada arreglo. El del
+    encabezado y el tamaño del archivo siempre se revisan.
+
+  Retorna:
+  list: Lista de objetos Column.
+
+  Excepciones:
+  ValueError: Si el archivo no tiene el formato o la versión esperados, está incompleto o está dañado.
+  """
+  with open(path, "rb") as file:
+    if file.read(len(MAGIC)) != MAGIC:
+      raise ValueError("El archivo de caché no tiene un formato válido")
+    prefix = file.read(PREFIX.size)
+    if len(prefix) != PREFIX.size:
+      raise ValueError("El archivo de caché está incompleto")
+    header_length, header_crc = PREFIX.unpack(prefix)
+    header_bytes = file.read(header_length)
+  if len(header_bytes) != header_length or zlib.crc32(header_bytes) != header_crc:
+    raise ValueError("El encabezado del archivo de caché está dañado")
+  header = json.loads(header_bytes.decode("utf-8"))
+  if header["version"] != IMPORTER_VERSION:
+    raise ValueError("La versión del archivo de caché no es compatible")
+  data_start = align(len(MAGIC) + PREFIX.size + header_length)
+  if os.path.getsize(path) != data_start + header["data_size"]:
+    raise ValueError("El archivo de caché está incompleto")
+
+  columns = []
+  for entry in header["columns"]:
+    dtype = np.dtype(entry["dtype"])
+    codes = map_array(path, dtype, data_start + entry["offset"], header["rows"])
+    if verify and zlib.crc32(codes) != entry["crc32"]:
+      raise ValueError(f"Los códigos de la columna {entry['name']} en la caché están dañados")
+    values = None
+    if entry["values_offset"] is not None:
+      values = map_array(path, np.dtype(np.float64), data_start + entry["values_offset"], header["rows"])
+      if verify and zlib.crc32(values) != entry["values_crc32"]:
+        raise ValueError(f"Las mediciones de la columna {entry['name']} en la caché están dañadas")
+    columns.append(Column.from_codes(entry["name"], codes, entry["categories"], ColumnType[entry["type"]], entry["x1"], entry["x2"], values))
+  return columns
+
+def cached_import(file_path, importer):
+  """
+  Importar un archivo usando la caché si ya se importó antes con el mismo contenido.
+  Los archivos de caché dañados se borran y se vuelve a importar; después de
+  guardar un archivo nuevo se borran los usados hace más tiempo si la caché pasa
+  de get_max_bytes. Los errores al leer o escribir la caché no impiden la importación.
+
+  Parámetros:
+  file_path (str): Ruta del archivo a importar.
+  importer (callable): Función que importa el archivo y retorna la lista de columnas.
+
+  Retorna:
+  list: Lista de objetos Column, o lo que retorne importer si falla.
+  """
+  try:
+    cache_path = os.path.join(get_cache_dir(), get_cache_key(file_path) + ".bin")
+  except OSError:
+    return importer(file_path)
+
+  if os.path.exists(cache_path):
+    try:
+      columns = load_columns(cache_path)
+      os.utime(cache_path)  # Marca el archivo como usado recientemente
+      return columns
+    except (OSError, ValueError, KeyError):
+      # Caché dañada o de otra versión: se borra y se vuelve a importar
+      try:
+        os.remove(cache_path)
+      except OSError:
+        pass
+
+  columns = importer(file_path)
+  if columns and get_max_bytes() > 0:
+    try:
+      save_columns(cache_path, columns)
+      prune_cache()
+    except OSError:
+      pass
+  return columns
@@ -1,11 +1,18 @@
-import pandas as pd
-import re
-from PyQt5.QtWidgets import QFileDialog, QMessageBox
-from models.Column import Column, ColumnType
+import os
+import importlib.util
+from functools import partial
+from models.Column import ColumnType, ColumnEncoder, TypeInference, parse_numeric_value
+from models.Table import Table
+from helpers.dataset_cache import cached_import
+from helpers.progress import TaskCancelled
+from helpers.instrumentation import span, count
+
+CHUNK_ROWS = 10000  # Filas leídas por bloque durante la importación
 
 def infer_column_type(values):
   """
   Inferir el tipo de columna a partir de los valores.
+  Cada valor distinto se revisa una sola vez.
 
   Parámetros:
   values (list): Lista de valores de la columna.
@@ -16,14 +23,9 @@ def infer_column_type(values):
   Excepciones:
   ValueError: Si no se puede inferir el tipo de columna.
   """
-  if all(isinstance(val, int) and val in {0, 1} for val in values):
-    return ColumnType.BINARY
-  elif all(isinstance(val, int) for val in values):
-    return ColumnType.NOMINAL
-  elif all(isinstance(val, str) and re.match(r'(?:<\s*\d+|\d+(\.\d+)?\s*-\s*\d+(\.\d+)?|>\s*\d+(\.\d+)?)', val) for val in values):
-    return ColumnType.NUMERIC
-  else:
-    raise ValueError("No se pudo inferir el tipo de dato de la columna.")
+  inference = TypeInference()
+  inference.update(list(dict.fromkeys(values)))
+  return inference.column_type()
 
 def extract_numeric_values(values):
   """
@@ -38,75 +40,351 @@ def extract_numeric_values(values):
   Excepciones:
   ValueError: Si hay valores fuera de lo común.
   """
-  x1_set = set()
-  x2_set = set()
-
-  for val in values:
-    val = val.strip()  # Trim the value
-    if '<' in val:
-      x1_set.add(float(val.split()[1].strip()))
-    elif '>' in val:
-      x2_set.add(float(val.split()[1].strip()))
-    elif '-' in val:
-      x1, x2 = map(float, [v.strip() for v in val.split('-')])
-      if x1 >= x2:
-        raise ValueError("Valores de x1 y x2 no son válidos: x1 debe ser menor que x2")
-      x1_set.add(x1)
-      x2_set.add(x2)
-    else:
-      raise ValueError(f"Formato numérico inválido: {val}")
+  distinct = list(dict.fromkeys(values))
+  for val in distinct:
+    parse_numeric_value(val)
+  inference = TypeInference()
+  inference.update(distinct)
+  return inference.thresholds(strict=True)
+
+class StreamingColumn:
+  """
+  Columna que se importa por bloques: codifica los valores a medida que llegan
+  y acumula la inferencia del tipo y los umbrales x1 y x2 usando solo los
+  valores que aparecen por primera vez.
+  """
+
+  def __init__(self, name):
+    """
+    Constructor de la clase StreamingColumn.
+
+    Parámetros:
+    name (str): Nombre de la columna.
+    """
+    self.encoder = ColumnEncoder(name)
+    self.inference = TypeInference()
+
+  def add(self, values):
+    """
+    Agregar un bloque de valores a la columna.
+
+    Parámetros:
+    values (list): Valores del bloque.
+
+    Excepciones:
+    ValueError: Si los valores no permiten inferir el tipo o no son numéricos válidos.
+    """
+    self.update(self.encoder.add(values))
+
+  def add_array(self, values):
+    """
+    Agregar un bloque de valores que ya viene como arreglo de NumPy.
+
+    Parámetros:
+    values (np.ndarray): Valores del bloque.
+
+    Excepciones:
+    ValueError: Si los valores no permiten inferir el tipo o no son numéricos válidos.
+    """
+    self.update(self.encoder.add_array(values))
+
+  def add_codes(self, codes, values):
+    """
+    Agregar un bloque que ya viene codificado con su propia tabla de valores.
+
+    Parámetros:
+    codes (np.ndarray): Código local de cada valor del bloque.
+    values (list): Valores distintos del bloque.
+
+    Excepciones:
+    ValueError: Si los valores no permiten inferir el tipo o no son numéricos válidos.
+    """
+    self.update(self.encoder.add_codes(codes, values))
+
+  def update(self, new_values):
+    """
+    Actualizar la inferencia del tipo y los umbrales con los valores nuevos.
+
+    Parámetros:
+    new_values (list): Valores que aparecen por primera vez.
+
+    Excepciones:
+    ValueError: Si los valores no permiten inferir el tipo o no son numéricos válidos.
+    """
+    if new_values:
+      with span("inference"):
+        self.inference.update(new_values)
+        self.inference.column_type()  # Falla en cuanto ningún tipo es compatible
+      count("values_inferred", len(new_values))
+
+  def finish(self):
+    """
+    Terminar la importación de la columna.
+
+    Retorna:
+    Column: Columna con los valores importados.
+
+    Excepciones:
+    ValueError: Si la columna está vacía o hay valores fuera de lo común.
+    """
+    if self.encoder.total_instances() == 0:
+      raise ValueError(f"La columna '{self.encoder.name}' está vacía")
+    col_type = self.inference.column_type()
+    if col_type != ColumnType.NUMERIC:
+      return self.encoder.finish(col_type)
+    if self.inference.numbers:
+      # Mediciones sin agrupar: los umbrales se ajustan al establecer la clase
+      column = self.encoder.finish(col_type)
+      column.parse_numeric_instances()
+      return column
+    x1, x2 = self.inference.thresholds(strict=True)
+    column = self.encoder.finish(col_type, x1, x2)
+    column.relabel_numeric_instances()
+    return column
+
+def iter_chunks(rows, size, skip_blank=True):
+  """
+  Agrupar filas en bloques de tamaño fijo, omitiendo las filas vacías.
+
+  Parámetros:
+  rows (iterable): Filas a agrupar.
+  size (int): Cantidad máxima de filas por bloque.
+  skip_blank (bool, opcional): Indica si se omiten las filas vacías.
+
+  Retorna:
+  generator: Generador de listas de filas.
+  """
+  chunk = []
+  for row in rows:
+    if not skip_blank or any(value is not None for value in row):
+      chunk.append(row)
+      if len(chunk) == size:
+        yield chunk
+        chunk = []
+  if chunk:
+    yield chunk
+
+def create_streams(names):
+  """
+  Crear las columnas de importación a partir de los nombres del encabezado.
+
+  Parámetros:
+  names (list): Nombres de las columnas.
+
+  Retorna:
+  list: Lista de objetos StreamingColumn.
+
+  Excepciones:
+  ValueError: Si algún nombre de columna no es una cadena.
+  """
+  streams = []
+  for col_name in names:
+    # Verifica que el nombre de la columna sea una cadena
+    if not isinstance(col_name, str):
+      raise ValueError(f"El nombre de la columna '{col_name}' no es una cadena.")
+    streams.append(StreamingColumn(col_name))
+  return streams
+
+def finish_streams(streams):
+  """
+  Terminar la importación de todas las columnas.
 
-  if len(x1_set) != 1 or len(x2_set) != 1:
-    raise ValueError("Valores fuera de lo común en la columna numérica")
-  
-  x1 = x1_set.pop()
-  x2 = x2_set.pop()
+  Parámetros:
+  streams (list): Lista de objetos StreamingColumn.
+
+  Retorna:
+  list: Lista de objetos Column.
 
-  return x1, x2
+  Excepciones:
+  ValueError: Si el archivo no tiene filas de datos.
+  """
+  if not streams or streams[0].encoder.total_instances() == 0:
+    raise ValueError("El archivo está vacío")
+  count("rows_imported", streams[0].encoder.total_instances())
+  with span("finish_columns"):
+    return [stream.finish() for stream in streams]
 
-def import_data(file_path):
+def import_xlsx(file_path, progress=None):
   """
-  Importar datos desde un archivo Excel y crear objetos Column.
+  Importar columnas desde un archivo Excel.
+  Las filas se leen por bloques y se codifican a medida que llegan, sin
+  cargar la hoja completa en memoria.
 
   Parámetros:
   file_path (str): Ruta del archivo Excel.
+  progress (callable, opcional): Función que recibe el avance (filas leídas, filas totales).
+
+  Retorna:
+  list: Lista de objetos Column.
+  """
+  from openpyxl import load_workbook
+
+  # Leer el archivo Excel en modo de solo lectura
+  workbook = load_workbook(file_path, read_only=True, data_only=True)
+  try:
+    sheet = workbook.active
+    total = max((sheet.max_row or 1) - 1, 0)
+    rows = sheet.iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None:
+      raise ValueError("El archivo está vacío")
+    streams = create_streams(header)
+
+    width = len(streams)
+    done = 0
+    for chunk in iter_chunks(rows, CHUNK_ROWS):
+      chunk = [row[:width] + (None,) * (width - len(row)) for row in chunk]
+      for stream, col_values in zip(streams, zip(*chunk)):
+        stream.add(col_values)
+      done += len(chunk)
+      if progress is not None:
+        progress(done, max(total, done))
+  finally:
+    workbook.close()
+
+  return finish_streams(streams)
+
+def import_csv(file_path, progress=None):
+  """
+  Importar columnas desde un archivo CSV.
+  Cada bloque se lee como arreglos de NumPy y se codifica sin pasar por listas de Python.
+
+  Parámetros:
+  file_path (str): Ruta del archivo CSV.
+  progress (callable, opcional): Función que recibe el avance (filas leídas, 0), ya que
+    no se conoce el total de filas antes de leer el archivo.
 
   Retorna:
   list: Lista de objetos Column.
+  """
+  import pandas as pd
+
+  streams = None
+  with pd.read_csv(file_path, chunksize=CHUNK_ROWS) as reader:
+    for chunk in reader:
+      if streams is None:
+        streams = create_streams(list(chunk.columns))
+      for stream, col_name in zip(streams, chunk.columns):
+        values = chunk[col_name].to_numpy()
+        if values.dtype == object and any(not isinstance(val, str) for val in chunk[col_name].unique()):
+          raise ValueError("No se pudo inferir el tipo de dato de la columna.")
+        stream.add_array(values)
+      if progress is not None:
+        progress(streams[0].encoder.total_instances(), 0)
+
+  return finish_streams(streams or [])
+
+def import_arrow_batches(batches, total=0, progress=None):
+  """
+  Importar columnas desde lotes de registros de Arrow.
+  Cada columna se codifica como diccionario dentro de Arrow y solo la tabla de
+  valores distintos pasa por Python.
+
+  Parámetros:
+  batches (iterable): Lotes de registros (pyarrow.RecordBatch).
+  total (int, opcional): Cantidad total de filas, o 0 si no se conoce.
+  progress (callable, opcional): Función que recibe el avance (filas leídas, filas totales).
+
+  Retorna:
+  list: Lista de objetos Column.
+  """
+  import pyarrow as pa
+
+  streams = None
+  for batch in batches:
+    if streams is None:
+      streams = create_streams(batch.schema.names)
+    for stream, array in zip(streams, batch.columns):
+      if array.null_count:
+        raise ValueError("No se pudo inferir el tipo de dato de la columna.")
+      if not pa.types.is_dictionary(array.type):
+        array = array.dictionary_encode()
+      stream.add_codes(array.indices.to_numpy(), array.dictionary.to_pylist())
+    if progress is not None:
+      progress(streams[0].encoder.total_instances(), total)
+
+  return finish_streams(streams or [])
+
+def import_parquet(file_path, progress=None):
+  """
+  Importar columnas desde un archivo Parquet, por lotes de filas.
+
+  Parámetros:
+  file_path (str): Ruta del archivo Parquet.
+  progress (callable, opcional): Función que recibe el avance (filas leídas, filas totales).
+
+  Retorna:
+  list: Lista de objetos Column.
+  """
+  import pyarrow.parquet as pq
+
+  with pq.ParquetFile(file_path) as parquet_file:
+    return import_arrow_batches(parquet_file.iter_batches(batch_size=CHUNK_ROWS), parquet_file.metadata.num_rows, progress)
+
+def import_arrow(file_path, progress=None):
+  """
+  Importar columnas desde un archivo Arrow IPC (formato de archivo o de flujo).
+
+  Parámetros:
+  file_path (str): Ruta del archivo Arrow.
+  progress (callable, opcional): Función que recibe el avance (filas leídas, filas totales).
+
+  Retorna:
+  list: Lista de objetos Column.
+  """
+  import pyarrow as pa
+
+  with pa.memory_map(file_path) as source:
+    try:
+      reader = pa.ipc.open_file(source)
+      batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+      total = reader.count_rows()
+    except pa.ArrowInvalid:
+      source.seek(0)
+      batches = pa.ipc.open_stream(source)
+      total = 0
+    return import_arrow_batches(batches, total, progress)
+
+IMPORTERS = {
+  '.xlsx': import_xlsx,
+  '.csv': import_csv,
+  '.parquet': import_parquet,
+  '.arrow': import_arrow,
+  '.feather': import_arrow,
+  '.ipc': import_arrow,
+}
+
+def import_data(file_path, use_cache=True, progress=None):
+  """
+  Importar datos desde un archivo Excel, CSV, Parquet o Arrow y crear objetos Column.
+  Si el mismo contenido ya se importó antes, las columnas se cargan desde la caché.
+
+  Parámetros:
+  file_path (str): Ruta del archivo.
+  use_cache (bool, opcional): Indica si se usa la caché de datos importados.
+  progress (callable, opcional): Función que recibe el avance (filas leídas, filas totales).
+
+  Retorna:
+  list: Lista de objetos Column, o None si ocurre un error.
 
   Excepciones:
-  ValueError: Si el archivo no es válido o hay problemas con los datos.
+  TaskCancelled: Si progress cancela la importación.
   """
   try:
     # Verificar la extensión del archivo
-    if not file_path.lower().endswith('.xlsx'):
-      raise ValueError("El archivo debe ser de tipo .xlsx")
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in IMPORTERS:
+      raise ValueError("El archivo debe ser de tipo .xlsx, .csv, .parquet o .arrow")
+    if extension in ('.parquet', '.arrow', '.feather', '.ipc') and importlib.util.find_spec('pyarrow') is None:
+      raise ValueError("Se necesita el paquete pyarrow para importar archivos Parquet o Arrow")
 
-    # Leer el archivo Excel
-    data = pd.read_excel(file_path)
-    
-    if data.empty:
-      raise ValueError("El archivo está vacío")
-    
-    columns = []
-    for col_name in data.columns:
-      col_values = data[col_name].tolist()
-      if not col_values:
-        raise ValueError(f"La columna '{col_name}' está vacía")
-      col_type = infer_column_type(col_values)
-      if col_type == ColumnType.NUMERIC:
-        x1, x2 = extract_numeric_values(col_values)
-      else:
-        x1 = None
-        x2 = None
-      
-      # Verifica que el nombre de la columna sea una cadena
-      if not isinstance(col_name, str):
-        raise ValueError(f"El nombre de la columna '{col_name}' no es una cadena.")
-      
-      columns.append(Column(name=col_name, instances=col_values, type=col_type, x1=x1, x2=x2))
-    
-    return columns
+    importer = IMPORTERS[extension] if progress is None else partial(IMPORTERS[extension], progress=progress)
+    with span("import"):
+      if use_cache:
+        return cached_import(file_path, importer)
+      return importer(file_path)
+  except TaskCancelled:
+    raise
   except ValueError as e:
     print(f"Error al importar datos: {str(e)}")  # Depuración opcional
     return None
@@ -114,6 +392,68 @@ def import_data(file_path):
     print(f"Error inesperado al importar datos: {str(e)}")  # Depuración opcional
     return None
 
+def import_columns(file_path, progress=None):
+  """
+  Importar datos desde un archivo, lanzando una excepción en lugar de retornar None.
+  Es la función que ejecutan las tareas en segundo plano.
+
+  Parámetros:
+  file_path (str): Ruta del archivo.
+  progress (callable, opcional): Función que recibe el avance (filas leídas, filas totales).
+
+  Retorna:
+  list: Lista de objetos Column.
+
+  Excepciones:
+  ValueError: Si los datos del archivo no son correctos o no se pudo importar.
+  TaskCancelled: Si progress cancela la importación.
+  """
+  columns = import_data(file_path, progress=progress)
+  if columns is None:
+    raise ValueError("Los datos del archivo no son correctos o no se pudo importar.")
+  return columns
+
+def import_table(file_path, progress=None):
+  """
+  Importar un archivo y dejar la tabla lista para mostrarse: se establece como
+  clase la primera columna binaria (la que elige la vista por defecto), lo que
+  ajusta los umbrales de las columnas numéricas sin agrupar, y se calculan los
+  conteos vigentes. Es la función que ejecutan las tareas en segundo plano, para
+  que la interfaz no tenga que hacer ese trabajo al recibir la tabla.
+
+  Parámetros:
+  file_path (str): Ruta del archivo.
+  progress (callable, opcional): Función que recibe el avance de la importación y del conteo.
+
+  Retorna:
+  Table: Tabla importada, con la clase establecida si hay alguna columna binaria.
+
+  Excepciones:
+  ValueError: Si los datos del archivo no son correctos o no se pudo importar.
+  TaskCancelled: Si progress cancela la importación.
+  """
+  table = Table(import_columns(file_path, progress=progress))
+  class_index = next((i for i, column in enumerate(table.columns) if column.type == ColumnType.BINARY), None)
+  if class_index is not None and table.total_instances() > 0:
+    table.set_clase(class_index, total_amount_instances=table.total_instances())
+    table.update_live_counts(progress=progress)
+  return table
+
+def choose_import_file(parent):
+  """
+  Abrir el cuadro de diálogo para elegir el archivo a importar.
+
+  Parámetros:
+  parent (QWidget): Widget padre para el cuadro de diálogo.
+
+  Retorna:
+  str: Ruta del archivo elegido, o una cadena vacía si se canceló.
+  """
+  from PyQt5.QtWidgets import QFileDialog  # Solo se necesita con interfaz gráfica
+
+  file_path, _ = QFileDialog.getOpenFileName(parent, "Importar Datos", "", "Archivos de datos (*.xlsx *.csv *.parquet *.arrow *.feather);;Archivos Excel (*.xlsx);;Todos los archivos (*)", "Archivos de datos (*.xlsx *.csv *.parquet *.arrow *.feather)")
+  return file_path
+
 def open_import_data(parent):
   """
   Abrir el cuadro de diálogo para importar datos y procesar el archivo seleccionado.
@@ -124,7 +464,9 @@ def open_import_data(parent):
   Retorna:
   list: Lista de objetos Column o None si ocurre un error.
   """
-  file_path, _ = QFileDialog.getOpenFileName(parent, "Importar Datos", "", "Archivos Excel (*.xlsx);;Todos los archivos (*)", "Archivos Excel (*.xlsx)")
+  from PyQt5.QtWidgets import QMessageBox  # Solo se necesita con interfaz gráfica
+
+  file_path = choose_import_file(parent)
   if file_path:
     columns = import_data(file_path)
     if columns is None:
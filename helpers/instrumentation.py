@@ -0,0 +1,184 @@
+# Instrumentación opcional de las etapas costosas: importación, inferencia de
+# tipos, conteo de particiones, entropía y creación de la tabla de resultados.
+#
+# Está desactivada por defecto; así, cada span y cada contador solo revisan una
+# variable global. Se activa con enable() o con la variable de entorno
+# METSURO_TRACE: si su valor es una ruta, al salir del programa se guarda ahí la
+# traza JSON (formato de eventos de Chrome, se abre en chrome://tracing o
+# Perfetto) y se imprime el resumen en stderr.
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+from collections import defaultdict
+
+ENABLED = False  # Indica si se registran spans y contadores
+LOCK = threading.Lock()  # Protege los registros cuando hay tareas en segundo plano
+EVENTS = []  # Spans terminados: (nombre, inicio en segundos, duración en segundos, hilo)
+COUNTERS = defaultdict(int)  # Total acumulado de cada contador
+ORIGIN = time.perf_counter()  # Referencia de tiempo de la traza
+
+class NullSpan:
+  """
+  Span que no hace nada; se usa cuando la instrumentación está desactivada.
+  """
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    return False
+
+NULL_SPAN = NullSpan()
+
+class Span:
+  """
+  Span que mide el tiempo de un bloque de código y lo registra al terminar.
+  """
+
+  def __init__(self, name):
+    """
+    Constructor de la clase Span.
+
+    Parámetros:
+    name (str): Nombre de la etapa.
+    """
+    self.name = name
+    self.start = 0.0
+
+  def __enter__(self):
+    self.start = time.perf_counter()
+    return self
+
+  def __exit__(self, *exc_info):
+    duration = time.perf_counter() - self.start
+    with LOCK:
+      EVENTS.append((self.name, self.start - ORIGIN, duration, threading.get_ident()))
+    return False
+
+def span(name):
+  """
+  Medir un bloque de código con un span:
+
+    with span("import"):
+      ...
+
+  Parámetros:
+  name (str): Nombre de la etapa.
+
+  Retorna:
+  Span | NullSpan: Administrador de contexto del span.
+  """
+  return Span(name) if ENABLED else NULL_SPAN
+
+def count(name, amount=1):
+  """
+  Sumar una cantidad a un contador.
+
+  Parámetros:
+  name (str): Nombre del contador.
+  amount (int, opcional): Cantidad a sumar.
+  """
+  if ENABLED:
+    with LOCK:
+      COUNTERS[name] += int(amount)
+
+def enable():
+  """
+  Activar la instrumentación.
+  """
+  global ENABLED
+  ENABLED = True
+
+def disable():
+  """
+  Desactivar la instrumentación; lo registrado se conserva.
+  """
+  global ENABLED
+  ENABLED = False
+
+def reset():
+  """
+  Borrar los spans y contadores registrados.
+  """
+  with LOCK:
+    EVENTS.clear()
+    COUNTERS.clear()
+
+def summary():
+  """
+  Resumir los spans por nombre.
+
+  Retorna:
+  dict: Diccionario con "spans" (llamadas, tiempo total, promedio y máximo en
+  segundos de cada nombre, de mayor a menor tiempo total) y "counters".
+  """
+  with LOCK:
+    events = list(EVENTS)
+    counters = dict(COUNTERS)
+  spans = defaultdict(list)
+  for name, _, duration, _ in events:
+    spans[name].append(duration)
+  rows = {
+    name: {"calls": len(durations), "total": sum(durations), "mean": sum(durations) / len(durations), "max": max(durations)}
+    for name, durations in spans.items()
+  }
+  return {"spans": dict(sorted(rows.items(), key=lambda item: item[1]["total"], reverse=True)), "counters": counters}
+
+def format_summary():
+  """
+  Mostrar el resumen como tabla de texto.
+
+  Retorna:
+  str: Tabla con los spans y los contadores.
+  """
+  data = summary()
+  lines = [f"{'Span':<28}{'Llamadas':>10}{'Total (s)':>12}{'Prom. (s)':>12}{'Máx. (s)':>12}"]
+  for name, row in data["spans"].items():
+    lines.append(f"{name:<28}{row['calls']:>10}{row['total']:>12.6f}{row['mean']:>12.6f}{row['max']:>12.6f}")
+  if data["counters"]:
+    lines.append("")
+    lines.append(f"{'Contador':<28}{'Total':>10}")
+    for name, value in sorted(data["counters"].items()):
+      lines.append(f"{name:<28}{value:>10}")
+  return "\n".join(lines)
+
+def export_trace(path):
+  """
+  Guardar los spans y contadores como traza JSON en el formato de eventos de Chrome.
+
+  Parámetros:
+  path (str): Ruta del archivo JSON.
+  """
+  with LOCK:
+    events = list(EVENTS)
+    counters = dict(COUNTERS)
+  pid = os.getpid()
+  trace = [
+    {"name": name, "ph": "X", "ts": start * 1e6, "dur": duration * 1e6, "pid": pid, "tid": tid}
+    for name, start, duration, tid in events
+  ]
+  end = max((start + duration for _, start, duration, _ in events), default=0.0)
+  trace.extend({"name": name, "ph": "C", "ts": end * 1e6, "pid": pid, "args": {name: value}} for name, value in counters.items())
+  with open(path, "w", encoding="utf-8") as file:
+    json.dump({"traceEvents": trace, "displayTimeUnit": "ms", "summary": summary()}, file, ensure_ascii=False)
+
+def export_at_exit(path):
+  """
+  Guardar la traza e imprimir el resumen al salir del programa.
+
+  Parámetros:
+  path (str): Ruta del archivo JSON.
+  """
+  try:
+    export_trace(path)
+  except OSError as e:
+    print(f"No se pudo guardar la traza: {str(e)}", file=sys.stderr)
+  print(format_summary(), file=sys.stderr)
+
+if os.environ.get("METSURO_TRACE"):
+  enable()
+  if os.environ["METSURO_TRACE"] not in ("1", "true"):
+    atexit.register(export_at_exit, os.environ["METSURO_TRACE"])
@@ -0,0 +1,168 @@
+import os
+import sys
+import json
+import zlib
+import struct
+import tempfile
+import numpy as np
+
+# Agrega el directorio principal al path de Python
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.DecisionTree import CompiledTree
+
+MODEL_VERSION = 1  # Se debe incrementar cuando cambie el formato del archivo
+MAGIC = b"MTSRTREE"  # Identificador del formato de modelo
+ALIGNMENT = 64  # Alineación en bytes de cada arreglo
+PREFIX = struct.Struct("<QI")  # Longitud y CRC32 del encabezado
+ARRAYS = ["feature", "child_start", "n_children", "children", "prediction", "class_counts", "x1", "x2"]  # Arreglos guardados del árbol
+
+def align(offset):
+  """
+  Redondear una posición hacia arriba al múltiplo de ALIGNMENT.
+
+  Parámetros:
+  offset (int): Posición en bytes.
+
+  Retorna:
+  int: Posición alineada.
+  """
+  return -(-offset // ALIGNMENT) * ALIGNMENT
+
+def to_json_value(value):
+  """
+  Convertir escalares de NumPy en valores de Python para el encabezado JSON.
+
+  Parámetros:
+  value: Valor a convertir.
+
+  Retorna:
+  Valor de Python.
+
+  Excepciones:
+  TypeError: Si el valor no se puede guardar en JSON.
+  """
+  if isinstance(value, np.generic):
+    return value.item()
+  raise TypeError(f"No se puede guardar el valor {value!r} en el modelo")
+
+def save_model(path, model):
+  """
+  Guardar un árbol compilado en un archivo binario.
+  El archivo tiene el identificador MAGIC, la longitud y el CRC32 del
+  encabezado, un encabezado JSON con la versión, las entradas, sus categorías,
+  la clase y la posición, forma, tipo y CRC32 de cada arreglo, y después los
+  arreglos alineados para poder mapearlos en memoria.
+
+  Parámetros:
+  path (str): Ruta del archivo del modelo.
+  model (CompiledTree): Árbol compilado.
+  """
+  arrays = {name: np.ascontiguousarray(getattr(model, name)) for name in ARRAYS}
+  entries = {}
+  offset = 0
+  for name, array in arrays.items():
+    entries[name] = {
+      "dtype": array.dtype.str,
+      "shape": list(array.shape),
+      "offset": offset,
+      "crc32": zlib.crc32(array),
+    }
+    offset = align(offset + array.nbytes)
+  header = json.dumps({
+    "version": MODEL_VERSION,
+    "inputs": model.inputs,
+    "categories": model.categories,
+    "class_name": model.class_name,
+    "class_values": model.class_values,
+    "arrays": entries,
+  }, default=to_json_value, ensure_ascii=False).encode("utf-8")
+  data_start = align(len(MAGIC) + PREFIX.size + len(header))
+
+  directory = os.path.dirname(path) or "."
+  os.makedirs(directory, exist_ok=True)
+  handle, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+  try:
+    with os.fdopen(handle, "wb") as file:
+      file.write(MAGIC)
+      file.write(PREFIX.pack(len(header), zlib.crc32(header)))
+      file.write(header)
+      for name, array in arrays.items():
+        file.write(b"\0" * (data_start + entries[name]["offset"] - file.tell()))
+        file.write(array.tobytes())
+    os.replace(temp_path, path)
+  except BaseException:
+    os.remove(temp_path)
+    raise
+
+def load_model(path, verify=True):
+  """
+  Cargar un árbol compilado desde un archivo binario. Los arreglos se mapean en
+  memoria de solo lectura, sin copiarlos ni interpretarlos.
+
+  Parámetros:
+  path (str): Ruta del archivo del modelo.
+  verify (bool, opcional): Indica si se revisa el CRC32 de cada arreglo. El del
+    encabezado siempre se revisa.
+
+  Retorna:
+  CompiledTree: Árbol compilado.
+
+  Excepciones:
+  ValueError: Si el archivo no tiene el formato o la versión esperados, o está dañado.
+  """
+  with open(path, "rb") as file:
+    if file.read(len(MAGIC)) != MAGIC:
+      raise ValueError("El archivo no es un modelo válido")
+    prefix = file.read(PREFIX.size)
+    if len(prefix) != PREFIX.size:
+      raise ValueError("El archivo del modelo está incompleto")
+    header_length, header_crc = PREFIX.unpack(prefix)
+    header_bytes = file.read(header_length)
+  if len(header_bytes) != header_length or zlib.crc32(header_bytes) != header_crc:
+    raise ValueError("El encabezado del modelo está dañado")
+  header = json.loads(header_bytes.decode("utf-8"))
+  if header["version"] != MODEL_VERSION:
+    raise ValueError("La versión del modelo no es compatible")
+  data_start = align(len(MAGIC) + PREFIX.size + header_length)
+
+  file_size = os.path.getsize(path)
+  arrays = {}
+  for name in ARRAYS:
+    entry = header["arrays"][name]
+    dtype = np.dtype(entry["dtype"])
+    shape = tuple(entry["shape"])
+    start = data_start + entry["offset"]
+    size = int(np.prod(shape)) * dtype.itemsize
+    if start + size > file_size:
+      raise ValueError("El archivo del modelo está incompleto")
+    array = np.memmap(path, dtype=dtype, mode="r", offset=start, shape=shape) if size else np.empty(shape, dtype=dtype)
+    if verify and zlib.crc32(array) != entry["crc32"]:
+      raise ValueError(f"El arreglo {name} del modelo está dañado")
+    arrays[name] = array
+
+  return CompiledTree(header["inputs"], header["categories"], class_name=header["class_name"],
+                      class_values=header["class_values"], **arrays)
+
+# Ejemplo de uso: guardar, cargar y comparar un árbol; termina con error si algo no coincide
+if __name__ == "__main__":
+  from models.Column import Column, ColumnType
+  from models.Table import Table
+  from models.DecisionTree import DecisionTree
+
+  tenis_columns = [
+    Column("Temperatura", ["> 32", "> 32", "> 32", "25 - 32", "< 25", "< 25", "< 25", "25 - 32", "< 25", "25 - 32", "25 - 32", "25 - 32", "> 32", "25 - 32"], ColumnType.NUMERIC),
+    Column("Humedad", [3, 3, 3, 3, 2, 2, 2, 3, 2, 2, 2, 3, 2, 3], ColumnType.NOMINAL),
+    Column("Viento", [1, 3, 1, 1, 1, 3, 3, 1, 1, 1, 3, 3, 1, 3], ColumnType.NOMINAL),
+    Column("Jugar", [0, 0, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 0], ColumnType.BINARY)
+  ]
+  tenis_table = Table(tenis_columns)
+  tenis_table.set_clase(3, total_amount_instances=14)
+  tree = DecisionTree(tenis_table)
+  tree.fit()
+  compiled = tree.compile()
+
+  path = os.path.join(tempfile.gettempdir(), "tenis.mtsr")
+  save_model(path, compiled)
+  loaded = load_model(path)
+  print(f"Modelo guardado en {path} ({os.path.getsize(path)} bytes)")
+  print(f"Predicciones del modelo cargado: {loaded.predict({column.name: column.instances for column in tenis_columns[:3]}).tolist()}")
@@ -0,0 +1,47 @@
+import threading
+
+class TaskCancelled(Exception):
+  """
+  Excepción que indica que se pidió cancelar una tarea en curso.
+  """
+
+class ProgressReporter:
+  """
+  Función de avance que se pasa como parámetro progress a la importación y a
+  los cálculos de la tabla. Cada llamada revisa si se pidió cancelar la tarea y
+  reenvía el avance a otra función, por ejemplo a una señal de Qt. No depende
+  de Qt, así que también se puede usar sin interfaz gráfica.
+  """
+
+  def __init__(self, callback=None):
+    """
+    Constructor de la clase ProgressReporter.
+
+    Parámetros:
+    callback (callable, opcional): Función que recibe el avance (hechos, total).
+    Un total de 0 indica que no se conoce el total.
+    """
+    self.callback = callback
+    self.cancelled = threading.Event()
+
+  def __call__(self, done, total):
+    """
+    Reportar el avance de la tarea.
+
+    Parámetros:
+    done (int): Unidades terminadas.
+    total (int): Unidades totales, o 0 si no se conocen.
+
+    Excepciones:
+    TaskCancelled: Si se pidió cancelar la tarea.
+    """
+    if self.cancelled.is_set():
+      raise TaskCancelled("La tarea fue cancelada.")
+    if self.callback is not None:
+      self.callback(int(done), int(total))
+
+  def cancel(self):
+    """
+    Pedir que la tarea se detenga en su siguiente reporte de avance.
+    """
+    self.cancelled.set()
@@ -0,0 +1,313 @@
+import os
+import csv
+import sys
+import numpy as np
+
+# Agrega el directorio principal al path de Python
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from helpers.import_excel import CHUNK_ROWS, iter_chunks
+
+READERS_HELP = ".xlsx, .csv, .parquet o .arrow"  # Formatos de entrada admitidos
+
+def read_xlsx_chunks(file_path, chunk_rows):
+  """
+  Leer un archivo Excel por bloques de filas. Las filas vacías se conservan
+  para que la salida quede alineada con el archivo de entrada.
+
+  Parámetros:
+  file_path (str): Ruta del archivo Excel.
+  chunk_rows (int): Cantidad máxima de filas por bloque.
+
+  Retorna:
+  generator: Generador de tuplas (nombres de las columnas, diccionario con la lista de valores de cada columna).
+  """
+  from openpyxl import load_workbook
+
+  workbook = load_workbook(file_path, read_only=True, data_only=True)
+  try:
+    rows = workbook.active.iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None:
+      return
+    names = [str(name) for name in header]
+    width = len(names)
+    for chunk in iter_chunks(rows, chunk_rows, skip_blank=False):
+      chunk = [row[:width] + (None,) * (width - len(row)) for row in chunk]
+      yield names, {name: list(values) for name, values in zip(names, zip(*chunk))}
+  finally:
+    workbook.close()
+
+def read_csv_chunks(file_path, chunk_rows):
+  """
+  Leer un archivo CSV por bloques de filas, como arreglos de NumPy. Las líneas
+  vacías se conservan para que la salida quede alineada con el archivo de entrada.
+
+  Parámetros:
+  file_path (str): Ruta del archivo CSV.
+  chunk_rows (int): Cantidad máxima de filas por bloque.
+
+  Retorna:
+  generator: Generador de tuplas (nombres de las columnas, diccionario con el arreglo de valores de cada columna).
+  """
+  import pandas as pd
+
+  with pd.read_csv(file_path, chunksize=chunk_rows, skip_blank_lines=False) as reader:
+    for chunk in reader:
+      names = [str(name) for name in chunk.columns]
+      yield names, {name: chunk[column].to_numpy() for name, column in zip(names, chunk.columns)}
+
+def read_arrow_chunks(batches):
+  """
+  Convertir lotes de registros de Arrow en bloques de arreglos de NumPy.
+
+  Parámetros:
+  batches (iterable): Lotes de registros (pyarrow.RecordBatch).
+
+  Retorna:
+  generator: Generador de tuplas (nombres de las columnas, diccionario con el arreglo de valores de cada columna).
+  """
+  for batch in batches:
+    names = list(batch.schema.names)
+    yield names, {name: array.to_numpy(zero_copy_only=False) for name, array in zip(names, batch.columns)}
+
+def read_parquet_chunks(file_path, chunk_rows):
+  """
+  Leer un archivo Parquet por bloques de filas.
+
+  Parámetros:
+  file_path (str): Ruta del archivo Parquet.
+  chunk_rows (int): Cantidad máxima de filas por bloque.
+
+  Retorna:
+  generator: Generador de tuplas (nombres de las columnas, diccionario con el arreglo de valores de cada columna).
+  """
+  import pyarrow.parquet as pq
+
+  with pq.ParquetFile(file_path) as parquet_file:
+    yield from read_arrow_chunks(parquet_file.iter_batches(batch_size=chunk_rows))
+
+def read_arrow_file_chunks(file_path, chunk_rows):
+  """
+  Leer un archivo Arrow IPC (formato de archivo o de flujo) por lotes.
+  Se respetan los lotes del archivo, así que chunk_rows no se usa.
+
+  Parámetros:
+  file_path (str): Ruta del archivo Arrow.
+  chunk_rows (int): No se usa; se recibe para tener la misma firma que los demás lectores.
+
+  Retorna:
+  generator: Generador de tuplas (nombres de las columnas, diccionario con el arreglo de valores de cada columna).
+  """
+  import pyarrow as pa
+
+  with pa.memory_map(file_path) as source:
+    try:
+      reader = pa.ipc.open_file(source)
+      batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    except pa.ArrowInvalid:
+      source.seek(0)
+      batches = pa.ipc.open_stream(source)
+    yield from read_arrow_chunks(batches)
+
+READERS = {
+  '.xlsx': read_xlsx_chunks,
+  '.csv': read_csv_chunks,
+  '.parquet': read_parquet_chunks,
+  '.arrow': read_arrow_file_chunks,
+  '.feather': read_arrow_file_chunks,
+  '.ipc': read_arrow_file_chunks,
+}
+
+class CsvWriter:
+  """
+  Escritor de filas en un archivo CSV.
+  """
+
+  def __init__(self, file_path):
+    """
+    Constructor de la clase CsvWriter.
+
+    Parámetros:
+    file_path (str): Ruta del archivo de salida.
+    """
+    self.file = open(file_path, "w", newline="", encoding="utf-8")
+    self.writer = csv.writer(self.file)
+
+  def write_rows(self, rows):
+    """
+    Escribir filas.
+
+    Parámetros:
+    rows (iterable): Filas a escribir.
+    """
+    self.writer.writerows(rows)
+
+  def close(self):
+    """
+    Cerrar el archivo.
+    """
+    self.file.close()
+
+class XlsxWriter:
+  """
+  Escritor de filas en un archivo Excel en modo de solo escritura, que no
+  guarda la hoja completa en memoria.
+  """
+
+  def __init__(self, file_path):
+    """
+    Constructor de la clase XlsxWriter.
+
+    Parámetros:
+    file_path (str): Ruta del archivo de salida.
+    """
+    from openpyxl import Workbook
+
+    self.file_path = file_path
+    self.workbook = Workbook(write_only=True)
+    self.sheet = self.workbook.create_sheet()
+
+  def write_rows(self, rows):
+    """
+    Escribir filas.
+
+    Parámetros:
+    rows (iterable): Filas a escribir.
+    """
+    for row in rows:
+      self.sheet.append(row)
+
+  def close(self):
+    """
+    Guardar y cerrar el archivo.
+    """
+    self.workbook.save(self.file_path)
+    self.workbook.close()
+
+WRITERS = {
+  '.csv': CsvWriter,
+  '.xlsx': XlsxWriter,
+}
+
+def to_cell(value):
+  """
+  Convertir un valor de NumPy en un valor de Python que se pueda escribir.
+
+  Parámetros:
+  value: Valor a convertir.
+
+  Retorna:
+  Valor de Python (None para los valores vacíos).
+  """
+  value = value.item() if hasattr(value, "item") else value
+  return None if isinstance(value, float) and value != value else value
+
+def empty_cells(values):
+  """
+  Marcar las celdas vacías (None o NaN) de una columna.
+
+  Parámetros:
+  values (list | np.ndarray): Valores de la columna.
+
+  Retorna:
+  np.ndarray: Arreglo booleano con True en las celdas vacías.
+  """
+  if isinstance(values, np.ndarray) and values.dtype.kind == 'f':
+    return np.isnan(values)
+  if isinstance(values, np.ndarray) and values.dtype.kind in 'iub':
+    return np.zeros(len(values), dtype=bool)
+  return np.fromiter((to_cell(value) is None for value in values), dtype=bool, count=len(values))
+
+def select_rows(data, names, rows):
+  """
+  Tomar solo algunas filas de un bloque.
+
+  Parámetros:
+  data (dict): Valores de cada columna por nombre.
+  names (list): Nombres de las columnas.
+  rows (np.ndarray): Índices de las filas a tomar.
+
+  Retorna:
+  dict: Valores de las filas seleccionadas de cada columna.
+  """
+  return {
+    name: data[name][rows] if isinstance(data[name], np.ndarray) else [data[name][i] for i in rows.tolist()]
+    for name in names
+  }
+
+def score_file(model, input_path, output_path, chunk_rows=CHUNK_ROWS, include_inputs=True, prediction_name=None, progress=None):
+  """
+  Predecir la clase de cada fila de un archivo y escribir el resultado en otro
+  archivo, por bloques. Solo hay un bloque en memoria a la vez, así que el uso
+  de memoria no depende del tamaño del archivo. Cada fila de entrada produce una
+  fila de salida; las filas vacías se escriben con la predicción vacía.
+
+  Parámetros:
+  model (CompiledTree): Árbol compilado.
+  input_path (str): Archivo de entrada (.xlsx, .csv, .parquet o .arrow); debe tener las columnas de entrada del árbol.
+  output_path (str): Archivo de salida (.csv o .xlsx).
+  chunk_rows (int, opcional): Cantidad máxima de filas por bloque.
+  include_inputs (bool, opcional): Indica si se copian las columnas de entrada a la salida.
+    Si es False, solo se escribe la columna de predicción.
+  prediction_name (str, opcional): Nombre de la columna de predicción; por defecto, "<clase>_prediccion".
+  progress (callable, opcional): Función que recibe el avance (filas escritas, 0).
+
+  Retorna:
+  int: Cantidad de filas escritas.
+
+  Excepciones:
+  ValueError: Si algún formato no es compatible.
+  KeyError: Si falta alguna columna de entrada del árbol.
+  """
+  input_extension = os.path.splitext(input_path)[1].lower()
+  output_extension = os.path.splitext(output_path)[1].lower()
+  if input_extension not in READERS:
+    raise ValueError(f"El archivo de entrada debe ser de tipo {READERS_HELP}")
+  if output_extension not in WRITERS:
+    raise ValueError("El archivo de salida debe ser de tipo .csv o .xlsx")
+  prediction_name = prediction_name or f"{model.class_name}_prediccion"
+
+  writer = WRITERS[output_extension](output_path)
+  rows_written = 0
+  try:
+    header_written = False
+    for names, data in READERS[input_extension](input_path, chunk_rows):
+      if not header_written:
+        writer.write_rows([(names if include_inputs else []) + [prediction_name]])
+        header_written = True
+      blank = np.logical_and.reduce([empty_cells(data[name]) for name in names])
+      if blank.any():
+        # Las filas vacías no se predicen, pero se escriben para no desalinear la salida
+        keep = np.flatnonzero(~blank)
+        predicted = iter(model.predict(select_rows(data, names, keep)).tolist() if len(keep) else [])
+        predictions = [None if is_blank else next(predicted) for is_blank in blank.tolist()]
+      else:
+        predictions = model.predict(data).tolist()
+      if include_inputs:
+        columns = [[to_cell(value) for value in data[name]] for name in names]
+        writer.write_rows(list(row) + [prediction] for row, prediction in zip(zip(*columns), predictions))
+      else:
+        writer.write_rows([prediction] for prediction in predictions)
+      rows_written += len(predictions)
+      if progress is not None:
+        progress(rows_written, 0)
+  finally:
+    writer.close()
+  return rows_written
+
+# Ejemplo de uso
+if __name__ == "__main__":
+  import tempfile
+  from helpers.import_excel import import_data
+  from models.Table import Table
+  from models.DecisionTree import DecisionTree
+
+  tenis_path = os.path.join(os.path.dirname(__file__), '..', 'src', 'Tenis.xlsx')
+  table = Table(import_data(tenis_path, use_cache=False))
+  class_index = next(i for i, col in enumerate(table.columns) if col.name == "Jugar")
+  table.set_clase(class_index, total_amount_instances=table.total_instances())
+  tree = DecisionTree(table)
+  tree.fit()
+
+  output_path = os.path.join(tempfile.gettempdir(), 'tenis_prediccion.csv')
+  print(f"{score_file(tree.compile(), tenis_path, output_path)} filas escritas en {output_path}")
@@ -0,0 +1,115 @@
+import numpy as np
+from multiprocessing import shared_memory
+
+def share_arrays(arrays):
+  """
+  Copiar arreglos de NumPy a bloques de memoria compartida.
+
+  Parámetros:
+  arrays (list[np.ndarray]): Arreglos a compartir.
+
+  Retorna:
+  tuple: Tupla con la lista de bloques SharedMemory (que el llamador debe liberar
+  con release_arrays) y la lista de especificaciones (nombre, dtype, forma) que
+  los procesos usan para conectarse con attach_arrays.
+  """
+  blocks = []
+  specs = []
+  try:
+    for array in arrays:
+      array = np.ascontiguousarray(array)
+      # SharedMemory no admite tamaño 0
+      block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+      blocks.append(block)
+      np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+      specs.append((block.name, array.dtype.str, array.shape))
+  except Exception:
+    release_arrays(blocks)
+    raise
+  return blocks, specs
+
+def attach_arrays(specs):
+  """
+  Conectarse a bloques de memoria compartida creados con share_arrays.
+
+  Parámetros:
+  specs (list[tuple]): Especificaciones (nombre, dtype, forma) de los arreglos.
+
+  Retorna:
+  tuple: Tupla con la lista de bloques SharedMemory (que se deben cerrar con
+  close_arrays cuando ya no se usen los arreglos) y la lista de arreglos, que
+  apuntan directamente a la memoria compartida sin copiarla.
+  """
+  blocks = []
+  arrays = []
+  for name, dtype, shape in specs:
+    block = shared_memory.SharedMemory(name=name)
+    blocks.append(block)
+    arrays.append(np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf))
+  return blocks, arrays
+
+def close_arrays(blocks):
+  """
+  Cerrar la conexión de este proceso con bloques de memoria compartida.
+
+  Parámetros:
+  blocks (list[SharedMemory]): Bloques a cerrar.
+  """
+  for block in blocks:
+    block.close()
+
+def release_arrays(blocks):
+  """
+  Cerrar y eliminar bloques de memoria compartida creados con share_arrays.
+
+  Parámetros:
+  blocks (list[SharedMemory]): Bloques a liberar.
+  """
+  for block in blocks:
+    block.close()
+    block.unlink()
+
+def share_table(table, arrays=()):
+  """
+  Copiar los códigos de todas las columnas de una tabla (las mediciones de las
+  columnas numéricas sin agrupar y arreglos adicionales) a memoria compartida,
+  junto con lo necesario para reconstruir la tabla en otro proceso sin volver a
+  codificarla.
+
+  Parámetros:
+  table (Table): Tabla con la clase establecida.
+  arrays (list[np.ndarray], opcional): Arreglos adicionales a compartir.
+
+  Retorna:
+  tuple: Tupla con la lista de bloques SharedMemory (que el llamador debe liberar
+  con release_arrays) y la especificación que se pasa a attach_table.
+  """
+  metadata = [(column.name, column.categories, column.type.name, column.x1, column.x2, column.values is not None) for column in table.columns]
+  values = [column.values for column in table.columns if column.values is not None]
+  blocks, specs = share_arrays([column.codes for column in table.columns] + values + list(arrays))
+  return blocks, (specs, metadata, table.clase)
+
+def attach_table(spec):
+  """
+  Reconstruir en este proceso una tabla compartida con share_table. Los códigos y
+  las mediciones apuntan a la memoria compartida, así que no se deben modificar;
+  Column.set_thresholds sí se puede usar, porque asigna códigos nuevos.
+
+  Parámetros:
+  spec (tuple): Especificación retornada por share_table.
+
+  Retorna:
+  tuple: Tupla con la lista de bloques SharedMemory (que se deben cerrar con
+  close_arrays), la tabla y la lista de arreglos adicionales.
+  """
+  from models.Column import Column, ColumnType
+  from models.Table import Table
+
+  specs, metadata, clase = spec
+  blocks, arrays = attach_arrays(specs)
+  values = iter(arrays[len(metadata):])
+  columns = [Column.from_codes(name, codes, categories, ColumnType[type_name], x1, x2, next(values) if has_values else None)
+             for codes, (name, categories, type_name, x1, x2, has_values) in zip(arrays, metadata)]
+  table = Table(columns)
+  table.clase = clase
+  return blocks, table, arrays[len(metadata) + sum(entry[-1] for entry in metadata):]
@@ -1,16 +1,14 @@
 import sys
 import os
-from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton, QFrame
+from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton, QFrame, QMessageBox
 from PyQt5.QtGui import QPixmap, QPainter, QPainterPath, QImage, QIcon
 from PyQt5.QtCore import Qt
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), 'helpers')))
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), 'views')))
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), 'models')))
 
-from views.add_window import AddWindow  # Import the new window class
-from views.table_view import TableView
-from helpers.import_excel import open_import_data
-from models.Table import Table
+# Las vistas, los modelos y la importación se cargan la primera vez que se usan,
+# para que la ventana principal aparezca sin esperar a NumPy, openpyxl o pandas
 
 class MainApp(QMainWindow):
   """
@@ -146,6 +144,8 @@ class MainApp(QMainWindow):
     """
     Abre la ventana para agregar datos.
     """
+    from views.add_window import AddWindow
+
     self.add_window = AddWindow()
     self.add_window.show()
 
@@ -153,10 +153,32 @@ class MainApp(QMainWindow):
     """
     Abre el cuadro de diálogo para importar datos y procesa el archivo seleccionado.
     """
-    columns = open_import_data(self)
-    if columns:
-      self.table_view = TableView(Table(columns))
-      self.table_view.show()
+    from helpers.import_excel import choose_import_file, import_table
+    from helpers.background import run_in_background
+
+    file_path = choose_import_file(self)
+    if file_path:
+      # La lectura, el ajuste de la clase y los conteos se hacen en segundo plano para no congelar la ventana
+      run_in_background(self, "Importando datos...", import_table, file_path, on_finished=self.show_table_view, on_failed=self.show_import_error)
+
+  def show_table_view(self, tabla):
+    """
+    Muestra la vista de la tabla importada.
+
+    :param tabla: Tabla preparada por import_table.
+    """
+    from views.table_view import TableView
+
+    self.table_view = TableView(tabla)
+    self.table_view.show()
+
+  def show_import_error(self, message):
+    """
+    Muestra el error ocurrido al importar los datos.
+
+    :param message: Mensaje de error.
+    """
+    QMessageBox.critical(self, "Error", f"Error al importar datos: {message}")
 
   def close_app(self):
     """
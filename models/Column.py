@@ -1,23 +1,293 @@
 import enum
 import re
+import math
+import bisect
+import itertools
+import numpy as np
 from typing import Union, List
 
+VERSIONS = itertools.count()  # Fuente de versiones únicas para detectar cambios en las columnas
+
+"""
+Función para elegir el tipo entero sin signo más pequeño capaz de guardar los códigos.
+
+Parámetros:
+size (int): Cantidad de categorías distintas de la columna.
+
+Retorna:
+type: Tipo de NumPy (uint8, uint16 o uint32) para el arreglo de códigos.
+"""
+def code_dtype(size: int) -> type:
+  if size <= 1 << 8:
+    return np.uint8
+  if size <= 1 << 16:
+    return np.uint16
+  return np.uint32
+
+"""
+Función para ordenar valores de tipos mezclados: los números van antes que el
+texto, y cada grupo en su orden natural.
+
+Parámetros:
+value (Union[int, float, str]): Valor a ordenar.
+
+Retorna:
+tuple: Llave de orden del valor.
+"""
+def sort_key(value: Union[int, float, str]) -> tuple:
+  return (isinstance(value, str), value)
+
+"""
+Función para ordenar valores distintos y obtener la posición final de cada uno.
+
+Parámetros:
+distinct (List[Union[int, str]]): Valores distintos, en cualquier orden.
+
+Retorna:
+tuple: Tupla con la lista de valores ordenados y un arreglo con la posición
+ordenada de cada valor de distinct.
+"""
+def sorted_remap(distinct: List[Union[int, str]]) -> tuple:
+  order = sorted(range(len(distinct)), key=lambda i: sort_key(distinct[i]))
+  remap = np.empty(len(distinct), dtype=code_dtype(len(distinct)))
+  remap[order] = np.arange(len(distinct))
+  return [distinct[i] for i in order], remap
+
+"""
+Función para codificar valores en una sola pasada con un diccionario, en lugar
+de ordenar todas las filas. Solo se ordenan los valores distintos.
+
+Parámetros:
+values (List[Union[int, str]]): Valores a codificar.
+
+Retorna:
+tuple: Tupla con la lista de valores distintos ordenados y el arreglo de códigos
+(índice de cada valor en esa lista).
+"""
+def factorize(values: List[Union[int, str]]) -> tuple:
+  index = {}
+  provisional = np.fromiter((index.setdefault(value, len(index)) for value in values), dtype=np.intp, count=len(values))
+  categories, remap = sorted_remap(list(index))
+  return categories, remap[provisional] if len(remap) else np.empty(0, dtype=remap.dtype)
+
 # Enumeración que define los tipos de columna posibles
 class ColumnType(enum.Enum):
   BINARY = 1  # Tipo binario, admite solo valores 0 o 1
   NOMINAL = 2  # Tipo nominal, admite valores categóricos
   NUMERIC = 3  # Tipo numérico, admite valores numéricos
 
+# Patrón de los rangos numéricos: "< x1", "x1 - x2" o "> x2"
+NUMERIC_PATTERN = re.compile(r'<\s*(-?\d+(?:\.\d+)?)|(-?\d+(?:\.\d+)?)\s*-\s*(-?\d+(?:\.\d+)?)|>\s*(-?\d+(?:\.\d+)?)')
+
+"""
+Función para interpretar un rango numérico.
+
+Parámetros:
+value (str): Rango con formato "< x1", "x1 - x2" o "> x2".
+
+Retorna:
+tuple: Tupla (rango, x1, x2), donde rango es 0 para "< x1", 1 para "x1 - x2" y
+2 para "> x2", y x1 o x2 son None cuando el formato no los incluye.
+
+Excepciones:
+ValueError: Si el valor no tiene un formato numérico válido o x1 no es menor que x2.
+"""
+def parse_numeric_value(value: str) -> tuple:
+  match = NUMERIC_PATTERN.fullmatch(value.strip())
+  if not match:
+    raise ValueError(f"Formato numérico inválido: {value}")
+  if match.group(1):
+    return 0, float(match.group(1)), None
+  if match.group(4):
+    return 2, None, float(match.group(4))
+  x1, x2 = float(match.group(2)), float(match.group(3))
+  if x1 >= x2:
+    raise ValueError("Valores de x1 y x2 no son válidos: x1 debe ser menor que x2")
+  return 1, x1, x2
+
+"""
+Función para mostrar un umbral sin decimales innecesarios.
+
+Parámetros:
+value (float | int): Umbral a mostrar.
+
+Retorna:
+str: Umbral como texto ("25" para 25.0, "25.5" para 25.5).
+"""
+def format_threshold(value: float | int) -> str:
+  return np.format_float_positional(float(value), trim='-')
+
+"""
+Función para saber si un valor es una medición numérica sin agrupar.
+
+Parámetros:
+value (Union[int, float, str]): Valor a revisar.
+
+Retorna:
+bool: True si el valor es un entero o un flotante que no es NaN.
+"""
+def is_number(value) -> bool:
+  return (isinstance(value, int) and not isinstance(value, bool)) or (isinstance(value, float) and not math.isnan(value))
+
+"""
+Función para elegir un umbral entre dos valores distintos consecutivos.
+Se usa el número con menos decimales que queda estrictamente entre ambos, para
+que las etiquetas de los rangos sean legibles.
+
+Parámetros:
+low (float): Valor menor.
+high (float): Valor mayor.
+
+Retorna:
+float: Umbral tal que low < umbral < high.
+"""
+def round_between(low: float, high: float) -> float:
+  middle = (low + high) / 2
+  for decimals in range(16):
+    value = round(middle, decimals)
+    if low < value < high:
+      return value
+  return middle
+
+"""
+Función para elegir umbrales iniciales de una columna numérica sin agrupar,
+cerca de los terciles de sus valores distintos.
+
+Parámetros:
+values (np.ndarray): Mediciones de la columna.
+
+Retorna:
+tuple: Tupla con los valores x1 y x2, con x1 menor que x2. Si la columna tiene
+un solo valor distinto, el rango del medio es el intervalo entero que lo
+contiene, para que su etiqueta se pueda interpretar con parse_numeric_value.
+"""
+def initial_thresholds(values: np.ndarray) -> tuple:
+  distinct = np.unique(values)
+  if len(distinct) < 2:
+    low = float(math.floor(distinct[0])) if len(distinct) else 0.0
+    return low, low + 1
+  i = max(1, len(distinct) // 3)
+  j = max(i + 1, 2 * len(distinct) // 3)
+  x1 = round_between(float(distinct[i - 1]), float(distinct[i]))
+  x2 = round_between(float(distinct[j - 1]), float(distinct[j])) if j < len(distinct) else float(distinct[-1])
+  return x1, x2
+
+"""
+Función para obtener las etiquetas de los tres rangos de una columna numérica.
+
+Parámetros:
+x1 (float | int): Valor umbral inferior.
+x2 (float | int): Valor umbral superior.
+
+Retorna:
+List[str]: Etiquetas "< x1", "x1 - x2" y "> x2".
+"""
+def numeric_labels(x1: float | int, x2: float | int) -> List[str]:
+  x1, x2 = format_threshold(x1), format_threshold(x2)
+  return [f"< {x1}", f"{x1} - {x2}", f"> {x2}"]
+
+# Clase que infiere el tipo y los umbrales de una columna revisando cada valor distinto una sola vez
+class TypeInference:
+  types: List[ColumnType]  # Tipos que siguen siendo compatibles con todos los valores vistos
+  x1_set: set  # Valores x1 encontrados en los rangos numéricos
+  x2_set: set  # Valores x2 encontrados en los rangos numéricos
+  numbers: bool  # Indica si se encontraron mediciones numéricas sin agrupar
+  ranges: bool  # Indica si se encontraron rangos numéricos
+
+  """
+  Constructor de la clase TypeInference.
+  """
+  def __init__(self):
+    self.types = [ColumnType.BINARY, ColumnType.NOMINAL, ColumnType.NUMERIC]
+    self.x1_set = set()
+    self.x2_set = set()
+    self.numbers = False
+    self.ranges = False
+
+  """
+  Método para actualizar la inferencia con valores que no se habían visto.
+
+  Parámetros:
+  values (List[Union[int, str]]): Valores distintos nuevos.
+
+  Excepciones:
+  ValueError: Si un rango numérico tiene x1 mayor o igual que x2.
+  """
+  def update(self, values: List[Union[int, str]]):
+    for value in values:
+      if isinstance(value, int):
+        compatible = {ColumnType.BINARY, ColumnType.NOMINAL, ColumnType.NUMERIC} if value in {0, 1} else {ColumnType.NOMINAL, ColumnType.NUMERIC}
+        self.numbers = self.numbers or is_number(value)
+      elif is_number(value):
+        compatible = {ColumnType.NUMERIC}
+        self.numbers = True
+      elif isinstance(value, str) and NUMERIC_PATTERN.fullmatch(value.strip()):
+        compatible = {ColumnType.NUMERIC}
+        self.ranges = True
+        _, x1, x2 = parse_numeric_value(value)
+        if x1 is not None:
+          self.x1_set.add(x1)
+        if x2 is not None:
+          self.x2_set.add(x2)
+      else:
+        compatible = set()
+      self.types = [col_type for col_type in self.types if col_type in compatible]
+    # Una columna numérica tiene mediciones sin agrupar o rangos, pero no ambos
+    if self.numbers and self.ranges:
+      self.types = [col_type for col_type in self.types if col_type != ColumnType.NUMERIC]
+
+  """
+  Método para obtener el tipo inferido.
+
+  Retorna:
+  ColumnType: Primer tipo compatible (BINARY, NOMINAL o NUMERIC, en ese orden).
+
+  Excepciones:
+  ValueError: Si ningún tipo es compatible con los valores.
+  """
+  def column_type(self) -> ColumnType:
+    if not self.types:
+      raise ValueError("No se pudo inferir el tipo de dato de la columna.")
+    return self.types[0]
+
+  """
+  Método para obtener los umbrales x1 y x2 encontrados en los rangos numéricos.
+
+  Parámetros:
+  x1 (float | int, opcional): Umbral inferior a usar si los rangos no lo incluyen.
+  x2 (float | int, opcional): Umbral superior a usar si los rangos no lo incluyen.
+  strict (bool, opcional): Si es True, los rangos deben incluir exactamente un x1 y un x2.
+
+  Retorna:
+  tuple: Tupla con los valores x1 y x2.
+
+  Excepciones:
+  ValueError: Si hay valores fuera de lo común.
+  """
+  def thresholds(self, x1: float | int = None, x2: float | int = None, strict: bool = False) -> tuple:
+    if len(self.x1_set) > 1 or len(self.x2_set) > 1 or (strict and (len(self.x1_set) != 1 or len(self.x2_set) != 1)):
+      raise ValueError("Valores fuera de lo común en la columna numérica")
+    x1 = next(iter(self.x1_set)) if self.x1_set else (float('-inf') if x1 is None else x1)
+    x2 = next(iter(self.x2_set)) if self.x2_set else (float('inf') if x2 is None else x2)
+    return x1, x2
+
 # Clase que representa una columna en el dataset
 class Column:
   name: str  # Nombre de la columna
   type: ColumnType  # Tipo de la columna (BINARY, NOMINAL, NUMERIC)
-  instances: List[Union[int, str]]  # Lista de instancias de la columna
+  codes: np.ndarray  # Código entero de cada instancia (índice en categories)
+  categories: List[Union[int, str]]  # Valores distintos de la columna, ordenados
   x1: float | int  # Valor umbral inferior para datos numéricos
   x2: float | int  # Valor umbral superior para datos numéricos
+  values: np.ndarray | None  # Mediciones de una columna numérica sin agrupar (None si no aplica)
+  version: int  # Cambia cada vez que se modifican los códigos o las categorías
+  index: tuple | None  # Versión y diccionario valor -> código de la última consulta (None si no se ha construido)
 
   """
   Constructor de la clase Column.
+  Las columnas numéricas aceptan rangos ("< x1", "x1 - x2", "> x2") o mediciones
+  sin agrupar; en este último caso cada medición se clasifica en su rango con
+  x1 y x2, que se ajustan automáticamente al establecer la clase en Table.
   
   Parámetros:
   name (str): Nombre de la columna.
@@ -31,7 +301,7 @@ class Column:
   """
   def __init__(self, name: str, instances: List[Union[int, str]], type: ColumnType = None, x1: float | int = None, x2: float | int = None):
     self.name = name
-    self.instances = instances
+    self.instances = instances  # Se codifica en codes y categories
     self.x1 = x1
     self.x2 = x2
 
@@ -45,8 +315,183 @@ class Column:
     if self.type == ColumnType.NUMERIC:
       self.parse_numeric_instances()
 
+  """
+  Método para crear una columna a partir de datos ya codificados, sin volver a
+  inferir el tipo ni a codificar las instancias. El arreglo de códigos no se copia.
+
+  Parámetros:
+  name (str): Nombre de la columna.
+  codes (np.ndarray): Código de cada instancia (índice en categories).
+  categories (List[Union[int, str]]): Valores distintos de la columna, ordenados.
+  type (ColumnType): Tipo de la columna.
+  x1 (float | int, opcional): Valor umbral inferior para datos numéricos.
+  x2 (float | int, opcional): Valor umbral superior para datos numéricos.
+  values (np.ndarray, opcional): Mediciones de una columna numérica sin agrupar.
+
+  Retorna:
+  Column: Columna con los códigos y categorías indicados.
+  """
+  @classmethod
+  def from_codes(cls, name: str, codes: np.ndarray, categories: List[Union[int, str]], type: ColumnType, x1: float | int = None, x2: float | int = None, values: np.ndarray = None) -> "Column":
+    column = cls.__new__(cls)
+    column.name = name
+    column.codes = codes
+    column.categories = list(categories)
+    column.type = type
+    column.x1 = x1
+    column.x2 = x2
+    column.values = values
+    column.version = next(VERSIONS)
+    column.index = None
+    return column
+
+  """
+  Propiedad que reconstruye la lista de instancias a partir de los códigos.
+  Solo se debe usar cuando se necesitan los valores originales.
+
+  Retorna:
+  List[Union[int, str]]: Lista de instancias de la columna.
+  """
+  @property
+  def instances(self) -> List[Union[int, str]]:
+    return np.asarray(self.categories, dtype=object)[self.codes].tolist()
+
+  """
+  Codifica las instancias como un arreglo compacto de códigos y una tabla de categorías.
+
+  Parámetros:
+  instances (List[Union[int, str]]): Lista de instancias de la columna.
+  """
+  @instances.setter
+  def instances(self, instances: List[Union[int, str]]):
+    self.categories, self.codes = factorize(instances)
+    self.values = None  # Las mediciones se obtienen en parse_numeric_instances
+    self.version = next(VERSIONS)
+    self.index = None
+
+  """
+  Método para obtener el código de cada valor distinto. El diccionario se
+  construye una sola vez por versión de la columna y se guarda en index.
+
+  Retorna:
+  dict: Código (posición en categories) de cada valor.
+  """
+  def get_value_index(self) -> dict:
+    if self.index is None or self.index[0] != self.version:
+      self.index = (self.version, {value: code for code, value in enumerate(self.categories)})
+    return self.index[1]
+
+  """
+  Método para cambiar el valor de una instancia sin reconstruir la columna.
+
+  Parámetros:
+  row (int): Índice de la fila.
+  value (Union[int, str]): Nuevo valor de la instancia.
+  """
+  def set_instance(self, row: int, value: Union[int, str]):
+    if self.values is not None:
+      value = self.set_measurement(row, value)
+    index = self.get_value_index()
+    code = index.get(value)
+    if code is None:
+      # Valor nuevo: se inserta en orden y se desplazan los códigos mayores
+      code = bisect.bisect_left(self.categories, sort_key(value), key=sort_key)
+      self.categories.insert(code, value)
+      codes = self.codes.astype(code_dtype(len(self.categories)))
+      codes[codes >= code] += 1
+      self.codes = codes
+      index = None
+    self.codes[row] = code
+    self.version = next(VERSIONS)
+    if index is not None:
+      self.index = (self.version, index)  # Las categorías no cambiaron
+
+  """
+  Método para obtener los valores que se pueden elegir para una instancia.
+
+  Retorna:
+  List[Union[int, str]]: 0 y 1 para columnas binarias; 1, 2, 3 y los valores
+  existentes para columnas nominales; las etiquetas de los tres rangos para
+  columnas numéricas.
+  """
+  def get_domain(self) -> List[Union[int, str]]:
+    if self.type == ColumnType.BINARY:
+      return [0, 1]
+    if self.type == ColumnType.NOMINAL:
+      return sorted({1, 2, 3} | set(self.categories), key=sort_key)
+    if self.values is not None or all(isinstance(value, str) for value in self.categories):
+      return self.get_numeric_labels()
+    return list(self.categories)
+
+  """
+  Método para asignar a todas las filas un valor del dominio de una sola vez.
+
+  Parámetros:
+  positions (np.ndarray): Posición en get_domain del valor de cada fila.
+  """
+  def set_domain_positions(self, positions: np.ndarray):
+    domain = self.get_domain()
+    if self.values is not None:
+      # Se guarda una medición representativa de cada rango
+      x1, x2 = float(self.x1), float(self.x2)
+      representatives = np.array([np.nextafter(x1, -np.inf), (x1 + x2) / 2, np.nextafter(x2, np.inf)])
+      self.values = representatives[positions]
+      self.set_thresholds(self.x1, self.x2)
+      return
+    present = np.flatnonzero(np.bincount(positions, minlength=len(domain)))
+    self.categories, order = sorted_remap([domain[position] for position in present])
+    remap = np.zeros(len(domain), dtype=order.dtype)
+    remap[present] = order
+    self.codes = remap[positions]
+    self.version = next(VERSIONS)
+
+  """
+  Método para cambiar la medición de una fila en una columna numérica sin agrupar.
+  Si se recibe la etiqueta de un rango distinto al de la medición actual, se
+  guarda una medición representativa de ese rango con los umbrales actuales.
+
+  Parámetros:
+  row (int): Índice de la fila.
+  value (Union[float, str]): Nueva medición o etiqueta de rango.
+
+  Retorna:
+  str: Etiqueta del rango de la medición.
+  """
+  def set_measurement(self, row: int, value: Union[float, str]) -> str:
+    labels = self.get_numeric_labels()
+    current = self.values[row]
+    if isinstance(value, str):
+      bucket = parse_numeric_value(value)[0]
+      if bucket == int(current >= self.x1) + int(current > self.x2):
+        return labels[bucket]
+      x1, x2 = float(self.x1), float(self.x2)
+      value = (np.nextafter(x1, -np.inf), (x1 + x2) / 2, np.nextafter(x2, np.inf))[bucket]
+    self.values[row] = value
+    return labels[int(value >= self.x1) + int(value > self.x2)]
+
+  """
+  Método para cambiar los umbrales de una columna numérica sin agrupar y volver
+  a clasificar cada medición en su rango.
+
+  Parámetros:
+  x1 (float | int): Valor umbral inferior.
+  x2 (float | int): Valor umbral superior.
+  """
+  def set_thresholds(self, x1: float | int, x2: float | int):
+    self.x1 = x1
+    self.x2 = x2
+    buckets = (self.values >= x1).astype(np.uint8) + (self.values > x2)
+    labels = self.get_numeric_labels()
+    present = np.flatnonzero(np.bincount(buckets, minlength=3))
+    self.categories, order = sorted_remap([labels[bucket] for bucket in present])
+    remap = np.zeros(3, dtype=np.uint8)
+    remap[present] = order
+    self.codes = remap[buckets]
+    self.version = next(VERSIONS)
+
   """
   Método para inferir el tipo de columna a partir de las instancias.
+  Cada valor distinto se revisa una sola vez.
   
   Retorna:
   ColumnType: Tipo de la columna inferido (BINARY, NOMINAL, NUMERIC).
@@ -55,50 +500,157 @@ class Column:
   ValueError: Si las instancias no permiten inferir el tipo de la columna.
   """
   def infer_column_type(self) -> ColumnType:
-    # Verifica si todas las instancias son enteros 0 o 1
-    if all(isinstance(instance, int) and instance in {0, 1} for instance in self.instances):
-      return ColumnType.BINARY
-    # Verifica si todas las instancias son enteros
-    elif all(isinstance(instance, int) for instance in self.instances):
-      return ColumnType.NOMINAL
-    # Verifica si todas las instancias son cadenas de texto que coinciden con el patrón numérico
-    elif all(isinstance(instance, str) and re.match(r'(?:<\s*\d+|\d+\.\d+\s*-\s*\d+\.\d+|>\s*\d+)', instance) for instance in self.instances):
-      return ColumnType.NUMERIC
-    else:
-      raise ValueError(f"No se puede inferir el tipo de la columna a partir de las instancias: {self.instances}")
+    inference = TypeInference()
+    inference.update(self.categories)
+    try:
+      return inference.column_type()
+    except ValueError:
+      raise ValueError(f"No se puede inferir el tipo de la columna a partir de las instancias: {self.categories}")
 
   """
   Método para procesar y clasificar instancias numéricas.
+  Los umbrales se obtienen de los valores distintos, y cada uno se reemplaza por
+  la etiqueta de su rango ("< x1", "x1 - x2" o "> x2"), de modo que un mismo
+  rango escrito de distintas formas queda en una sola categoría.
   
   Excepciones:
   ValueError: Si alguna instancia numérica no coincide con los formatos esperados.
   """
   def parse_numeric_instances(self):
-    # Si no se especifican x1 y x2, se asignan valores por defecto
-    if self.x1 is None or self.x2 is None:
-      self.x1 = float('-inf')  # Valor por defecto para x1: menos infinito
-      self.x2 = float('inf')  # Valor por defecto para x2: infinito
-    
-    # Se procesan las instancias y se ajustan los valores de x1 y x2 según corresponda
-    for instance in self.instances:
-      if isinstance(instance, str):  # Solo se procesan instancias que son cadenas de texto
-        # Utiliza una expresión regular para verificar y extraer valores numéricos
-        match = re.match(r'<\s*(\d+(\.\d+)?)|(\d+(\.\d+)?)\s*-\s*(\d+(\.\d+)?)|>\s*(\d+(\.\d+)?)', instance)
-        if match:
-          # Si la cadena coincide con el patrón "< número", se ajusta x2
-          if match.group(1):
-            self.x1 = float('-inf')  # x1 se mantiene en menos infinito
-            self.x2 = float(match.group(1))  # x2 se ajusta al valor del número
-          # Si la cadena coincide con el patrón "número - número", se ajustan x1 y x2
-          elif match.group(3) and match.group(5):
-            self.x1 = float(match.group(3))  # x1 se ajusta al primer número
-            self.x2 = float(match.group(5))  # x2 se ajusta al segundo número
-          # Si la cadena coincide con el patrón "> número", se ajusta x1
-          elif match.group(7):
-            self.x1 = float(match.group(7))  # x1 se ajusta al valor del número
-            self.x2 = float('inf')  # x2 se mantiene en infinito
-        else:
-          raise ValueError(f"Formato numérico inválido: {instance}")
+    # Mediciones sin agrupar: se clasifican con umbrales iniciales
+    if self.categories and all(is_number(value) for value in self.categories):
+      self.values = np.asarray(self.categories, dtype=np.float64)[self.codes]
+      if self.x1 is None or self.x2 is None:
+        self.x1, self.x2 = initial_thresholds(self.values)
+      self.set_thresholds(self.x1, self.x2)
+      return
+
+    strings = [value for value in self.categories if isinstance(value, str)]
+    inference = TypeInference()
+    inference.update(strings)
+    for value in strings:
+      parse_numeric_value(value)  # Valida el formato de cada valor distinto
+    self.x1, self.x2 = inference.thresholds(self.x1, self.x2)
+    if strings and len(strings) == len(self.categories):
+      self.relabel_numeric_instances()
+
+  """
+  Método para obtener las etiquetas de los tres rangos de la columna.
+
+  Retorna:
+  List[str]: Etiquetas "< x1", "x1 - x2" y "> x2".
+  """
+  def get_numeric_labels(self) -> List[str]:
+    return numeric_labels(self.x1, self.x2)
+
+  """
+  Método para reemplazar cada rango numérico por la etiqueta de su rango.
+  Solo se recorren las categorías; los códigos se reasignan con una tabla.
+  """
+  def relabel_numeric_instances(self):
+    labels = self.get_numeric_labels()
+    mapped = [labels[parse_numeric_value(value)[0]] for value in self.categories]
+    categories = sorted(set(mapped))
+    position = {label: code for code, label in enumerate(categories)}
+    remap = np.array([position[label] for label in mapped], dtype=code_dtype(len(categories)))
+    self.codes = remap[self.codes] if len(remap) else self.codes
+    self.categories = categories
+    self.version = next(VERSIONS)
+
+# Clase que codifica una columna por bloques, a medida que se leen las filas
+class ColumnEncoder:
+  name: str  # Nombre de la columna
+  index: dict  # Código provisional de cada valor distinto, en orden de aparición
+  chunks: List[np.ndarray]  # Códigos provisionales de cada bloque
+
+  """
+  Constructor de la clase ColumnEncoder.
+
+  Parámetros:
+  name (str): Nombre de la columna.
+  """
+  def __init__(self, name: str):
+    self.name = name
+    self.index = {}
+    self.chunks = []
+
+  """
+  Método para codificar un bloque de valores.
+
+  Parámetros:
+  values (List[Union[int, str]]): Valores del bloque.
+
+  Retorna:
+  List[Union[int, str]]: Valores que aparecen por primera vez en este bloque.
+  """
+  def add(self, values: List[Union[int, str]]) -> List[Union[int, str]]:
+    known = len(self.index)
+    index = self.index
+    self.chunks.append(np.fromiter((index.setdefault(value, len(index)) for value in values), dtype=np.uint32, count=len(values)))
+    return list(index)[known:] if len(index) > known else []
+
+  """
+  Método para codificar un bloque que ya viene como arreglo de NumPy.
+  Solo los valores distintos del bloque pasan por Python; los arreglos de
+  objetos, que pueden mezclar tipos, se codifican con un diccionario.
+
+  Parámetros:
+  values (np.ndarray): Valores del bloque.
+
+  Retorna:
+  List[Union[int, str]]: Valores que aparecen por primera vez en este bloque.
+  """
+  def add_array(self, values: np.ndarray) -> List[Union[int, str]]:
+    if values.dtype == object:
+      return self.add(values.tolist())
+    uniques, inverse = np.unique(values, return_inverse=True)
+    return self.add_codes(inverse.reshape(-1), uniques.tolist())
+
+  """
+  Método para codificar un bloque que ya viene codificado con su propia tabla de valores,
+  como un arreglo de diccionario de Arrow.
+
+  Parámetros:
+  codes (np.ndarray): Código local de cada valor del bloque (índice en values).
+  values (List[Union[int, str]]): Valores distintos del bloque.
+
+  Retorna:
+  List[Union[int, str]]: Valores que aparecen por primera vez en este bloque.
+  """
+  def add_codes(self, codes: np.ndarray, values: List[Union[int, str]]) -> List[Union[int, str]]:
+    known = len(self.index)
+    index = self.index
+    lookup = np.fromiter((index.setdefault(value, len(index)) for value in values), dtype=np.uint32, count=len(values))
+    self.chunks.append(lookup[codes])
+    return list(index)[known:] if len(index) > known else []
+
+  """
+  Método para saber cuántas filas se han codificado.
+
+  Retorna:
+  int: Cantidad de filas codificadas.
+  """
+  def total_instances(self) -> int:
+    return sum(len(chunk) for chunk in self.chunks)
+
+  """
+  Método para terminar la codificación y crear la columna.
+  Las categorías se ordenan y los códigos provisionales se reasignan en una sola pasada.
+
+  Parámetros:
+  type (ColumnType): Tipo de la columna.
+  x1 (float | int, opcional): Valor umbral inferior para datos numéricos.
+  x2 (float | int, opcional): Valor umbral superior para datos numéricos.
+
+  Retorna:
+  Column: Columna con los códigos y categorías acumulados.
+  """
+  def finish(self, type: ColumnType, x1: float | int = None, x2: float | int = None) -> Column:
+    categories, remap = sorted_remap(list(self.index))
+    codes = remap[np.concatenate(self.chunks)] if self.chunks else np.empty(0, dtype=remap.dtype)
+    self.index = {}
+    self.chunks = []
+    return Column.from_codes(self.name, codes, categories, type, x1, x2)
 
 # Ejemplo de uso
 if __name__ == "__main__":
@@ -0,0 +1,214 @@
+import sys
+import os
+import numpy as np
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Callable
+
+# Agrega el directorio principal al path de Python
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.Column import Column, ColumnType, initial_thresholds
+from models.Table import Table
+from models.DecisionTree import DecisionTree
+from helpers.shared_memory import share_table, attach_table, close_arrays, release_arrays
+
+"""
+Función para repartir las filas de una tabla en k pliegues. Con los códigos de
+la clase, cada clase se reparte por igual entre los pliegues (estratificación).
+
+Parámetros:
+total (int): Cantidad de filas.
+k (int): Cantidad de pliegues.
+seed (int, opcional): Semilla para mezclar las filas.
+class_codes (np.ndarray, opcional): Códigos de la clase de cada fila, para estratificar.
+
+Retorna:
+np.ndarray: Número de pliegue de cada fila.
+
+Excepciones:
+ValueError: Si k es menor que 2 o mayor que la cantidad de filas.
+"""
+def make_folds(total: int, k: int, seed: int = None, class_codes: np.ndarray = None) -> np.ndarray:
+  if k < 2 or k > total:
+    raise ValueError(f"La cantidad de pliegues debe estar entre 2 y {total}.")
+  rng = np.random.default_rng(seed)
+  order = rng.permutation(total)
+  if class_codes is not None:
+    # Las filas de cada clase quedan juntas y en orden aleatorio, y se reparten en turno
+    order = order[np.argsort(class_codes[order], kind="stable")]
+  folds = np.empty(total, dtype=np.int32)
+  folds[order] = np.arange(total) % k
+  return folds
+
+"""
+Función para obtener la tabla de un pliegue. Las columnas ya agrupadas se usan
+tal cual; los umbrales de las columnas numéricas sin agrupar se ajustan solo con
+las filas de entrenamiento, y todas las filas se clasifican con esos umbrales,
+para que la clase de las filas de prueba no influya en los rangos.
+
+Parámetros:
+table (Table): Tabla con la clase establecida.
+train_rows (np.ndarray): Índices de las filas de entrenamiento.
+
+Retorna:
+Table: Tabla del pliegue, que comparte los códigos y las mediciones de la original.
+"""
+def fold_table(table: Table, train_rows: np.ndarray) -> Table:
+  columns = []
+  for i, column in enumerate(table.columns):
+    if column.values is None or i == table.clase:
+      columns.append(column)
+      continue
+    thresholds = table.find_best_thresholds(i, train_rows)
+    if thresholds is None:
+      thresholds = initial_thresholds(column.values[train_rows])
+    fold_column = Column.from_codes(column.name, column.codes, column.categories, column.type, column.x1, column.x2, column.values)
+    fold_column.set_thresholds(*thresholds)
+    columns.append(fold_column)
+  fold = Table(columns)
+  fold.clase = table.clase
+  return fold
+
+"""
+Función para entrenar un árbol con todos los pliegues menos uno y evaluarlo con el restante.
+Los códigos de la tabla se usan tal cual, sin volver a codificar, salvo los de
+las columnas numéricas sin agrupar, que se reclasifican con umbrales del pliegue.
+
+Parámetros:
+table (Table): Tabla con la clase establecida.
+folds (np.ndarray): Número de pliegue de cada fila, de make_folds.
+fold (int): Pliegue de prueba.
+params (dict): max_depth y min_samples_split del árbol.
+
+Retorna:
+dict: Diccionario con el pliegue ("fold"), las filas de entrenamiento y prueba
+("train_size", "test_size"), la exactitud ("accuracy"), las ganancias sobre las
+filas de entrenamiento ("calculations", con el formato de get_all_calculations) y los nombres
+de las columnas ordenados por ganancia ("ranking").
+"""
+def evaluate_fold(table: Table, folds: np.ndarray, fold: int, params: dict) -> dict:
+  train_rows = np.flatnonzero(folds != fold)
+  test_rows = np.flatnonzero(folds == fold)
+  table = fold_table(table, train_rows)
+  tree = DecisionTree(table, params["max_depth"], params["min_samples_split"])
+  tree.fit(train_rows)
+  compiled = tree.compile()
+
+  codes = {column.name: column.codes for column in table.columns}
+  encoded = np.empty((len(compiled.inputs), len(test_rows)), dtype=np.intp)
+  for i, name in enumerate(compiled.inputs):
+    encoded[i] = codes[name][test_rows]
+  predicted = compiled.predict_codes(encoded)
+  accuracy = float(np.mean(predicted == table.columns[table.clase].codes[test_rows])) if len(test_rows) else 0.0
+
+  gains = table.calculate_all_gains(rows=train_rows)
+  order = np.argsort(-gains["gains"], kind="stable")
+  ranking = [table.columns[gains["indices"][i]].name for i in order]
+
+  return {
+    "fold": fold,
+    "train_size": len(train_rows),
+    "test_size": len(test_rows),
+    "accuracy": accuracy,
+    "calculations": table.format_calculations(gains),
+    "ranking": ranking
+  }
+
+"""
+Función que ejecuta cada proceso: se conecta a la tabla y a los pliegues en
+memoria compartida y evalúa un pliegue.
+
+Parámetros:
+spec (tuple): Especificación de la tabla compartida con share_table; el primer
+  arreglo adicional son los pliegues.
+fold (int): Pliegue de prueba.
+params (dict): max_depth y min_samples_split del árbol.
+
+Retorna:
+dict: Resultado de evaluate_fold.
+"""
+def evaluate_shared_fold(spec: tuple, fold: int, params: dict) -> dict:
+  blocks, table, (folds,) = attach_table(spec)
+  try:
+    return evaluate_fold(table, folds, fold, params)
+  finally:
+    del table, folds
+    close_arrays(blocks)
+
+"""
+Función para estimar con validación cruzada de k pliegues qué tan bien
+generaliza el árbol de una tabla. La tabla se codifica una sola vez; cada
+pliegue es un arreglo de índices sobre los mismos códigos, y con un pool de
+procesos los pliegues se evalúan a la vez sobre una sola copia en memoria
+compartida.
+
+Parámetros:
+table (Table): Tabla con la clase ya establecida mediante set_clase.
+k (int, opcional): Cantidad de pliegues.
+seed (int, opcional): Semilla para repartir las filas.
+stratify (bool, opcional): Si cada pliegue conserva la proporción de cada clase.
+max_depth (int, opcional): Profundidad máxima de los árboles.
+min_samples_split (int, opcional): Cantidad mínima de filas para dividir un nodo.
+executor (Executor, opcional): Pool de procesos. Si no se especifica y workers es mayor que 1,
+  se crea uno temporal.
+workers (int, opcional): Cantidad de procesos del pool temporal. Por defecto, uno por núcleo.
+progress (Callable, opcional): Función que recibe el avance (pliegues terminados, total de pliegues).
+
+Retorna:
+dict: Diccionario con el resultado de cada pliegue ("folds"), la exactitud
+promedio ("accuracy") y su desviación estándar ("accuracy_std").
+"""
+def cross_validate(table: Table, k: int = 5, seed: int = None, stratify: bool = True, max_depth: int = None,
+                   min_samples_split: int = 2, executor: Executor = None, workers: int = None, progress: Callable = None) -> dict:
+  class_codes = table.columns[table.clase].codes if stratify else None
+  folds = make_folds(table.total_instances(), k, seed, class_codes)
+  params = {"max_depth": max_depth, "min_samples_split": min_samples_split}
+  workers = workers or os.cpu_count() or 1
+
+  results = []
+  if executor is None and workers <= 1:
+    for fold in range(k):
+      results.append(evaluate_fold(table, folds, fold, params))
+      if progress is not None:
+        progress(fold + 1, k)
+  else:
+    own_executor = executor is None
+    if own_executor:
+      executor = ProcessPoolExecutor(max_workers=min(workers, k))
+    blocks, spec = share_table(table, [folds])
+    futures = []
+    try:
+      futures = [executor.submit(evaluate_shared_fold, spec, fold, params) for fold in range(k)]
+      for done, future in enumerate(futures, start=1):
+        results.append(future.result())
+        if progress is not None:
+          progress(done, k)
+    finally:
+      for future in futures:
+        future.cancel()
+      if own_executor:
+        executor.shutdown(wait=True, cancel_futures=True)
+      release_arrays(blocks)
+
+  accuracies = np.array([result["accuracy"] for result in results])
+  return {
+    "folds": results,
+    "accuracy": float(accuracies.mean()),
+    "accuracy_std": float(accuracies.std())
+  }
+
+# Ejemplo de uso
+if __name__ == "__main__":
+  tenis_columns: List[Column] = [
+    Column("Temperatura", ["> 32", "> 32", "> 32", "25 - 32", "< 25", "< 25", "< 25", "25 - 32", "< 25", "25 - 32", "25 - 32", "25 - 32", "> 32", "25 - 32"], ColumnType.NUMERIC),
+    Column("Humedad", [3, 3, 3, 3, 2, 2, 2, 3, 2, 2, 2, 3, 2, 3], ColumnType.NOMINAL),
+    Column("Viento", [1, 3, 1, 1, 1, 3, 3, 1, 1, 1, 3, 3, 1, 3], ColumnType.NOMINAL),
+    Column("Jugar", [0, 0, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 0], ColumnType.BINARY)
+  ]
+
+  tenis_table = Table(tenis_columns)
+  tenis_table.set_clase(3, total_amount_instances=14)
+
+  report = cross_validate(tenis_table, k=3, seed=0, workers=2)
+  for result in report["folds"]:
+    print(f"Pliegue {result['fold']}: exactitud {result['accuracy']:.4f}, ranking {', '.join(result['ranking'])}")
+  print(f"Exactitud promedio: {report['accuracy']:.4f} ± {report['accuracy_std']:.4f}")
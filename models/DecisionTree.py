@@ -0,0 +1,506 @@
+import sys
+import os
+import numpy as np
+from typing import Union, List, Callable
+
+# Agrega el directorio principal al path de Python
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.Column import Column, ColumnType, numeric_labels, parse_numeric_value, is_number, factorize
+from models.Table import Table
+
+# Clase que representa un nodo del árbol de decisión
+class Node:
+  column: int | None  # Índice de la columna usada para dividir (None en las hojas)
+  children: dict  # Hijo de cada código de la columna de división
+  class_counts: np.ndarray  # Conteo de cada categoría de la clase en el nodo
+  prediction: Union[int, str]  # Valor de la clase mayoritaria
+  gain: float  # Ganancia de la división (0.0 en las hojas)
+  depth: int  # Profundidad del nodo (la raíz tiene profundidad 0)
+
+  """
+  Constructor de la clase Node.
+
+  Parámetros:
+  class_counts (np.ndarray): Conteo de cada categoría de la clase en el nodo.
+  prediction (Union[int, str]): Valor de la clase mayoritaria.
+  depth (int): Profundidad del nodo.
+  """
+  def __init__(self, class_counts: np.ndarray, prediction: Union[int, str], depth: int):
+    self.column = None
+    self.children = {}
+    self.class_counts = class_counts
+    self.prediction = prediction
+    self.gain = 0.0
+    self.depth = depth
+
+  """
+  Método para saber si el nodo es una hoja.
+
+  Retorna:
+  bool: True si el nodo no tiene hijos.
+  """
+  def is_leaf(self) -> bool:
+    return self.column is None
+
+# Clase que guarda un árbol en arreglos planos para predecir muchas filas a la vez
+class CompiledTree:
+  inputs: List[str]  # Nombres de las columnas que usa el árbol, en el orden de las filas de la matriz codificada
+  categories: List[list]  # Categorías de entrenamiento de cada entrada (el código es la posición)
+  x1: np.ndarray  # Umbral x1 de cada entrada numérica (NaN si la entrada no es numérica)
+  x2: np.ndarray  # Umbral x2 de cada entrada numérica (NaN si la entrada no es numérica)
+  feature: np.ndarray  # Entrada que divide cada nodo (-1 en las hojas)
+  child_start: np.ndarray  # Posición en children del hijo del código 0 de cada nodo
+  n_children: np.ndarray  # Cantidad de códigos de la entrada de cada nodo (0 en las hojas)
+  children: np.ndarray  # Nodo hijo de cada código (-1 si el valor no apareció en el entrenamiento)
+  prediction: np.ndarray  # Código de la clase mayoritaria de cada nodo
+  class_counts: np.ndarray  # Conteo de cada categoría de la clase en cada nodo (nodos x clases)
+  class_name: str  # Nombre de la columna de clase
+  class_values: list  # Valores de la clase (el código es la posición)
+  depth: int  # Profundidad máxima del árbol
+
+  """
+  Constructor de la clase CompiledTree. Normalmente se crea con DecisionTree.compile.
+  El nodo 0 es la raíz. Cuando el valor de una fila no tiene hijo, la fila se
+  queda en ese nodo y recibe su clase mayoritaria.
+
+  Parámetros:
+  inputs (List[str]): Nombres de las columnas de entrada.
+  categories (List[list]): Categorías de cada entrada.
+  x1 (np.ndarray): Umbral x1 de cada entrada (NaN si no es numérica).
+  x2 (np.ndarray): Umbral x2 de cada entrada (NaN si no es numérica).
+  feature (np.ndarray): Entrada de cada nodo (-1 en las hojas).
+  child_start (np.ndarray): Posición del primer hijo de cada nodo en children.
+  n_children (np.ndarray): Cantidad de códigos de cada nodo.
+  children (np.ndarray): Nodo hijo de cada código (-1 si no tiene).
+  prediction (np.ndarray): Clase mayoritaria de cada nodo.
+  class_counts (np.ndarray): Conteos de la clase de cada nodo.
+  class_name (str): Nombre de la columna de clase.
+  class_values (list): Valores de la clase.
+  """
+  def __init__(self, inputs: List[str], categories: List[list], x1: np.ndarray, x2: np.ndarray,
+               feature: np.ndarray, child_start: np.ndarray, n_children: np.ndarray, children: np.ndarray,
+               prediction: np.ndarray, class_counts: np.ndarray, class_name: str, class_values: list):
+    self.inputs = inputs
+    self.categories = categories
+    self.x1 = x1
+    self.x2 = x2
+    self.feature = feature
+    self.child_start = child_start
+    self.n_children = n_children
+    self.children = children
+    self.prediction = prediction
+    self.class_counts = class_counts
+    self.class_name = class_name
+    self.class_values = class_values
+    self.depth = self.get_depth()
+
+  """
+  Método para calcular la profundidad máxima del árbol recorriendo los arreglos por niveles.
+
+  Retorna:
+  int: Cantidad de divisiones en el camino más largo.
+  """
+  def get_depth(self) -> int:
+    depth = 0
+    level = np.array([0], dtype=np.intp)
+    while True:
+      level = level[self.feature[level] >= 0]
+      if len(level) == 0:
+        return depth
+      slots = np.concatenate([np.arange(start, start + size) for start, size in zip(self.child_start[level], self.n_children[level])])
+      level = self.children[slots]
+      level = level[level >= 0]
+      depth += 1
+
+  """
+  Método para saber si una entrada es numérica con umbrales.
+
+  Parámetros:
+  input_index (int): Índice de la entrada.
+
+  Retorna:
+  bool: True si la entrada tiene umbrales x1 y x2.
+  """
+  def is_numeric_input(self, input_index: int) -> bool:
+    return not np.isnan(self.x1[input_index])
+
+  """
+  Método para codificar los valores de una entrada con las categorías de entrenamiento.
+  Solo se buscan los valores distintos; las entradas numéricas aceptan
+  mediciones sin agrupar o rangos como "< x1", que se asignan al rango de
+  entrenamiento correspondiente. Los valores desconocidos reciben un código
+  sin hijo, así que sus filas se quedan en el nodo que los evalúa.
+
+  Parámetros:
+  input_index (int): Índice de la entrada.
+  values (np.ndarray | list): Valores de la columna.
+
+  Retorna:
+  np.ndarray: Código de cada valor.
+  """
+  def encode_input(self, input_index: int, values) -> np.ndarray:
+    categories = self.categories[input_index]
+    unknown = len(categories)
+    index = {value: code for code, value in enumerate(categories)}
+    values = np.asarray(values)
+    if values.dtype.kind == "f" and self.is_numeric_input(input_index):
+      # Mediciones sin agrupar: el rango se calcula sin pasar por Python
+      x1, x2 = self.x1[input_index], self.x2[input_index]
+      bucket_codes = np.array([index.get(label, unknown) for label in numeric_labels(x1, x2)] + [unknown])
+      buckets = (values >= x1).astype(np.intp) + (values > x2)
+      buckets[np.isnan(values)] = 3
+      return bucket_codes[buckets]
+
+    if values.dtype == object:
+      # Los objetos, que pueden mezclar tipos, se agrupan con un diccionario
+      uniques, inverse = factorize(values.reshape(-1).tolist())
+    else:
+      uniques, inverse = np.unique(values, return_inverse=True)
+      uniques = uniques.tolist()
+    codes = np.array([self.encode_value(input_index, value, index) for value in uniques], dtype=np.intp)
+    return codes[inverse.reshape(-1)] if len(codes) else np.zeros(0, dtype=np.intp)
+
+  """
+  Método para codificar un solo valor de una entrada.
+
+  Parámetros:
+  input_index (int): Índice de la entrada.
+  value (Union[int, float, str]): Valor a codificar.
+  index (dict): Código de cada categoría de entrenamiento.
+
+  Retorna:
+  int: Código del valor, o la cantidad de categorías si es desconocido.
+  """
+  def encode_value(self, input_index: int, value, index: dict) -> int:
+    if value in index:
+      return index[value]
+    unknown = len(self.categories[input_index])
+    if not self.is_numeric_input(input_index):
+      # Los enteros leídos como flotantes o como texto se buscan como enteros
+      if isinstance(value, str) and value.strip().lstrip("-").isdigit():
+        return index.get(int(value), unknown)
+      if is_number(value) and float(value).is_integer():
+        return index.get(int(value), unknown)
+      return unknown
+    x1, x2 = self.x1[input_index], self.x2[input_index]
+    if is_number(value):
+      bucket = int(value >= x1) + int(value > x2)
+    else:
+      try:
+        bucket = parse_numeric_value(str(value))[0]
+      except ValueError:
+        return unknown
+    return index.get(numeric_labels(x1, x2)[bucket], unknown)
+
+  """
+  Método para codificar datos nuevos como matriz de entradas x filas.
+
+  Parámetros:
+  data (dict): Valores de cada columna por nombre; debe incluir todas las entradas del árbol.
+
+  Retorna:
+  np.ndarray: Matriz de códigos con una fila por entrada.
+
+  Excepciones:
+  KeyError: Si falta alguna columna de entrada.
+  """
+  def encode(self, data: dict) -> np.ndarray:
+    missing = [name for name in self.inputs if name not in data]
+    if missing:
+      raise KeyError(f"Faltan las columnas: {', '.join(missing)}")
+    rows = len(data[self.inputs[0]]) if self.inputs else len(next(iter(data.values()), []))
+    encoded = np.empty((len(self.inputs), rows), dtype=np.intp)
+    for i, name in enumerate(self.inputs):
+      encoded[i] = self.encode_input(i, data[name])
+    return encoded
+
+  """
+  Método para codificar columnas ya codificadas de otra tabla, traduciendo solo sus categorías.
+
+  Parámetros:
+  columns (List[Column]): Columnas con los nombres de las entradas.
+
+  Retorna:
+  np.ndarray: Matriz de códigos con una fila por entrada.
+  """
+  def encode_columns(self, columns: List[Column]) -> np.ndarray:
+    by_name = {column.name: column for column in columns}
+    rows = len(columns[0].codes) if columns else 0
+    encoded = np.empty((len(self.inputs), rows), dtype=np.intp)
+    for i, name in enumerate(self.inputs):
+      column = by_name[name]
+      index = {value: code for code, value in enumerate(self.categories[i])}
+      remap = np.array([self.encode_value(i, value, index) for value in column.categories], dtype=np.intp)
+      encoded[i] = remap[column.codes] if len(remap) else 0
+    return encoded
+
+  """
+  Método para obtener el código de clase de un lote de filas codificadas. Todas
+  las filas avanzan juntas un nivel del árbol por paso, con operaciones de
+  NumPy sobre los arreglos planos.
+
+  Parámetros:
+  encoded (np.ndarray): Matriz de códigos (entradas x filas) de encode o encode_columns.
+
+  Retorna:
+  np.ndarray: Código de la clase predicha para cada fila.
+  """
+  def predict_codes(self, encoded: np.ndarray) -> np.ndarray:
+    rows = encoded.shape[1]
+    node = np.zeros(rows, dtype=np.intp)
+    active = np.flatnonzero(self.feature[node] >= 0)
+    for _ in range(self.depth):
+      if len(active) == 0:
+        break
+      current = node[active]
+      codes = encoded[self.feature[current], active]
+      valid = codes < self.n_children[current]
+      following = np.full(len(active), -1, dtype=np.intp)
+      following[valid] = self.children[self.child_start[current[valid]] + codes[valid]]
+      moved = following >= 0
+      active = active[moved]
+      node[active] = following[moved]
+      active = active[self.feature[node[active]] >= 0]
+    return self.prediction[node]
+
+  """
+  Método para predecir la clase de datos nuevos.
+
+  Parámetros:
+  data (dict): Valores de cada columna por nombre.
+
+  Retorna:
+  np.ndarray: Valor de la clase predicha para cada fila.
+  """
+  def predict(self, data: dict) -> np.ndarray:
+    return np.asarray(self.class_values)[self.predict_codes(self.encode(data))]
+
+# Clase que construye un árbol de decisión ID3 sobre una tabla
+class DecisionTree:
+  table: Table  # Tabla con la clase ya establecida
+  max_depth: int | None  # Profundidad máxima del árbol (None para no limitar)
+  min_samples_split: int  # Cantidad mínima de filas para dividir un nodo
+  root: Node | None  # Nodo raíz del árbol
+  progress: Callable | None  # Función que recibe el avance (filas en hojas, filas totales) durante fit
+  rows_done: int  # Filas que ya llegaron a una hoja durante fit
+  rows_total: int  # Filas de entrenamiento de fit
+
+  """
+  Constructor de la clase DecisionTree.
+
+  Parámetros:
+  table (Table): Tabla con la clase ya establecida mediante set_clase.
+  max_depth (int, opcional): Profundidad máxima del árbol. Si no se especifica, no se limita.
+  min_samples_split (int, opcional): Cantidad mínima de filas para dividir un nodo.
+
+  Excepciones:
+  ValueError: Si los límites no son válidos.
+  """
+  def __init__(self, table: Table, max_depth: int = None, min_samples_split: int = 2):
+    if max_depth is not None and max_depth < 0:
+      raise ValueError("La profundidad máxima no puede ser negativa.")
+    if min_samples_split < 2:
+      raise ValueError("La cantidad mínima de filas para dividir debe ser al menos 2.")
+    self.table = table
+    self.max_depth = max_depth
+    self.min_samples_split = min_samples_split
+    self.root = None
+    self.progress = None
+    self.rows_done = 0
+    self.rows_total = 0
+
+  """
+  Método para construir el árbol a partir de todas las filas de la tabla.
+
+  Parámetros:
+  rows (np.ndarray, opcional): Índices de las filas de entrenamiento. Si no se especifica, se usan todas.
+  progress (Callable, opcional): Función que recibe el avance (filas en hojas, filas totales)
+    cada vez que se termina una hoja; si lanza una excepción, la construcción se detiene.
+  attributes (list[int], opcional): Columnas que se pueden usar para dividir. Por defecto, todas excepto la clase.
+
+  Retorna:
+  Node: Nodo raíz del árbol construido.
+  """
+  def fit(self, rows: np.ndarray = None, progress: Callable = None, attributes: list[int] = None) -> Node:
+    class_column = self.table.columns[self.table.clase]
+    class_codes = class_column.codes if rows is None else class_column.codes[rows]
+    class_counts = np.bincount(class_codes, minlength=len(class_column.categories))
+    if attributes is None:
+      available = [i for i in range(len(self.table.columns)) if i != self.table.clase]
+    else:
+      available = [i for i in attributes if i != self.table.clase]
+    self.progress = progress
+    self.rows_done = 0
+    self.rows_total = int(class_counts.sum())
+    try:
+      self.root = self.build_node(rows, class_counts, available, 0)
+    finally:
+      self.progress = None
+    return self.root
+
+  """
+  Método recursivo para construir un nodo y sus hijos.
+  Cada hijo trabaja sobre una vista de índices de filas del padre, y sus conteos
+  de clase se toman de la fila correspondiente de la matriz valor x clase del padre.
+
+  Parámetros:
+  rows (np.ndarray | None): Índices de las filas del nodo (None para todas las filas).
+  class_counts (np.ndarray): Conteo de cada categoría de la clase en el nodo.
+  available (list[int]): Columnas que todavía se pueden usar para dividir.
+  depth (int): Profundidad del nodo.
+
+  Retorna:
+  Node: Nodo construido.
+  """
+  def build_node(self, rows: np.ndarray | None, class_counts: np.ndarray, available: list[int], depth: int) -> Node:
+    class_column = self.table.columns[self.table.clase]
+    node = Node(class_counts, class_column.categories[int(np.argmax(class_counts))], depth)
+
+    total = int(class_counts.sum())
+    if (np.count_nonzero(class_counts) <= 1 or not available or total < self.min_samples_split
+        or (self.max_depth is not None and depth >= self.max_depth)):
+      return self.finish_leaf(node)
+
+    calculations = self.table.calculate_all_gains(rows, available)
+    best = int(np.argmax(calculations["gains"]))
+    if calculations["gains"][best] <= 0:
+      return self.finish_leaf(node)
+
+    node.column = int(calculations["indices"][best])
+    node.gain = float(calculations["gains"][best])
+    matrix = calculations["contingencies"][best]
+
+    # Ordenar las filas por código y cortar con los totales de cada fila de la matriz
+    codes = self.table.columns[node.column].codes if rows is None else self.table.columns[node.column].codes[rows]
+    order = np.argsort(codes, kind="stable")
+    sorted_rows = order if rows is None else rows[order]
+    row_totals = matrix.sum(axis=1)
+    bounds = np.concatenate(([0], np.cumsum(row_totals)))
+
+    remaining = [i for i in available if i != node.column]
+    for code in np.flatnonzero(row_totals):
+      child_rows = sorted_rows[bounds[code]:bounds[code + 1]]
+      node.children[int(code)] = self.build_node(child_rows, matrix[code], remaining, depth + 1)
+
+    return node
+
+  """
+  Método para registrar una hoja terminada y reportar el avance.
+
+  Parámetros:
+  node (Node): Hoja terminada.
+
+  Retorna:
+  Node: La misma hoja.
+  """
+  def finish_leaf(self, node: Node) -> Node:
+    self.rows_done += int(node.class_counts.sum())
+    if self.progress is not None:
+      self.progress(self.rows_done, self.rows_total)
+    return node
+
+  """
+  Método para compilar el árbol en arreglos planos. Los nodos se numeran por
+  niveles y los hijos de cada nodo ocupan posiciones consecutivas de children,
+  una por código de su columna.
+
+  Retorna:
+  CompiledTree: Árbol compilado.
+
+  Excepciones:
+  ValueError: Si el árbol todavía no se construyó.
+  """
+  def compile(self) -> CompiledTree:
+    if self.root is None:
+      raise ValueError("El árbol no se ha construido. Se debe llamar a fit primero.")
+
+    nodes = [self.root]
+    for node in nodes:
+      nodes.extend(node.children[code] for code in sorted(node.children))
+    position = {id(node): i for i, node in enumerate(nodes)}
+
+    used = sorted({node.column for node in nodes if not node.is_leaf()})
+    input_of = {column_index: i for i, column_index in enumerate(used)}
+    columns = [self.table.columns[i] for i in used]
+    class_column = self.table.columns[self.table.clase]
+
+    feature = np.full(len(nodes), -1, dtype=np.int32)
+    child_start = np.zeros(len(nodes), dtype=np.int32)
+    n_children = np.zeros(len(nodes), dtype=np.int32)
+    children = []
+    for i, node in enumerate(nodes):
+      if node.is_leaf():
+        continue
+      size = len(self.table.columns[node.column].categories)
+      feature[i] = input_of[node.column]
+      child_start[i] = len(children)
+      n_children[i] = size
+      children.extend(position[id(node.children[code])] if code in node.children else -1 for code in range(size))
+
+    def threshold(column, value):
+      numeric = column.type == ColumnType.NUMERIC and value is not None and all(isinstance(category, str) for category in column.categories)
+      return float(value) if numeric else np.nan
+
+    return CompiledTree(
+      inputs=[column.name for column in columns],
+      categories=[list(column.categories) for column in columns],
+      x1=np.array([threshold(column, column.x1) for column in columns], dtype=np.float64),
+      x2=np.array([threshold(column, column.x2) for column in columns], dtype=np.float64),
+      feature=feature,
+      child_start=child_start,
+      n_children=n_children,
+      children=np.array(children, dtype=np.int32),
+      prediction=np.array([int(np.argmax(node.class_counts)) for node in nodes], dtype=np.int32),
+      class_counts=np.array([node.class_counts for node in nodes], dtype=np.int64).reshape(len(nodes), len(class_column.categories)),
+      class_name=class_column.name,
+      class_values=list(class_column.categories),
+    )
+
+  """
+  Método para obtener una representación en texto del árbol.
+
+  Retorna:
+  str: Árbol con una línea por rama, indentado por profundidad.
+  """
+  def to_text(self) -> str:
+    if self.root is None:
+      return ""
+    class_name = self.table.columns[self.table.clase].name
+    lines = []
+
+    def walk(node: Node, indent: str):
+      if node.is_leaf():
+        lines[-1] += f" -> {class_name} = {node.prediction}"
+        return
+      column = self.table.columns[node.column]
+      for code, child in node.children.items():
+        lines.append(f"{indent}{column.name} = {column.categories[code]}")
+        walk(child, indent + "  ")
+
+    if self.root.is_leaf():
+      return f"{class_name} = {self.root.prediction}"
+    walk(self.root, "")
+    return "\n".join(lines)
+
+# Ejemplo de uso
+if __name__ == "__main__":
+  tenis_columns: List[Column] = [
+    Column("Temperatura", ["> 32", "> 32", "> 32", "25 - 32", "< 25", "< 25", "< 25", "25 - 32", "< 25", "25 - 32", "25 - 32", "25 - 32", "> 32", "25 - 32"], ColumnType.NUMERIC),
+    Column("Humedad", [3, 3, 3, 3, 2, 2, 2, 3, 2, 2, 2, 3, 2, 3], ColumnType.NOMINAL),
+    Column("Viento", [1, 3, 1, 1, 1, 3, 3, 1, 1, 1, 3, 3, 1, 3], ColumnType.NOMINAL),
+    Column("Jugar", [0, 0, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 0], ColumnType.BINARY)
+  ]
+
+  tenis_table = Table(tenis_columns)
+  tenis_table.set_clase(3, total_amount_instances=14)
+
+  tree = DecisionTree(tenis_table, max_depth=3)
+  tree.fit()
+  print(tree.to_text())
+
+  compiled = tree.compile()
+  print(compiled.predict({
+    "Temperatura": [20.0, 30.0, 35.0],
+    "Humedad": [2, 3, 2],
+    "Viento": [3, 1, 1],
+  }))
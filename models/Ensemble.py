@@ -0,0 +1,249 @@
+import sys
+import os
+import numpy as np
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Callable
+
+# Agrega el directorio principal al path de Python
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.Column import Column, ColumnType
+from models.Table import Table
+from models.DecisionTree import DecisionTree, CompiledTree
+from helpers.shared_memory import share_table, attach_table, close_arrays, release_arrays
+
+"""
+Función que ejecuta cada proceso: se conecta a la tabla en memoria compartida,
+toma una muestra bootstrap de filas y un subconjunto de atributos, y entrena un
+árbol sobre esa vista sin copiar la tabla.
+
+Parámetros:
+spec (tuple): Especificación de la tabla compartida con share_table.
+seed (np.random.SeedSequence): Semilla del árbol.
+params (dict): max_features, sample_fraction, max_depth y min_samples_split.
+
+Retorna:
+CompiledTree: Árbol compilado.
+"""
+def train_shared_tree(spec: tuple, seed: np.random.SeedSequence, params: dict) -> CompiledTree:
+  blocks, table, _ = attach_table(spec)
+  try:
+    return train_tree(table, seed, params)
+  finally:
+    del table
+    close_arrays(blocks)
+
+"""
+Función para entrenar un árbol del ensamble sobre una muestra bootstrap.
+
+Parámetros:
+table (Table): Tabla con la clase establecida.
+seed (np.random.SeedSequence): Semilla del árbol.
+params (dict): max_features, sample_fraction, max_depth y min_samples_split.
+
+Retorna:
+CompiledTree: Árbol compilado.
+"""
+def train_tree(table: Table, seed: np.random.SeedSequence, params: dict) -> CompiledTree:
+  rng = np.random.default_rng(seed)
+  total = table.total_instances()
+  rows = np.sort(rng.integers(0, total, max(1, round(total * params["sample_fraction"]))))
+  attributes = [i for i in range(len(table.columns)) if i != table.clase]
+  attributes = sorted(rng.choice(attributes, min(params["max_features"], len(attributes)), replace=False).tolist())
+  tree = DecisionTree(table, params["max_depth"], params["min_samples_split"])
+  tree.fit(rows, attributes=attributes)
+  return tree.compile()
+
+# Clase que entrena varios árboles con bagging y subespacios aleatorios y los combina por votación
+class Ensemble:
+  n_trees: int  # Cantidad de árboles
+  max_features: int | None  # Atributos que puede usar cada árbol (None para la raíz cuadrada del total)
+  sample_fraction: float  # Tamaño de cada muestra bootstrap, como proporción de las filas
+  max_depth: int | None  # Profundidad máxima de cada árbol
+  min_samples_split: int  # Cantidad mínima de filas para dividir un nodo
+  seed: int | None  # Semilla del ensamble
+  trees: List[CompiledTree]  # Árboles entrenados
+  class_values: list  # Valores de la clase (el código es la posición)
+
+  """
+  Constructor de la clase Ensemble.
+
+  Parámetros:
+  n_trees (int, opcional): Cantidad de árboles.
+  max_features (int, opcional): Atributos elegidos al azar para cada árbol. Por defecto, la
+    raíz cuadrada de la cantidad de atributos, redondeada hacia arriba.
+  sample_fraction (float, opcional): Tamaño de cada muestra bootstrap como proporción de las filas.
+  max_depth (int, opcional): Profundidad máxima de cada árbol.
+  min_samples_split (int, opcional): Cantidad mínima de filas para dividir un nodo.
+  seed (int, opcional): Semilla; con la misma semilla se obtienen los mismos árboles
+    sin importar el orden en que terminen los procesos.
+
+  Excepciones:
+  ValueError: Si algún parámetro no es válido.
+  """
+  def __init__(self, n_trees: int = 100, max_features: int = None, sample_fraction: float = 1.0,
+               max_depth: int = None, min_samples_split: int = 2, seed: int = None):
+    if n_trees < 1:
+      raise ValueError("El ensamble necesita al menos un árbol.")
+    if max_features is not None and max_features < 1:
+      raise ValueError("Cada árbol necesita al menos un atributo.")
+    if not 0 < sample_fraction <= 1:
+      raise ValueError("La proporción de la muestra debe estar entre 0 y 1.")
+    self.n_trees = n_trees
+    self.max_features = max_features
+    self.sample_fraction = sample_fraction
+    self.max_depth = max_depth
+    self.min_samples_split = min_samples_split
+    self.seed = seed
+    self.trees = []
+    self.class_values = []
+
+  """
+  Método para entrenar los árboles. Con un pool de procesos, los códigos de la
+  tabla se copian una sola vez a memoria compartida y cada proceso solo recibe
+  los nombres de los bloques, la semilla de su árbol y los parámetros.
+
+  Parámetros:
+  table (Table): Tabla con la clase ya establecida mediante set_clase.
+  executor (Executor, opcional): Pool de procesos. Si no se especifica y workers es mayor que 1,
+    se crea uno temporal.
+  workers (int, opcional): Cantidad de procesos del pool temporal. Por defecto, uno por núcleo.
+  progress (Callable, opcional): Función que recibe el avance (árboles terminados, total de árboles).
+
+  Retorna:
+  Ensemble: El mismo ensamble, ya entrenado.
+  """
+  def fit(self, table: Table, executor: Executor = None, workers: int = None, progress: Callable = None) -> "Ensemble":
+    attributes = len(table.columns) - 1
+    params = {
+      "max_features": self.max_features or max(1, int(np.ceil(np.sqrt(attributes)))),
+      "sample_fraction": self.sample_fraction,
+      "max_depth": self.max_depth,
+      "min_samples_split": self.min_samples_split,
+    }
+    seeds = np.random.SeedSequence(self.seed).spawn(self.n_trees)
+    self.class_values = list(table.columns[table.clase].categories)
+    workers = workers or os.cpu_count() or 1
+
+    if executor is None and workers <= 1:
+      self.trees = []
+      for done, seed in enumerate(seeds, start=1):
+        self.trees.append(train_tree(table, seed, params))
+        if progress is not None:
+          progress(done, self.n_trees)
+      return self
+
+    own_executor = executor is None
+    if own_executor:
+      executor = ProcessPoolExecutor(max_workers=min(workers, self.n_trees))
+    blocks, spec = share_table(table)
+    futures = []
+    try:
+      futures = [executor.submit(train_shared_tree, spec, seed, params) for seed in seeds]
+      self.trees = []
+      for done, future in enumerate(futures, start=1):
+        self.trees.append(future.result())
+        if progress is not None:
+          progress(done, self.n_trees)
+    finally:
+      for future in futures:
+        future.cancel()
+      if own_executor:
+        executor.shutdown(wait=True, cancel_futures=True)
+      release_arrays(blocks)
+    return self
+
+  """
+  Método para contar los votos de cada clase a partir de columnas codificadas por nombre.
+  Cada entrada se codifica una sola vez y se comparte entre todos los árboles.
+
+  Parámetros:
+  encoded (dict): Códigos de cada entrada por nombre, con las categorías de entrenamiento.
+  rows (int): Cantidad de filas.
+
+  Retorna:
+  np.ndarray: Matriz de votos (filas x clases).
+  """
+  def count_votes(self, encoded: dict, rows: int) -> np.ndarray:
+    votes = np.zeros(rows * len(self.class_values), dtype=np.int64)
+    offsets = np.arange(rows) * len(self.class_values)
+    for tree in self.trees:
+      matrix = np.stack([encoded[name] for name in tree.inputs]) if tree.inputs else np.empty((0, rows), dtype=np.intp)
+      votes += np.bincount(offsets + tree.predict_codes(matrix), minlength=len(votes))
+    return votes.reshape(rows, len(self.class_values))
+
+  """
+  Método para codificar datos nuevos una sola vez para todos los árboles.
+
+  Parámetros:
+  data (dict): Valores de cada columna por nombre.
+
+  Retorna:
+  tuple: Diccionario con los códigos de cada entrada y cantidad de filas.
+
+  Excepciones:
+  ValueError: Si el ensamble no se ha entrenado.
+  """
+  def encode(self, data: dict) -> tuple:
+    if not self.trees:
+      raise ValueError("El ensamble no se ha entrenado. Se debe llamar a fit primero.")
+    encoded = {}
+    for tree in self.trees:
+      for i, name in enumerate(tree.inputs):
+        if name not in encoded:
+          encoded[name] = tree.encode_input(i, data[name])
+    rows = len(next(iter(encoded.values()))) if encoded else len(next(iter(data.values()), []))
+    return encoded, rows
+
+  """
+  Método para predecir la clase de datos nuevos por mayoría de votos.
+  En caso de empate gana el primer valor de la clase.
+
+  Parámetros:
+  data (dict): Valores de cada columna por nombre.
+
+  Retorna:
+  np.ndarray: Valor de la clase predicha para cada fila.
+  """
+  def predict(self, data: dict) -> np.ndarray:
+    encoded, rows = self.encode(data)
+    return np.asarray(self.class_values)[self.count_votes(encoded, rows).argmax(axis=1)]
+
+  """
+  Método para predecir la clase de las filas de una tabla ya codificada.
+
+  Parámetros:
+  columns (List[Column]): Columnas con los nombres de las entradas.
+
+  Retorna:
+  np.ndarray: Código de la clase predicha para cada fila.
+  """
+  def predict_columns(self, columns: List[Column]) -> np.ndarray:
+    if not self.trees:
+      raise ValueError("El ensamble no se ha entrenado. Se debe llamar a fit primero.")
+    by_name = {column.name: column for column in columns}
+    encoded = {}
+    for tree in self.trees:
+      for i, name in enumerate(tree.inputs):
+        if name not in encoded:
+          index = {value: code for code, value in enumerate(tree.categories[i])}
+          remap = np.array([tree.encode_value(i, value, index) for value in by_name[name].categories], dtype=np.intp)
+          encoded[name] = remap[by_name[name].codes] if len(remap) else np.zeros(0, dtype=np.intp)
+    rows = len(columns[0].codes) if columns else 0
+    return self.count_votes(encoded, rows).argmax(axis=1)
+
+# Ejemplo de uso
+if __name__ == "__main__":
+  tenis_columns: List[Column] = [
+    Column("Temperatura", ["> 32", "> 32", "> 32", "25 - 32", "< 25", "< 25", "< 25", "25 - 32", "< 25", "25 - 32", "25 - 32", "25 - 32", "> 32", "25 - 32"], ColumnType.NUMERIC),
+    Column("Humedad", [3, 3, 3, 3, 2, 2, 2, 3, 2, 2, 2, 3, 2, 3], ColumnType.NOMINAL),
+    Column("Viento", [1, 3, 1, 1, 1, 3, 3, 1, 1, 1, 3, 3, 1, 3], ColumnType.NOMINAL),
+    Column("Jugar", [0, 0, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 0], ColumnType.BINARY)
+  ]
+
+  tenis_table = Table(tenis_columns)
+  tenis_table.set_clase(3, total_amount_instances=14)
+
+  ensemble = Ensemble(n_trees=25, seed=4).fit(tenis_table, workers=2)
+  predicted = ensemble.predict_columns(tenis_columns)
+  accuracy = np.mean(predicted == tenis_columns[3].codes)
+  print(f"{len(ensemble.trees)} árboles; exactitud sobre el entrenamiento: {accuracy:.4f}")
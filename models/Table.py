@@ -1,16 +1,152 @@
 import sys
 import os
 import math
-from typing import List
+import numpy as np
+from concurrent.futures import Executor
+from typing import List, Callable
 
 # Agrega el directorio principal al path de Python
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from models.Column import Column, ColumnType
+from models.Column import Column, ColumnType, round_between
+from helpers.shared_memory import share_arrays, attach_arrays, close_arrays, release_arrays
+from helpers.instrumentation import span, count
+
+CHUNK_ROWS = 1 << 16  # Filas procesadas por bloque al contar todas las columnas a la vez
+MAX_THRESHOLD_CANDIDATES = 512  # Cortes evaluados como máximo al buscar x1 y x2
+XLOG2X_LIMIT = 1 << 20  # Tamaño máximo de la tabla de c * log2(c) (8 MB)
+GAIN_TOLERANCE = 1e-12  # Diferencias menores se consideran ruido de redondeo y se tratan como 0
+
+xlog2x_table = np.zeros(1)  # c * log2(c) para c = 0, 1, 2, ...; crece según se necesita
+
+"""
+Función para obtener la tabla de c * log2(c) con al menos size valores.
+La tabla crece al doble cada vez, hasta XLOG2X_LIMIT, y se conserva entre llamadas.
+
+Parámetros:
+size (int): Cantidad mínima de valores.
+
+Retorna:
+np.ndarray: Tabla de c * log2(c) para c = 0, 1, 2, ...
+"""
+def get_xlog2x_table(size: int) -> np.ndarray:
+  global xlog2x_table
+  if len(xlog2x_table) < size:
+    values = np.arange(min(max(size, 2 * len(xlog2x_table)), XLOG2X_LIMIT), dtype=np.float64)
+    values[1:] *= np.log2(values[1:])
+    xlog2x_table = values
+  return xlog2x_table
+
+"""
+Función para calcular c * log2(c) sobre un arreglo de conteos, con 0 * log2(0) = 0.
+Los conteos enteros se buscan en una tabla precalculada; solo los mayores que
+XLOG2X_LIMIT y los flotantes se calculan con el logaritmo. Los conteos negativos
+se tratan como 0.
+
+Parámetros:
+counts (np.ndarray): Arreglo de conteos.
+
+Retorna:
+np.ndarray: Arreglo de flotantes con c * log2(c) para cada conteo.
+"""
+def xlog2x(counts: np.ndarray) -> np.ndarray:
+  counts = np.asarray(counts)
+  if counts.dtype.kind not in "iub" or counts.size == 0:
+    counts = counts.astype(np.float64)
+    return counts * np.log2(counts, out=np.zeros_like(counts), where=counts > 0)
+
+  if counts.min() < 0:
+    counts = np.maximum(counts, 0)
+  largest = int(counts.max())
+  table = get_xlog2x_table(largest + 1)
+  if largest < len(table):
+    return table[counts]
+  # Conteos fuera de la tabla: se calculan directamente
+  result = np.empty(counts.shape)
+  small = counts < len(table)
+  result[small] = table[counts[small]]
+  large = counts[~small].astype(np.float64)
+  result[~small] = large * np.log2(large)
+  return result
+
+"""
+Función para calcular c * log2(c) de un solo conteo, sin pasar por NumPy.
+
+Parámetros:
+count (int): Conteo.
+
+Retorna:
+float: c * log2(c), o 0 si el conteo no es positivo.
+"""
+def xlog2x_value(count: int) -> float:
+  return count * math.log2(count) if count > 0 else 0.0
+
+"""
+Función para calcular la entropía a partir de conteos enteros, como
+log2(N) - sum(c * log2(c)) / N = (N log2 N - sum(c log2 c)) / N, usando la tabla
+de c * log2(c). Con una matriz se calcula la entropía de cada fila a la vez.
+
+Parámetros:
+counts (np.ndarray): Vector de conteos, o matriz con un vector por fila.
+
+Retorna:
+float | np.ndarray: Entropía del vector (0 si no hay conteos), o de cada fila de la matriz.
+"""
+def entropy(counts: np.ndarray) -> float | np.ndarray:
+  counts = np.asarray(counts)
+  totals = counts.sum(axis=-1)
+  safe_totals = np.maximum(totals, 1)
+  result = (xlog2x(totals) - xlog2x(counts).sum(axis=-1)) / safe_totals
+  result = np.where(totals > 0, result, 0.0)
+  return float(result) if result.ndim == 0 else result
+
+"""
+Función que ejecuta cada proceso del modo paralelo: se conecta a los códigos en
+memoria compartida y cuenta las matrices valor x clase de un lote de columnas.
+
+Parámetros:
+specs (list[tuple]): Especificaciones de memoria compartida de los códigos del lote,
+  seguidos por los de la clase y, si hay, los índices de filas.
+categories (list[list]): Categorías de cada columna del lote, seguidas por las de la clase.
+has_rows (bool): Indica si la última especificación corresponde a los índices de filas.
+
+Retorna:
+list[np.ndarray]: Matriz de conteos de cada columna del lote.
+"""
+def count_shared_contingencies(specs: list, categories: list, has_rows: bool) -> list[np.ndarray]:
+  blocks, arrays = attach_arrays(specs)
+  try:
+    return count_contingencies(arrays, categories, has_rows)
+  finally:
+    del arrays
+    close_arrays(blocks)
+
+"""
+Función para contar las matrices valor x clase de un lote de columnas a partir
+de sus códigos, con una tabla temporal que no copia los arreglos.
+
+Parámetros:
+arrays (list[np.ndarray]): Códigos de cada columna del lote, seguidos por los de la clase y,
+  si hay, los índices de filas.
+categories (list[list]): Categorías de cada columna del lote, seguidas por las de la clase.
+has_rows (bool): Indica si el último arreglo corresponde a los índices de filas.
+
+Retorna:
+list[np.ndarray]: Matriz de conteos de cada columna del lote.
+"""
+def count_contingencies(arrays: list[np.ndarray], categories: list, has_rows: bool) -> list[np.ndarray]:
+  rows = arrays.pop() if has_rows else None
+  columns = [Column.from_codes(str(i), codes, values, ColumnType.NOMINAL) for i, (codes, values) in enumerate(zip(arrays, categories))]
+  table = Table(columns)
+  table.clase = len(columns) - 1
+  return table.get_all_contingencies(list(range(len(columns) - 1)), rows)
 
 class Table:
   columns: List[Column]
   clase: int  # Índice de la clase de las columnas
   total_amount_instances: int
+  live_counts: dict  # Matriz valor x clase vigente de cada columna, mantenida con cada edición
+  live_class_counts: np.ndarray  # Conteo vigente de cada categoría de la clase
+  live_state: tuple | None  # Clase y versiones de las columnas con las que se calcularon los conteos vigentes
 
   """
   Constructor de la clase Table.
@@ -20,6 +156,7 @@ class Table:
   """
   def __init__(self, columns: List[Column]):
     self.columns = columns
+    self.live_state = None
 
   """
   Método para establecer la columna de clase y la cantidad total de instancias.
@@ -43,9 +180,69 @@ class Table:
     
     if column.type == ColumnType.BINARY:
       self.clase = column_index
+      # Las columnas numéricas sin agrupar se ajustan a la nueva clase; si los
+      # umbrales no cambian, se conservan los códigos y los conteos vigentes
+      for i, other in enumerate(self.columns):
+        if other.values is not None and i != column_index:
+          thresholds = self.find_best_thresholds(i)
+          if thresholds is not None and thresholds != (other.x1, other.x2):
+            other.set_thresholds(*thresholds)
     else:
       raise TypeError(f"El tipo de columna {self.columns[column_index].name} no es BINARY. No se puede establecer como clase.")
 
+  """
+  Método para encontrar los umbrales x1 y x2 que maximizan la ganancia de una
+  columna numérica sin agrupar. Las mediciones se ordenan una sola vez y los
+  conteos acumulados de la clase en cada corte permiten evaluar cada par de
+  cortes en tiempo constante.
+
+  Parámetros:
+  column_index (int): Índice de la columna numérica sin agrupar.
+  rows (np.ndarray, opcional): Índices de las filas con las que se ajustan los umbrales.
+    Si no se especifica, se usan todas.
+
+  Retorna:
+  tuple | None: Tupla con los valores x1 y x2, o None si las filas tienen un solo valor distinto.
+  """
+  def find_best_thresholds(self, column_index: int, rows: np.ndarray = None) -> tuple | None:
+    column = self.columns[column_index]
+    class_column = self.columns[self.clase]
+    class_size = len(class_column.categories)
+
+    values = column.values if rows is None else column.values[rows]
+    class_codes = class_column.codes if rows is None else class_column.codes[rows]
+    order = np.argsort(values, kind="stable")
+    values = values[order]
+    class_codes = class_codes[order]
+
+    # Solo se puede cortar entre dos mediciones distintas
+    cuts = np.flatnonzero(values[1:] != values[:-1]) + 1
+    if len(cuts) == 0:
+      return None
+    if len(cuts) > MAX_THRESHOLD_CANDIDATES:
+      cuts = np.unique(cuts[np.linspace(0, len(cuts) - 1, MAX_THRESHOLD_CANDIDATES).round().astype(np.intp)])
+
+    # Conteos de cada clase antes de cada corte
+    cumulative = np.empty((len(cuts), class_size), dtype=np.int64)
+    for c in range(class_size):
+      cumulative[:, c] = np.cumsum(class_codes == c)[cuts - 1]
+    totals = np.bincount(class_codes, minlength=class_size)
+
+    # Suma de particiones (sin dividir entre N) para cada par de cortes i < j
+    def weighted(counts):
+      return xlog2x(counts.sum(axis=-1)) - xlog2x(counts).sum(axis=-1)
+    low = cumulative[:, None, :]
+    middle = cumulative[None, :, :] - low
+    high = totals - cumulative[None, :, :]
+    scores = weighted(low) + weighted(middle) + weighted(high)
+    scores[np.tril_indices(len(cuts))] = np.inf
+
+    thresholds = [round_between(float(values[cut - 1]), float(values[cut])) for cut in cuts]
+    if len(cuts) == 1:
+      return thresholds[0], float(values[-1])
+    i, j = np.unravel_index(np.argmin(scores), scores.shape)
+    return thresholds[i], thresholds[j]
+
   """
   Método para obtener el número total de instancias en la tabla.
   
@@ -53,7 +250,31 @@ class Table:
   int: Número total de instancias.
   """
   def total_instances(self) -> int:
-    return len(self.columns[0].instances)
+    return len(self.columns[0].codes)
+
+  """
+  Método para obtener una copia de la tabla que se puede leer desde otro hilo
+  mientras se sigue editando la original. Se copian los códigos, las categorías,
+  las mediciones y los conteos vigentes, y se conserva la clase sin volver a
+  ajustar los umbrales.
+
+  Retorna:
+  Table: Copia de la tabla.
+  """
+  def snapshot(self) -> "Table":
+    columns = [
+      Column.from_codes(column.name, column.codes.copy(), list(column.categories), column.type, column.x1, column.x2,
+                        None if column.values is None else column.values.copy())
+      for column in self.columns
+    ]
+    table = Table(columns)
+    if getattr(self, "clase", None) is not None:
+      table.clase = self.clase
+      if self.is_live():
+        table.live_counts = {i: matrix.copy() for i, matrix in self.live_counts.items()}
+        table.live_class_counts = self.live_class_counts.copy()
+        table.live_state = (self.clase, [(column, column.version) for column in columns])
+    return table
 
   """
   Método para obtener las instancias posibles de una columna específica.
@@ -65,12 +286,34 @@ class Table:
   list[int] | list[str]: Lista de instancias posibles de la columna.
   """
   def get_possible_instances(self, column_index: int) -> list[int] | list[str]:
-    lst = []
-    for i in self.columns[column_index].instances:
-      if 0 == lst.count(i):
-        lst.append(i)
-    lst.sort()
-    return lst
+    column = self.columns[column_index]
+    # Las categorías ya están ordenadas; solo se omiten las que no aparecen
+    present = np.bincount(column.codes, minlength=len(column.categories)) > 0
+    return [value for value, used in zip(column.categories, present) if used]
+
+  """
+  Método para obtener la matriz de conteos valor x clase de una columna específica.
+  Combina el código del valor y el de la clase en un solo entero y los cuenta
+  con una sola llamada a bincount.
+
+  Parámetros:
+  column_index (int): Índice de la columna.
+  rows (np.ndarray, opcional): Índices de las filas a contar. Si no se especifica, se cuentan todas.
+
+  Retorna:
+  np.ndarray: Matriz de conteos con una fila por categoría de la columna y una
+  columna por categoría de la clase.
+  """
+  def get_contingency(self, column_index: int, rows: np.ndarray = None) -> np.ndarray:
+    column = self.columns[column_index]
+    class_column = self.columns[self.clase]
+    class_size = len(class_column.categories)
+    selection = slice(None) if rows is None else rows
+    with span("contingency"):
+      combined = column.codes[selection].astype(np.intp) * class_size + class_column.codes[selection]
+      counts = np.bincount(combined, minlength=len(column.categories) * class_size)
+    count("rows_scanned", len(combined))
+    return counts.reshape(len(column.categories), class_size)
 
   """
   Método para obtener las particiones de una columna específica.
@@ -82,23 +325,17 @@ class Table:
   list[list[int]]: Lista de particiones de la columna.
   """
   def get_partitions(self, column_index: int) -> list[list[int]]:
-    lst = self.get_possible_instances(column_index)
-    class_lst = self.get_possible_instances(self.clase)
+    class_counts = np.bincount(self.columns[self.clase].codes, minlength=len(self.columns[self.clase].categories))
     
     if column_index == self.clase:
-      value_counts = [self.columns[column_index].instances.count(value) for value in lst]
-      return value_counts
-    
-    partitions = [[0] * len(class_lst) for _ in range(len(lst))]
-
-    for i in range(len(self.columns[column_index].instances)):
-      column_value = self.columns[column_index].instances[i]
-      class_value = self.columns[self.clase].instances[i]
-      col_index = lst.index(column_value)
-      class_index = class_lst.index(class_value)
-      partitions[col_index][class_index] += 1
+      return class_counts[class_counts > 0].tolist()
     
-    return partitions
+    # Se descartan las categorías que ya no aparecen en los datos
+    with span("get_partitions"):
+      partitions = self.get_contingency(column_index)
+      partitions = partitions[partitions.sum(axis=1) > 0][:, class_counts > 0]
+    count("partitions_built", len(partitions))
+    return partitions.tolist()
 
   """
   Método para calcular la entropía de una lista de particiones.
@@ -110,14 +347,14 @@ class Table:
   float: Valor de la entropía calculada.
   """
   def calculate_entropy(self, partitions: list[int] | list[str]) -> float:
-    res = 0.0
+    count("entropy_evaluations")
+    if isinstance(partitions, np.ndarray):
+      return entropy(partitions)
+    # Con listas pequeñas es más rápido sumar en Python que crear arreglos de NumPy
     total_instances = sum(partitions)
-    for p in partitions:
-      if total_instances != 0:
-        div = p / total_instances
-        if div > 0:
-          res += -div * math.log(div, 2)
-    return res
+    if total_instances == 0:
+      return 0.0
+    return (xlog2x_value(total_instances) - sum(map(xlog2x_value, partitions))) / total_instances
 
   """
   Método para calcular la ganancia de información de una columna específica.
@@ -137,7 +374,12 @@ class Table:
     for i in column_partitions:
       partitions_sum += (sum(i) / self.total_instances()) * self.calculate_entropy(i)
 
+    # Mismo tratamiento del ruido de redondeo que calculate_all_gains
+    if abs(partitions_sum) < GAIN_TOLERANCE:
+      partitions_sum = 0.0
     res = class_entropy - partitions_sum
+    if res < GAIN_TOLERANCE:
+      res = 0.0
 
     return {
       "Entropía general": f"{class_entropy:.4f}",
@@ -145,18 +387,301 @@ class Table:
       "Ganancia": f"{res:.4f}"
     }
 
+  """
+  Método para obtener las matrices valor x clase de varias columnas en un solo recorrido.
+  Los códigos de la clase se leen una sola vez por bloque de filas y se comparten
+  entre todas las columnas; cada columna ocupa su propio rango dentro de un único
+  bincount.
+
+  Parámetros:
+  column_indices (list[int]): Índices de las columnas.
+  rows (np.ndarray, opcional): Índices de las filas a contar. Si no se especifica, se cuentan todas.
+  executor (Executor, opcional): Pool de procesos para repartir las columnas. Si no se
+    especifica, se cuenta en el proceso actual.
+  progress (Callable, opcional): Función que recibe el avance (hechos, total) después de
+    cada bloque; si lanza una excepción, el conteo se detiene.
+
+  Retorna:
+  list[np.ndarray]: Matriz de conteos de cada columna, en el mismo orden.
+  """
+  def get_all_contingencies(self, column_indices: list[int], rows: np.ndarray = None, executor: Executor = None, progress: Callable = None) -> list[np.ndarray]:
+    count("rows_scanned", (self.total_instances() if rows is None else len(rows)) * len(column_indices))
+    if executor is not None and len(column_indices) > 1:
+      return self.get_all_contingencies_parallel(column_indices, rows, executor, progress)
+
+    class_column = self.columns[self.clase]
+    class_size = len(class_column.categories)
+    sizes = [len(self.columns[i].categories) * class_size for i in column_indices]
+    offsets = np.cumsum([0] + sizes)
+    counts = np.zeros(offsets[-1], dtype=np.int64)
+
+    total = self.total_instances() if rows is None else len(rows)
+    with span("contingencies"):
+      for start in range(0, total, CHUNK_ROWS):
+        stop = min(start + CHUNK_ROWS, total)
+        selection = slice(start, stop) if rows is None else rows[start:stop]
+        combined = np.empty((len(column_indices), stop - start), dtype=np.intp)
+        for j, column_index in enumerate(column_indices):
+          np.multiply(self.columns[column_index].codes[selection], class_size, out=combined[j], casting="unsafe")
+          combined[j] += offsets[j]
+        combined += class_column.codes[selection]
+        counts += np.bincount(combined.ravel(), minlength=offsets[-1])
+        if progress is not None:
+          progress(stop, total)
+
+    return [
+      counts[offsets[j]:offsets[j + 1]].reshape(len(self.columns[i].categories), class_size)
+      for j, i in enumerate(column_indices)
+    ]
+
+  """
+  Método para repartir el conteo de las matrices valor x clase entre los procesos
+  de un pool. Los códigos se pasan a los procesos por memoria compartida en lugar
+  de serializarlos, y los resultados se reúnen en el orden de las columnas, por lo
+  que son idénticos a los del conteo en serie.
+
+  Parámetros:
+  column_indices (list[int]): Índices de las columnas.
+  rows (np.ndarray | None): Índices de las filas a contar (None para todas).
+  executor (Executor): Pool de procesos.
+  progress (Callable, opcional): Función que recibe el avance (lotes terminados, total de lotes).
+
+  Retorna:
+  list[np.ndarray]: Matriz de conteos de cada columna, en el mismo orden.
+  """
+  def get_all_contingencies_parallel(self, column_indices: list[int], rows: np.ndarray | None, executor: Executor, progress: Callable = None) -> list[np.ndarray]:
+    class_column = self.columns[self.clase]
+    extra = [class_column.codes] + ([] if rows is None else [np.asarray(rows, dtype=np.intp)])
+    blocks, specs = share_arrays([self.columns[i].codes for i in column_indices] + extra)
+    futures = []
+    try:
+      # Varios lotes por núcleo para equilibrar la carga entre procesos
+      batches = np.array_split(np.arange(len(column_indices)), min(len(column_indices), (os.cpu_count() or 1) * 4))
+      for batch in batches:
+        batch_specs = [specs[j] for j in batch] + specs[len(column_indices):]
+        batch_categories = [self.columns[column_indices[j]].categories for j in batch] + [class_column.categories]
+        futures.append(executor.submit(count_shared_contingencies, batch_specs, batch_categories, rows is not None))
+      results = []
+      for done, future in enumerate(futures, start=1):
+        results.extend(future.result())
+        if progress is not None:
+          progress(done, len(futures))
+      return results
+    finally:
+      for future in futures:
+        future.cancel()
+      release_arrays(blocks)
+
+  """
+  Método para saber si los conteos vigentes corresponden a la clase y a las
+  columnas actuales. Cualquier cambio hecho directamente sobre una columna
+  cambia su versión y los invalida.
+
+  Retorna:
+  bool: True si los conteos vigentes se pueden usar.
+  """
+  def is_live(self) -> bool:
+    if self.live_state is None or self.live_state[0] != self.clase or len(self.live_state[1]) != len(self.columns):
+      return False
+    return all(column is known and column.version == version for column, (known, version) in zip(self.columns, self.live_state[1]))
+
+  """
+  Método para recalcular los conteos vigentes con un recorrido completo, solo si
+  ya no son válidos.
+
+  Parámetros:
+  executor (Executor, opcional): Pool de procesos para contar las columnas en paralelo.
+  progress (Callable, opcional): Función que recibe el avance del recorrido.
+  """
+  def update_live_counts(self, executor: Executor = None, progress: Callable = None):
+    if self.is_live():
+      return
+    attributes = [i for i in range(len(self.columns)) if i != self.clase]
+    class_column = self.columns[self.clase]
+    self.live_class_counts = np.bincount(class_column.codes, minlength=len(class_column.categories))
+    self.live_counts = dict(zip(attributes, self.get_all_contingencies(attributes, None, executor, progress)))
+    self.live_state = (self.clase, [(column, column.version) for column in self.columns])
+
+  """
+  Método para cambiar el valor de una celda y actualizar los conteos vigentes
+  en tiempo constante: se resta uno a la casilla valor x clase anterior y se
+  suma uno a la nueva. Si la celda es de la clase, se actualiza una casilla por
+  columna.
+
+  Parámetros:
+  row (int): Índice de la fila.
+  column_index (int): Índice de la columna.
+  value (Union[int, str]): Nuevo valor de la celda.
+  """
+  def set_value(self, row: int, column_index: int, value):
+    live = getattr(self, "clase", None) is not None and self.is_live()
+    column = self.columns[column_index]
+    old_code = int(column.codes[row])
+    size = len(column.categories)
+    column.set_instance(row, value)
+    if not live:
+      return
+
+    new_code = int(column.codes[row])
+    is_class = column_index == self.clase
+    if len(column.categories) > size:
+      # Se insertó una categoría en la posición new_code y se desplazaron las mayores
+      if old_code >= new_code:
+        old_code += 1
+      if is_class:
+        self.live_class_counts = np.insert(self.live_class_counts, new_code, 0)
+        for i in self.live_counts:
+          self.live_counts[i] = np.insert(self.live_counts[i], new_code, 0, axis=1)
+      else:
+        self.live_counts[column_index] = np.insert(self.live_counts[column_index], new_code, 0, axis=0)
+
+    if is_class:
+      self.live_class_counts[old_code] -= 1
+      self.live_class_counts[new_code] += 1
+      for i, matrix in self.live_counts.items():
+        code = self.columns[i].codes[row]
+        matrix[code, old_code] -= 1
+        matrix[code, new_code] += 1
+    else:
+      class_code = self.columns[self.clase].codes[row]
+      matrix = self.live_counts[column_index]
+      matrix[old_code, class_code] -= 1
+      matrix[new_code, class_code] += 1
+
+    self.live_state = (self.clase, [(column, column.version) for column in self.columns])
+
+  """
+  Método para llenar columnas completas con valores al azar de una sola vez.
+  Cada columna elige entre los valores de Column.get_domain con un generador de
+  NumPy, así que el resultado se puede repetir con la misma semilla.
+
+  Parámetros:
+  seed (int, opcional): Semilla del generador. Si no se especifica, el resultado es distinto cada vez.
+  probabilities (dict, opcional): Probabilidad de cada valor por columna, en la forma
+  {índice de columna: {valor: probabilidad}}. Los valores que no aparecen tienen
+  probabilidad 0 y las probabilidades se normalizan. Las columnas que no aparecen
+  usan la misma probabilidad para todos sus valores.
+  column_indices (list[int], opcional): Columnas a llenar. Si no se especifica, se llenan todas.
+
+  Excepciones:
+  ValueError: Si alguna probabilidad no es válida.
+  """
+  def generate_random_instances(self, seed: int = None, probabilities: dict = None, column_indices: list[int] = None):
+    rng = np.random.default_rng(seed)
+    probabilities = probabilities or {}
+    if column_indices is None:
+      column_indices = list(range(len(self.columns)))
+
+    for column_index in column_indices:
+      column = self.columns[column_index]
+      domain = column.get_domain()
+      weights = None
+      if column_index in probabilities:
+        labels = [str(value) for value in domain]
+        weights = np.zeros(len(domain))
+        for value, probability in probabilities[column_index].items():
+          if str(value) not in labels:
+            raise ValueError(f"El valor {value} no es válido para la columna {column.name}.")
+          if probability < 0:
+            raise ValueError("Las probabilidades no pueden ser negativas.")
+          weights[labels.index(str(value))] = probability
+        if weights.sum() <= 0:
+          raise ValueError(f"Las probabilidades de la columna {column.name} deben sumar más de 0.")
+        weights /= weights.sum()
+      positions = rng.choice(len(domain), size=len(column.codes), p=weights)
+      column.set_domain_positions(positions)
+
+  """
+  Método para calcular la ganancia de información de todas las columnas a la vez.
+  La distribución y la entropía de la clase se calculan una sola vez. Sin filas
+  específicas se usan los conteos vigentes, que se mantienen con set_value.
+
+  Parámetros:
+  rows (np.ndarray, opcional): Índices de las filas a evaluar. Si no se especifica, se usan todas.
+  column_indices (list[int], opcional): Columnas a evaluar. Por defecto, todas excepto la clase.
+  executor (Executor, opcional): Pool de procesos para evaluar las columnas en paralelo.
+  progress (Callable, opcional): Función que recibe el avance del conteo.
+
+  Retorna:
+  dict: Diccionario con los índices de las columnas evaluadas ("indices"), la
+  entropía general ("entropy"), los conteos de la clase ("class_counts"), las
+  matrices valor x clase ("contingencies"), y los arreglos con la suma de
+  particiones ("partitions_sum") y la ganancia ("gains") de cada columna.
+  """
+  def calculate_all_gains(self, rows: np.ndarray = None, column_indices: list[int] = None, executor: Executor = None, progress: Callable = None) -> dict:
+    if column_indices is None:
+      column_indices = [i for i in range(len(self.columns)) if i != self.clase]
+
+    if rows is None:
+      # Con todas las filas se usan los conteos vigentes, sin volver a recorrer los datos
+      self.update_live_counts(executor, progress)
+      class_counts = self.live_class_counts.copy()
+      contingencies = [self.live_counts[i].copy() for i in column_indices]
+    else:
+      class_counts = np.bincount(self.columns[self.clase].codes[rows], minlength=len(self.columns[self.clase].categories))
+      contingencies = self.get_all_contingencies(column_indices, rows, executor, progress)
+    total = int(class_counts.sum())
+    class_entropy = self.calculate_entropy(class_counts)
+
+    # Suma ponderada de entropías: sum(T/N * H(fila)) = (sum(T log2 T) - sum(c log2 c)) / N.
+    # Las filas de todas las matrices se evalúan juntas y se suman por columna.
+    partitions_sum = np.zeros(len(column_indices))
+    with span("partition_entropies"):
+      if total > 0 and contingencies:
+        stacked = np.concatenate(contingencies)
+        starts = np.cumsum([0] + [len(matrix) for matrix in contingencies[:-1]])
+        partitions_sum = np.add.reduceat(xlog2x(stacked.sum(axis=1)) - xlog2x(stacked).sum(axis=1), starts) / total
+    count("entropy_evaluations", sum(len(matrix) for matrix in contingencies))
+
+    # La fórmula cerrada deja ruido de redondeo (±1e-16); la ganancia nunca es
+    # negativa, y una ganancia de ruido no debe ganar una división ni mostrarse como "-0.0000"
+    partitions_sum = np.where(np.abs(partitions_sum) < GAIN_TOLERANCE, 0.0, partitions_sum)
+    gains = class_entropy - partitions_sum
+    gains = np.where(gains < GAIN_TOLERANCE, 0.0, gains)
+
+    return {
+      "indices": np.array(column_indices, dtype=np.intp),
+      "entropy": class_entropy,
+      "class_counts": class_counts,
+      "contingencies": contingencies,
+      "partitions_sum": partitions_sum,
+      "gains": gains
+    }
+
   """
   Método para obtener todas las ganancias de información de las columnas.
+  Es una vista con texto formateado de calculate_all_gains.
+
+  Parámetros:
+  rows (np.ndarray, opcional): Índices de las filas a evaluar. Si no se especifica, se usan todas.
+  executor (Executor, opcional): Pool de procesos para evaluar las columnas en paralelo.
+  progress (Callable, opcional): Función que recibe el avance del conteo.
   
   Retorna:
   list: Lista de diccionarios con los resultados de las ganancias de información.
   """
-  def get_all_calculations(self) -> list:
+  def get_all_calculations(self, rows: np.ndarray = None, executor: Executor = None, progress: Callable = None) -> list:
+    return self.format_calculations(self.calculate_all_gains(rows=rows, executor=executor, progress=progress))
+
+  """
+  Método para dar formato de texto a los resultados de calculate_all_gains.
+
+  Parámetros:
+  calculations (dict): Resultado de calculate_all_gains.
+
+  Retorna:
+  list: Lista de diccionarios con los resultados de las ganancias de información.
+  """
+  def format_calculations(self, calculations: dict) -> list:
+    class_entropy = calculations["entropy"]
+
     results = []
-    for i in range(len(self.columns)):
-      if i != self.clase:
-        result_dict = self.calculate_return(i)
-        results.append(result_dict)
+    for partitions_sum, gain in zip(calculations["partitions_sum"], calculations["gains"]):
+      results.append({
+        "Entropía general": f"{class_entropy:.4f}",
+        "Suma de particiones": f"{partitions_sum:.4f}",
+        "Ganancia": f"{gain:.4f}"
+      })
 
     return results
 
@@ -0,0 +1,47 @@
+import sys
+import os
+
+# Agrega el directorio principal al path de Python
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.Column import Column, ColumnType, parse_numeric_value
+from models.Table import Table
+
+def test_constant_raw_column_has_parseable_labels():
+  """
+  Una columna numérica sin agrupar con un solo valor distinto debe tener
+  umbrales distintos y etiquetas que se puedan interpretar.
+  """
+  column = Column("Temperatura", [5, 5, 5, 5], ColumnType.NUMERIC)
+  assert column.x1 < column.x2
+  for label in column.get_numeric_labels():
+    parse_numeric_value(label)
+  assert column.categories == ["5 - 6"]
+
+def test_constant_raw_column_accepts_every_label():
+  """
+  Elegir cualquier etiqueta del dominio en una fila no debe lanzar excepciones
+  y debe mover la medición al rango elegido.
+  """
+  column = Column("Temperatura", [5.0, 5.0, 5.0], ColumnType.NUMERIC)
+  table = Table([column, Column("Jugar", [0, 1, 1], ColumnType.BINARY)])
+  table.set_clase(1, total_amount_instances=3)
+  for row, label in enumerate(column.get_domain()):
+    table.set_value(row, 0, label)
+    assert column.instances[row] == label
+
+def test_repeated_set_clase_keeps_live_counts():
+  """
+  Volver a establecer la misma clase no debe cambiar los umbrales ya ajustados
+  ni descartar los conteos vigentes.
+  """
+  columns = [
+    Column("Temperatura", [18.0, 21.5, 27.0, 30.0, 33.5, 35.0], ColumnType.NUMERIC),
+    Column("Jugar", [1, 1, 1, 0, 0, 0], ColumnType.BINARY),
+  ]
+  table = Table(columns)
+  table.set_clase(1, total_amount_instances=6)
+  table.update_live_counts()
+  version = columns[0].version
+  table.set_clase(1, total_amount_instances=6)
+  assert columns[0].version == version
+  assert table.is_live()
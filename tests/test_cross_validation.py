@@ -0,0 +1,27 @@
+import sys
+import os
+import numpy as np
+
+# Agrega el directorio principal al path de Python
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.Column import Column, ColumnType
+from models.Table import Table
+from models.CrossValidation import cross_validate
+
+def test_raw_thresholds_do_not_leak_test_labels():
+  """
+  Con una clase aleatoria, la exactitud promedio de la validación cruzada debe
+  quedar cerca de 0.5: los umbrales de las columnas numéricas sin agrupar se
+  ajustan solo con las filas de entrenamiento de cada pliegue.
+  """
+  accuracies = []
+  for seed in range(30):
+    rng = np.random.default_rng(seed)
+    columns = [
+      Column("X", rng.normal(0, 1, 60).round(3).tolist(), ColumnType.NUMERIC),
+      Column("Y", rng.integers(0, 2, 60).tolist(), ColumnType.BINARY),
+    ]
+    table = Table(columns)
+    table.set_clase(1, total_amount_instances=60)
+    accuracies.append(cross_validate(table, k=5, seed=seed, max_depth=1, workers=1)["accuracy"])
+  assert abs(np.mean(accuracies) - 0.5) < 0.04
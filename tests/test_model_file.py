@@ -0,0 +1,76 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Agrega el directorio principal al path de Python
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.Column import Column, ColumnType
+from models.Table import Table
+from models.DecisionTree import DecisionTree
+from helpers.model_file import ARRAYS, save_model, load_model
+
+def build_tenis():
+  """
+  Construir y compilar el árbol del ejemplo "tenis".
+
+  Retorna:
+  tuple: Tupla con las columnas y el árbol compilado.
+  """
+  columns = [
+    Column("Temperatura", ["> 32", "> 32", "> 32", "25 - 32", "< 25", "< 25", "< 25", "25 - 32", "< 25", "25 - 32", "25 - 32", "25 - 32", "> 32", "25 - 32"], ColumnType.NUMERIC),
+    Column("Humedad", [3, 3, 3, 3, 2, 2, 2, 3, 2, 2, 2, 3, 2, 3], ColumnType.NOMINAL),
+    Column("Viento", [1, 3, 1, 1, 1, 3, 3, 1, 1, 1, 3, 3, 1, 3], ColumnType.NOMINAL),
+    Column("Jugar", [0, 0, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 0], ColumnType.BINARY)
+  ]
+  table = Table(columns)
+  table.set_clase(3, total_amount_instances=14)
+  tree = DecisionTree(table)
+  tree.fit()
+  return columns, tree.compile()
+
+def flip_last_byte(path):
+  """
+  Cambiar el último byte de un archivo, que pertenece al último arreglo del modelo.
+
+  Parámetros:
+  path (str): Ruta del archivo.
+  """
+  with open(path, "r+b") as file:
+    file.seek(-1, os.SEEK_END)
+    last = file.read(1)
+    file.seek(-1, os.SEEK_END)
+    file.write(bytes([last[0] ^ 0xFF]))
+
+def test_round_trip_keeps_arrays_and_predictions(tmp_path):
+  columns, compiled = build_tenis()
+  path = str(tmp_path / "tenis.mtsr")
+  save_model(path, compiled)
+  loaded = load_model(path)
+
+  for name in ARRAYS:
+    assert np.array_equal(getattr(compiled, name), getattr(loaded, name), equal_nan=True), name
+  assert loaded.inputs == compiled.inputs
+  assert loaded.categories == compiled.categories
+  assert loaded.class_values == compiled.class_values
+  encoded = compiled.encode_columns(columns)
+  assert np.array_equal(compiled.predict_codes(encoded), loaded.predict_codes(encoded))
+  data = {column.name: column.instances for column in columns[:3]}
+  assert np.array_equal(compiled.predict(data), loaded.predict(data))
+
+def test_corrupted_array_is_rejected(tmp_path):
+  _, compiled = build_tenis()
+  path = str(tmp_path / "tenis.mtsr")
+  save_model(path, compiled)
+  flip_last_byte(path)
+  with pytest.raises(ValueError):
+    load_model(path)
+
+def test_truncated_file_is_rejected(tmp_path):
+  _, compiled = build_tenis()
+  path = str(tmp_path / "tenis.mtsr")
+  save_model(path, compiled)
+  with open(path, "r+b") as file:
+    file.truncate(os.path.getsize(path) - 1)
+  with pytest.raises(ValueError):
+    load_model(path)
@@ -0,0 +1,68 @@
+import sys
+import os
+import csv
+import pytest
+from openpyxl import Workbook
+
+# Agrega el directorio principal al path de Python
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.Column import Column, ColumnType
+from models.Table import Table
+from models.DecisionTree import DecisionTree
+from helpers.scoring import score_file
+
+HEADER = ["Humedad", "Viento"]
+ROWS = [(3, 1), (2, 3), (None, None), (2, 1), (3, 3)]  # La tercera fila está vacía
+
+def build_model():
+  """
+  Construir y compilar un árbol pequeño con las columnas Humedad y Viento.
+
+  Retorna:
+  CompiledTree: Árbol compilado.
+  """
+  columns = [
+    Column("Humedad", [3, 3, 3, 3, 2, 2, 2, 3, 2, 2, 2, 3, 2, 3], ColumnType.NOMINAL),
+    Column("Viento", [1, 3, 1, 1, 1, 3, 3, 1, 1, 1, 3, 3, 1, 3], ColumnType.NOMINAL),
+    Column("Jugar", [0, 0, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 0], ColumnType.BINARY)
+  ]
+  table = Table(columns)
+  table.set_clase(2, total_amount_instances=14)
+  tree = DecisionTree(table)
+  tree.fit()
+  return tree.compile()
+
+def write_input(path):
+  """
+  Escribir el archivo de entrada con una fila vacía en medio.
+
+  Parámetros:
+  path (str): Ruta del archivo (.xlsx o .csv).
+  """
+  if path.endswith(".xlsx"):
+    workbook = Workbook()
+    workbook.active.append(HEADER)
+    for row in ROWS:
+      workbook.active.append(row)
+    workbook.save(path)
+  else:
+    with open(path, "w", newline="") as file:
+      file.write(",".join(HEADER) + "\n")
+      for row in ROWS:
+        # La fila vacía queda como una línea en blanco
+        file.write(",".join("" if value is None else str(value) for value in row).strip(",") + "\n")
+
+@pytest.mark.parametrize("extension", [".xlsx", ".csv"])
+def test_blank_row_keeps_output_aligned(tmp_path, extension):
+  model = build_model()
+  input_path = str(tmp_path / f"entrada{extension}")
+  output_path = str(tmp_path / "salida.csv")
+  write_input(input_path)
+
+  written = score_file(model, input_path, output_path, chunk_rows=2, include_inputs=False)
+
+  with open(output_path, newline="") as file:
+    output = list(csv.reader(file))[1:]
+  expected = model.predict({"Humedad": [3, 2, 2, 3], "Viento": [1, 3, 1, 3]}).tolist()
+  assert written == len(ROWS)
+  assert [row[0] for row in output] == [str(value) for value in expected[:2]] + [""] + [str(value) for value in expected[2:]]
@@ -0,0 +1,46 @@
+import sys
+import os
+
+# Agrega el directorio principal al path de Python
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.Column import Column, ColumnType
+from models.Table import Table
+from models.DecisionTree import DecisionTree
+
+def build_independent_table(levels: int = 3):
+  """
+  Construir una tabla cuyo atributo no aporta información sobre la clase: cada
+  valor tiene 24 filas con la misma proporción de clases (3 a 1). Con la
+  fórmula cerrada la ganancia sale como ±1e-16 si no se corrige el ruido de
+  redondeo (-1.1e-16 con 3 valores, +6.7e-16 con 2).
+
+  Parámetros:
+  levels (int, opcional): Cantidad de valores distintos del atributo.
+
+  Retorna:
+  Table: Tabla con la clase establecida.
+  """
+  columns = [
+    Column("Tienda", [value for value in range(1, levels + 1) for _ in range(24)], ColumnType.NOMINAL),
+    Column("Compra", [1, 0, 1, 1] * 6 * levels, ColumnType.BINARY),
+  ]
+  table = Table(columns)
+  table.set_clase(1, total_amount_instances=24 * levels)
+  return table
+
+def test_zero_gain_matches_baseline_output():
+  """
+  La ganancia nula se debe mostrar igual que en la implementación original.
+  """
+  expected = {"Entropía general": "0.8113", "Suma de particiones": "0.8113", "Ganancia": "0.0000"}
+  table = build_independent_table()
+  assert table.get_all_calculations() == [expected]
+  assert table.calculate_return(0) == expected
+  assert table.calculate_all_gains()["gains"][0] == 0.0
+
+def test_zero_gain_does_not_split():
+  """
+  Un atributo sin información no debe dividir el nodo raíz por ruido de redondeo.
+  """
+  tree = DecisionTree(build_independent_table(levels=2))
+  assert tree.fit().is_leaf()
@@ -7,7 +7,6 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from models.Column import Column, ColumnType
 from models.Table import Table
-from views.table_view import TableView
 
 class AddWindow(QMainWindow):
   """
@@ -257,6 +256,8 @@ class AddWindow(QMainWindow):
       self.show_error_message("Debe haber al menos un ítem de tipo Binario.")
       return
     
+    from views.table_view import TableView  # Se carga hasta que se necesita la tabla
+
     table = Table(columns)
     self.table_view = TableView(table)
     self.table_view.show()
@@ -1,76 +1,9 @@
-import re
-import pandas as pd
-from PyQt5.QtWidgets import QFileDialog, QMessageBox
-from PyQt5.QtGui import QIcon
-from models.Column import Column, ColumnType
-
-def infer_column_type(values):
-  """
-  Inferir el tipo de columna a partir de los valores.
-
-  Parámetros:
-  values (list): Lista de valores de la columna.
-
-  Retorna:
-  ColumnType: Tipo de la columna inferido.
-
-  Excepciones:
-  ValueError: Si no se puede inferir el tipo de columna.
-  """
-  if all(isinstance(val, int) and val in {0, 1} for val in values):
-    return ColumnType.BINARY
-  elif all(isinstance(val, int) for val in values):
-    return ColumnType.NOMINAL
-  elif all(isinstance(val, str) and re.match(r'(?:<\s*\d+|\d+(\.\d+)?\s*-\s*\d+(\.\d+)?|>\s*\d+(\.\d+)?)', val) for val in values):
-    return ColumnType.NUMERIC
-  else:
-    raise ValueError("Cannot infer column type")
-
-def import_data(file_path):
-  """
-  Importar datos desde un archivo Excel.
-
-  Parámetros:
-  file_path (str): Ruta del archivo Excel.
-
-  Retorna:
-  list: Lista de objetos Column.
-  """
-  data = pd.read_excel(file_path)
-
-  columns = []
-  for col_name in data.columns:
-    col_values = data[col_name].tolist()
-    col_type = infer_column_type(col_values)
-    x1 = min(col_values) if col_type == ColumnType.NUMERIC else None
-    x2 = max(col_values) if col_type == ColumnType.NUMERIC else None
-    columns.append(Column(name=col_name, instances=col_values, type=col_type, x1=x1, x2=x2))
-
-  return columns
-
-def open_import_data(parent):
-  """
-  Abrir el cuadro de diálogo para importar datos y procesar el archivo seleccionado.
-
-  Parámetros:
-  parent (QWidget): Widget padre para el cuadro de diálogo.
-
-  Retorna:
-  list: Lista de objetos Column o None si ocurre un error.
-  """
-  file_path, _ = QFileDialog.getOpenFileName(parent, "Importar Datos", "", "Excel Files (*.xlsx *.xls)", "Excel Files (*.xlsx *.xls)")
-  if file_path:
-    try:
-      columns = import_data(file_path)
-      return columns
-    except Exception as e:
-      QMessageBox.critical(parent, "Error", f"Error al importar datos: {str(e)}")
-  return None
-
 import sys
 from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QHeaderView, QScrollArea
+from PyQt5.QtGui import QIcon
 from PyQt5.QtCore import Qt
 from models.Column import ColumnType
+from helpers.instrumentation import span, count
 
 class ResultsWindow(QMainWindow):
   """
@@ -78,7 +11,7 @@ class ResultsWindow(QMainWindow):
   Esta clase muestra los resultados del análisis en una tabla y otros elementos visuales.
   """
   
-  def __init__(self, column_names, table_data, general_entropy, gains, column_types):
+  def __init__(self, column_names, table_data, general_entropy, gains, column_types, tree_text=None):
     super().__init__()
     self.setWindowTitle("Resultados")
     self.setGeometry(100, 100, 600, 600)
@@ -101,7 +34,7 @@ class ResultsWindow(QMainWindow):
     scroll_layout.setContentsMargins(20, 20, 20, 20)
     scroll_layout.setSpacing(20)
 
-    self.create_results_view(scroll_layout, column_names, table_data, general_entropy, gains, column_types)
+    self.create_results_view(scroll_layout, column_names, table_data, general_entropy, gains, column_types, tree_text)
 
     scroll_area.setWidget(scroll_content)
     self.layout.addWidget(scroll_area)
@@ -129,7 +62,7 @@ class ResultsWindow(QMainWindow):
       }
     """)
 
-  def create_results_view(self, layout, column_names, table_data, general_entropy, gains, column_types):
+  def create_results_view(self, layout, column_names, table_data, general_entropy, gains, column_types, tree_text=None):
     """
     Crear la vista de resultados.
 
@@ -140,6 +73,7 @@ class ResultsWindow(QMainWindow):
     general_entropy (str): Entropía general calculada.
     gains (dict): Diccionario con las ganancias de cada columna.
     column_types (list): Lista de tipos de las columnas.
+    tree_text (str, opcional): Árbol de decisión en texto. Si no se especifica, no se muestra.
     """
     table_title_label = QLabel("Valores de tabla")
     table_title_label.setStyleSheet("font-size: 18px; color: #3f51b5;")
@@ -174,10 +108,34 @@ class ResultsWindow(QMainWindow):
       node_label.setStyleSheet("font-size: 16px; color: #000000;")
       layout.addWidget(node_label)
 
+    if tree_text:
+      tree_title_label = QLabel("Árbol de decisión")
+      tree_title_label.setStyleSheet("font-size: 18px; color: #3f51b5;")
+      layout.addWidget(tree_title_label)
+
+      tree_label = QLabel(tree_text)
+      tree_label.setStyleSheet("font-size: 14px; color: #000000; font-family: monospace;")
+      tree_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+      layout.addWidget(tree_label)
+
   def create_table(self, layout, column_names, table_data, column_types):
     """
     Crear una tabla para mostrar los datos.
 
+    Parámetros:
+    layout (QVBoxLayout): Layout donde se agrega la tabla.
+    column_names (list): Lista de nombres de las columnas.
+    table_data (list): Datos de la tabla.
+    column_types (list): Lista de tipos de las columnas.
+    """
+    with span("results_table"):
+      self.fill_table(layout, column_names, table_data, column_types)
+    count("widgets_created", len(table_data) * len(column_names))
+
+  def fill_table(self, layout, column_names, table_data, column_types):
+    """
+    Crear el QTableWidget con un elemento por celda y agregarlo al layout.
+
     Parámetros:
     layout (QVBoxLayout): Layout donde se agrega la tabla.
     column_names (list): Lista de nombres de las columnas.
@@ -0,0 +1,117 @@
+from PyQt5.QtWidgets import QStyledItemDelegate, QComboBox
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant
+from PyQt5.QtGui import QCursor
+from models.Column import ColumnType
+
+class ColumnTableModel(QAbstractTableModel):
+  """
+  Modelo de Qt que lee las celdas directamente de los códigos de las columnas
+  de una tabla. Solo se consultan las celdas visibles, así que el costo de
+  mostrar la tabla no depende de la cantidad de filas.
+  """
+
+  def __init__(self, tabla, parent=None):
+    """
+    Constructor de la clase ColumnTableModel.
+
+    Parámetros:
+    tabla (Table): Tabla con las columnas a mostrar.
+    parent (QObject, opcional): Objeto padre.
+    """
+    super().__init__(parent)
+    self.tabla = tabla
+
+  def rowCount(self, parent=QModelIndex()):
+    if parent.isValid() or not self.tabla.columns:
+      return 0
+    return self.tabla.total_instances()
+
+  def columnCount(self, parent=QModelIndex()):
+    return 0 if parent.isValid() else len(self.tabla.columns)
+
+  def data(self, index, role=Qt.DisplayRole):
+    if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+      return QVariant()
+    column = self.tabla.columns[index.column()]
+    return str(column.categories[column.codes[index.row()]])
+
+  def headerData(self, section, orientation, role=Qt.DisplayRole):
+    if role != Qt.DisplayRole:
+      return QVariant()
+    if orientation == Qt.Horizontal:
+      return self.tabla.columns[section].name
+    return str(section + 1)
+
+  def flags(self, index):
+    if not index.isValid():
+      return Qt.NoItemFlags
+    return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+  def setData(self, index, value, role=Qt.EditRole):
+    """
+    Cambiar el valor de una celda en la tabla.
+
+    Parámetros:
+    index (QModelIndex): Celda a cambiar.
+    value (str): Nuevo valor como texto.
+    role (int, opcional): Rol de Qt; solo se acepta Qt.EditRole.
+
+    Retorna:
+    bool: True si se cambió el valor.
+    """
+    if not index.isValid() or role != Qt.EditRole:
+      return False
+    column = self.tabla.columns[index.column()]
+    new_value = value if column.type == ColumnType.NUMERIC else int(value)
+    if self.data(index) == str(new_value):
+      return False
+    self.tabla.set_value(index.row(), index.column(), new_value)
+    self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+    return True
+
+  def refresh(self):
+    """
+    Volver a leer toda la tabla, por ejemplo después de cambiar varias columnas a la vez.
+    """
+    self.beginResetModel()
+    self.endResetModel()
+
+class ComboBoxDelegate(QStyledItemDelegate):
+  """
+  Delegado que abre un combobox con los valores posibles solo para la celda que se está editando.
+  """
+
+  def __init__(self, tabla, parent=None):
+    """
+    Constructor de la clase ComboBoxDelegate.
+
+    Parámetros:
+    tabla (Table): Tabla con las columnas que se editan.
+    parent (QObject, opcional): Objeto padre.
+    """
+    super().__init__(parent)
+    self.tabla = tabla
+
+  def createEditor(self, parent, option, index):
+    combobox = QComboBox(parent)
+    combobox.setCursor(QCursor(Qt.PointingHandCursor))  # Cambia el cursor a puntero
+    combobox.addItems([str(value) for value in self.tabla.columns[index.column()].get_domain()])
+    # Aplicar el valor en cuanto se elige una opción
+    combobox.activated.connect(lambda _, editor=combobox: self.commit_and_close(editor))
+    return combobox
+
+  def setEditorData(self, editor, index):
+    editor.setCurrentText(index.data(Qt.EditRole))
+
+  def setModelData(self, editor, model, index):
+    model.setData(index, editor.currentText(), Qt.EditRole)
+
+  def commit_and_close(self, editor):
+    """
+    Guardar el valor elegido y cerrar el editor.
+
+    Parámetros:
+    editor (QComboBox): Combobox de la celda.
+    """
+    self.commitData.emit(editor)
+    self.closeEditor.emit(editor)
@@ -1,10 +1,10 @@
 import sys
 import os
-import random
+import numpy as np
 from PyQt5.QtWidgets import (
-  QMainWindow, QWidget, QVBoxLayout, QLabel, QTableWidget, QHeaderView,
-  QComboBox, QPushButton, QHBoxLayout, QFileDialog, QMessageBox, QGridLayout,
-  QSplitter, QFrame, QSizePolicy
+  QMainWindow, QWidget, QVBoxLayout, QLabel, QTableView, QHeaderView,
+  QComboBox, QPushButton, QHBoxLayout, QMessageBox,
+  QSplitter, QFrame, QSizePolicy, QAbstractItemView
 )
 from PyQt5.QtGui import QColor, QPalette, QCursor, QIcon
 from PyQt5.QtCore import Qt
@@ -14,8 +14,11 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from models.Column import Column, ColumnType
 from models.Table import Table
-from helpers.import_excel import import_data
+from models.DecisionTree import DecisionTree
+from helpers.import_excel import choose_import_file, import_table
+from helpers.background import run_in_background
 from views.results_window import ResultsWindow
+from views.table_model import ColumnTableModel, ComboBoxDelegate
 
 class TableView(QMainWindow):
   """
@@ -45,6 +48,7 @@ class TableView(QMainWindow):
     self.layout.addWidget(self.splitter)
 
     self.create_controls()
+    self.update_class()  # Antes de crear la tabla, por si cambian los umbrales numéricos
     self.create_table()
 
   def create_controls(self):
@@ -70,6 +74,12 @@ class TableView(QMainWindow):
     class_layout.addWidget(self.class_combobox)
     class_container.setLayout(class_layout)
 
+    # Nodo raíz calculado con los conteos vigentes de la tabla
+    self.root_label = QLabel("")
+    self.root_label.setWordWrap(True)
+    class_layout.addWidget(self.root_label)
+    self.class_combobox.currentIndexChanged.connect(self.update_class)
+
     control_layout.addWidget(class_container, alignment=Qt.AlignTop)
 
     generate_button = QPushButton("GENERAR INSTANCIAS AL AZAR")
@@ -128,7 +138,7 @@ class TableView(QMainWindow):
       QWidget#table_container {
         padding: 20px;
       }
-      QTableWidget {
+      QTableView {
         border: none;
         gridline-color: #dcdcdc;
         font-size: 14px;
@@ -140,7 +150,7 @@ class TableView(QMainWindow):
         padding: 5px;
         border: none;
       }
-      QTableWidget QTableCornerButton::section {
+      QTableView QTableCornerButton::section {
         background-color: #145c96;
         border: none;
       }
@@ -176,34 +186,14 @@ class TableView(QMainWindow):
       self.table_frame.deleteLater()
       self.table_frame = None
 
-    self.table = QTableWidget()
-    self.table.setRowCount(len(self.tabla.columns[0].instances))
-    self.table.setColumnCount(len(self.tabla.columns))
-    self.table.setHorizontalHeaderLabels([col.name for col in self.tabla.columns])
-
-    for col_index, col in enumerate(self.tabla.columns):
-      for row_index, instance in enumerate(col.instances):
-        combobox = QComboBox()
-        combobox.setCursor(QCursor(Qt.PointingHandCursor))  # Cambia el cursor a puntero
-        if col.type == ColumnType.BINARY:
-          combobox.addItems(["0", "1"])
-        elif col.type == ColumnType.NOMINAL:
-          combobox.addItems(["1", "2", "3"])
-        elif col.type == ColumnType.NUMERIC:
-          x1_display = f"{col.x1:.1f}" if isinstance(col.x1, float) else str(col.x1)
-          x2_display = f"{col.x2:.1f}" if isinstance(col.x2, float) else str(col.x2)
-          combobox.addItems([f"< {x1_display}", f"{x1_display} - {x2_display}", f"> {x2_display}"])
-          # Determina el índice correcto según el valor de la instancia
-          if instance.startswith("<"):
-            index = 0
-          elif instance.startswith(">"):
-            index = 2
-          else:
-            index = 1
-          combobox.setCurrentIndex(index)
-        combobox.setCurrentText(str(instance))
-        combobox.currentIndexChanged.connect(lambda index, row=row_index, col=col_index: self.update_table_data(row, col))
-        self.table.setCellWidget(row_index, col_index, combobox)
+    # Las celdas se leen de las columnas y solo la celda editada abre un combobox
+    self.table_model = ColumnTableModel(self.tabla, self)
+    self.table_model.dataChanged.connect(self.update_root_label)
+    self.table = QTableView()
+    self.table.setModel(self.table_model)
+    self.table.setItemDelegate(ComboBoxDelegate(self.tabla, self.table))
+    self.table.setEditTriggers(QAbstractItemView.CurrentChanged | QAbstractItemView.SelectedClicked | QAbstractItemView.DoubleClicked)
+    self.table.setCursor(QCursor(Qt.PointingHandCursor))  # Cambia el cursor a puntero
 
     header = self.table.horizontalHeader()
     header.setSectionResizeMode(QHeaderView.Stretch)
@@ -220,94 +210,145 @@ class TableView(QMainWindow):
     self.table_frame.layout().setAlignment(Qt.AlignCenter)
     self.splitter.addWidget(self.table_frame)
 
-  def update_table_data(self, row, col):
+  def update_class(self):
     """
-    Actualizar los datos de la tabla cuando cambia un valor en el combobox.
-
-    Parámetros:
-    row (int): Índice de la fila.
-    col (int): Índice de la columna.
+    Establecer en la tabla la clase elegida en el combobox y actualizar el nodo raíz.
+    Si la tabla ya tiene esa clase (por ejemplo, porque la preparó import_table),
+    no se vuelven a ajustar los umbrales.
     """
-    combobox = self.table.cellWidget(row, col)
-    new_value = combobox.currentText()
-    if self.tabla.columns[col].type == ColumnType.NUMERIC:
-      self.tabla.columns[col].instances[row] = new_value
-    else:
-      self.tabla.columns[col].instances[row] = int(new_value)
+    class_column_name = self.class_combobox.currentText()
+    class_index = next((i for i, col in enumerate(self.tabla.columns) if col.name == class_column_name), None)
+    if class_index is None or self.tabla.total_instances() == 0:
+      self.root_label.setText("")
+      return
+    if getattr(self.tabla, "clase", None) != class_index:
+      self.tabla.set_clase(class_index, total_amount_instances=self.tabla.total_instances())
+      if hasattr(self, "table_model"):
+        self.table_model.refresh()  # Los umbrales numéricos pudieron cambiar con la clase
+    self.update_root_label()
+
+  def update_root_label(self):
+    """
+    Mostrar el nodo raíz y su ganancia a partir de los conteos vigentes de la tabla.
+    """
+    if getattr(self.tabla, "clase", None) is None or len(self.tabla.columns) < 2:
+      return
+    calculations = self.tabla.calculate_all_gains()
+    best = int(calculations["gains"].argmax())
+    name = self.tabla.columns[calculations["indices"][best]].name
+    self.root_label.setText(f"Nodo raíz: {name} ({calculations['gains'][best]:.4f})")
 
   def clear_table(self):
     """
-    Limpiar los datos de la tabla, restableciendo los comboboxes a su valor inicial.
+    Limpiar los datos de la tabla, restableciendo cada celda al primer valor posible.
     """
-    for col_index in range(self.table.columnCount()):
-      for row_index in range(self.table.rowCount()):
-        combobox = self.table.cellWidget(row_index, col_index)
-        if combobox:
-          combobox.setCurrentIndex(0)
+    for col in self.tabla.columns:
+      col.set_domain_positions(np.zeros(len(col.codes), dtype=np.intp))
+    self.table_model.refresh()
+    self.update_root_label()
 
   def generate_random_instances(self):
     """
     Generar instancias aleatorias para cada celda en la tabla.
     """
-    for col_index in range(self.table.columnCount()):
-      for row_index in range(self.table.rowCount()):
-        combobox = self.table.cellWidget(row_index, col_index)
-        if combobox:
-          random_index = random.randint(0, combobox.count() - 1)
-          combobox.setCurrentIndex(random_index)
+    self.tabla.generate_random_instances()
+    self.table_model.refresh()
+    self.update_root_label()
 
   def import_data(self):
     """
-    Importar datos desde un archivo y actualizar la tabla con los nuevos datos.
+    Importar datos desde un archivo en segundo plano y actualizar la tabla con los nuevos datos.
     """
-    file_path, _ = QFileDialog.getOpenFileName(self, "Importar Datos", "", "Excel Files (*.xlsx *.xls);;CSV Files (*.csv)")
+    file_path = choose_import_file(self)
     if file_path:
-      try:
-        columns = import_data(file_path)
-        self.tabla.columns = columns
-        self.create_table()  # Recrear la tabla con los nuevos datos
+      run_in_background(self, "Importando datos...", import_table, file_path, on_finished=self.load_table, on_failed=lambda message: QMessageBox.critical(self, "Error", f"Error al importar datos: {message}"))
+
+  def load_table(self, tabla):
+    """
+    Reemplazar la tabla por la importada. La clase, los umbrales y los conteos
+    vigentes ya vienen calculados por import_table, así que solo se cambian los
+    controles y el modelo.
+
+    Parámetros:
+    tabla (Table): Tabla preparada por import_table.
+    """
+    try:
+      binary_columns = [col.name for col in tabla.columns if col.type == ColumnType.BINARY]
+      if not binary_columns:
+        raise ValueError("No hay columnas binarias disponibles para seleccionar como clase.")
+      self.tabla = tabla
 
-        # Actualizar el ComboBox de clases
-        binary_columns = [col.name for col in self.tabla.columns if col.type == ColumnType.BINARY]
-        self.class_combobox.clear()
+      # Actualizar el ComboBox de clases
+      self.class_combobox.blockSignals(True)
+      self.class_combobox.clear()
+      self.class_combobox.addItems(binary_columns)
+      self.class_combobox.blockSignals(False)
 
-        if binary_columns:
-          self.class_combobox.addItems(binary_columns)
-        else:
-          raise ValueError("No hay columnas binarias disponibles para seleccionar como clase.")
+      self.update_class()  # Solo muestra el nodo raíz: la clase ya está establecida
+      self.create_table()  # Recrear la tabla con los nuevos datos
 
-      except Exception as e:
-        QMessageBox.critical(self, "Error", f"Error al importar datos: {str(e)}")
+    except Exception as e:
+      QMessageBox.critical(self, "Error", f"Error al importar datos: {str(e)}")
 
   def get_results(self):
     """
-    Obtener los resultados del análisis y mostrar la ventana de resultados.
+    Obtener los resultados del análisis en segundo plano y mostrar la ventana de
+    resultados. La tarea trabaja sobre una copia de la tabla (con sus conteos
+    vigentes), para que la tabla se pueda seguir editando sin que ambos hilos la
+    lean a la vez.
     """
-    try:
-      # Actualizar todos los datos en la tabla antes de calcular los resultados
-      for row in range(self.table.rowCount()):
-        for col in range(self.table.columnCount()):
-          self.update_table_data(row, col)
-
-      class_column_name = self.class_combobox.currentText()
-      class_index = next(i for i, col in enumerate(self.tabla.columns) if col.name == class_column_name)
-      self.tabla.set_clase(class_index, total_amount_instances=self.table.rowCount())
-      results = self.tabla.get_all_calculations()
-
-      table_data = [
-        [self.table.cellWidget(row, col).currentText() for col in range(self.table.columnCount())]
-        for row in range(self.table.rowCount())
-      ]
-
-      column_types = [col.type for col in self.tabla.columns]
-      column_names = [col.name for col in self.tabla.columns]
-      gains = {col.name: result["Ganancia"] for col, result in zip(self.tabla.columns, results)}
-      general_entropy = results[0]["Entropía general"] if results else "0.0000"
-
-      self.results_window = ResultsWindow(column_names, table_data, general_entropy, gains, column_types)
-      self.results_window.show()
-    except Exception as e:
-      QMessageBox.critical(self, "Error", f"Error al calcular resultados: {str(e)}")
+    class_column_name = self.class_combobox.currentText()
+    class_index = next((i for i, col in enumerate(self.tabla.columns) if col.name == class_column_name), None)
+    if class_index is None:
+      QMessageBox.critical(self, "Error", "Error al calcular resultados: no hay una clase seleccionada.")
+      return
+    if getattr(self.tabla, "clase", None) != class_index:
+      self.update_class()
+    run_in_background(self, "Calculando resultados...", calculate_results, self.tabla.snapshot(), on_finished=self.show_results, on_failed=lambda message: QMessageBox.critical(self, "Error", f"Error al calcular resultados: {message}"))
+
+  def show_results(self, results):
+    """
+    Mostrar la ventana de resultados con lo calculado por calculate_results.
+
+    Parámetros:
+    results (dict): Resultados del análisis.
+    """
+    self.results_window = ResultsWindow(results["column_names"], results["table_data"], results["general_entropy"], results["gains"], results["column_types"], results["tree_text"])
+    self.results_window.show()
+
+def calculate_results(tabla, progress=None):
+  """
+  Calcular las ganancias y el árbol de decisión de una tabla y reunir los
+  resultados. Se ejecuta fuera del hilo de la interfaz, así que no crea widgets:
+  recibe una copia (Table.snapshot) con la clase ya establecida.
+
+  Parámetros:
+  tabla (Table): Copia de la tabla a analizar, con la clase establecida.
+  progress (callable, opcional): Función que recibe el avance de cada etapa; si
+    lanza una excepción (por ejemplo, al cancelar), el cálculo se detiene.
+
+  Retorna:
+  dict: Nombres y tipos de las columnas, valores de las celdas, entropía general,
+  ganancia de cada atributo y árbol en texto.
+  """
+  class_index = tabla.clase
+  results = tabla.format_calculations(tabla.calculate_all_gains(progress=progress))
+  tree = DecisionTree(tabla)
+  tree.fit(progress=progress)
+
+  # Los valores se toman directamente de las columnas
+  table_data = [
+    list(row) for row in zip(*([str(instance) for instance in col.instances] for col in tabla.columns))
+  ]
+  attributes = [col for i, col in enumerate(tabla.columns) if i != class_index]
+  return {
+    "column_names": [col.name for col in tabla.columns],
+    "column_types": [col.type for col in tabla.columns],
+    "table_data": table_data,
+    "general_entropy": results[0]["Entropía general"] if results else "0.0000",
+    "gains": {col.name: result["Ganancia"] for col, result in zip(attributes, results)},
+    "tree_text": tree.to_text(),
+  }
 
 if __name__ == "__main__":
   from PyQt5.QtWidgets import QApplication